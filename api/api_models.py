@@ -42,6 +42,9 @@ class AssetPageResponse(BaseModel):
     - An out-of-range ``page`` returns an empty ``items`` list, not an error.
     - Results are deterministically ordered by ``asset.id ASC`` to ensure
         stable pagination across requests.
+    - ``next_cursor`` is set while ``hasMore`` is true. Passing it back as
+        ``cursor`` resumes after the last returned asset without offset slicing;
+        ``page`` is then ignored and echoed unchanged.
     """
 
     model_config = ConfigDict(populate_by_name=True)
@@ -51,6 +54,7 @@ class AssetPageResponse(BaseModel):
     page: int = Field(ge=1)
     per_page: int = Field(ge=1, le=1000)
     has_more: bool = Field(..., alias="hasMore")
+    next_cursor: str | None = None
 
 
 class RelationshipResponse(BaseModel):
@@ -66,6 +70,56 @@ class RelationshipResponse(BaseModel):
     scope_refs: list[str] | None = None
 
 
+class RelationshipPageResponse(BaseModel):
+    """Response model for cursor-paginated relationship data.
+
+    Pagination contract:
+    - ``limit`` defaults to 100; maximum accepted value is 1,000.
+    - Items are ordered by ``(source_id, target_id, relationship_type)`` ascending.
+    - ``next_cursor`` is opaque; pass it back as ``cursor`` to fetch the following
+        page. It is ``None`` on the last page.
+    - A cursor names the last returned edge rather than a position, so it stays
+        valid when the graph changes between requests.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    items: list[RelationshipResponse]
+    limit: int = Field(ge=1, le=1000)
+    next_cursor: str | None = None
+    has_more: bool = Field(..., alias="hasMore")
+
+
+class WeightedPathResponse(BaseModel):
+    """Response model for one weighted relationship path."""
+
+    asset_ids: list[str]
+    relationship_types: list[str]
+    cost: float
+    exposure: float
+
+
+class PathQueryResponse(BaseModel):
+    """Response model for shortest-path and exposure-path queries.
+
+    ``cost`` sums ``-log(strength)`` over the hops, so ``exposure`` (``exp(-cost)``) is the
+    product of the hop strengths. ``truncated`` is true when the node-expansion cap or the
+    latency budget stopped the search early.
+    """
+
+    paths: list[WeightedPathResponse]
+    expanded: int = Field(ge=0)
+    truncated: bool
+
+
+class GraphClusterResponse(BaseModel):
+    """Response model for one connected component or community."""
+
+    id: int
+    size: int
+    asset_ids: list[str]
+
+
 class MetricsResponse(BaseModel):
     """Response model for graph-owned public network metrics."""
 
@@ -75,6 +129,9 @@ class MetricsResponse(BaseModel):
     avg_degree: float
     max_degree: int
     network_density: float
+    top_relationships: list[RelationshipResponse] | None = None
+    components: list[GraphClusterResponse] | None = None
+    communities: list[GraphClusterResponse] | None = None
 
 
 class VisualizationNode(BaseModel):
@@ -20,7 +20,7 @@ from slowapi import _rate_limit_exceeded_handler  # type: ignore[import-not-foun
 from slowapi.errors import RateLimitExceeded  # type: ignore[import-not-found]
 from sqlalchemy.exc import SQLAlchemyError
 
-from src.data.database import SchemaCompatibilityError
+from src.data.database import SchemaCompatibilityError, dispose_shared_engines
 from src.observability.context import async_trace_context, get_span_id, get_trace_id
 from src.observability.events import ObservabilityEvent
 from src.observability.logger import log_event
@@ -48,6 +48,7 @@ from .routers.graph_admin import init_rebuild_executor
 from .routers.graph_admin import router as graph_admin_router
 from .routers.graph_admin import shutdown_rebuild_executor_sync as shutdown_rebuild_executor
 from .routers.metrics import router as metrics_router
+from .routers.paths import router as paths_router
 from .routers.relationships import router as relationships_router
 from .routers.system import router as system_router
 from .routers.visualization import router as visualization_router
@@ -543,6 +544,8 @@ async def _perform_orderly_shutdown(
 
     if has_persistence:
         shutdown_rebuild_executor()
+    # Background loops and rebuilds have stopped, so no session can still be using a pooled engine.
+    dispose_shared_engines()
 
     log_event(
         logger,
@@ -691,6 +694,7 @@ def create_app() -> FastAPI:
     app.include_router(relationships_router)
     app.include_router(visualization_router)
     app.include_router(metrics_router)
+    app.include_router(paths_router)
 
     return app
 
@@ -20,6 +20,7 @@ from src.observability.events import ObservabilityEvent
 from src.observability.logger import log_event
 
 from . import graph_lifecycle_providers
+from .services.response_cache import invalidate_graph_response_cache
 
 UTC = timezone.utc
 
@@ -302,6 +303,7 @@ def set_graph(graph_instance: AssetRelationshipGraph) -> None:
         graph_state.startup_metadata = None
         graph_state.last_synced_job_id = None
         _transition_lifecycle_state(GraphRuntimeLifecycleState.READY)
+    invalidate_graph_response_cache()
 
 
 def synchronize_runtime_graph(
@@ -346,30 +348,81 @@ def synchronize_runtime_graph(
         api_main = sys.modules.get("api.main")
         if api_main is not None and hasattr(api_main, "graph"):
             setattr(api_main, "graph", graph_instance)
-        return True
+    invalidate_graph_response_cache()
+    if job_id:
+        _prime_publication_binding(job_id)
+    return True
+
+
+def warm_governed_snapshot(job_id: str) -> None:
+    """
+    Build the governed snapshot for ``job_id`` before its graph is published to readers.
+
+    Used by both the sync poller and the in-process rebuild. Failures are logged and
+    leave readers to build the snapshot on first use.
+    """
+    from .services.relationship_index import warm_governed_snapshot_for_rebuild_job
+
+    try:
+        warmed = warm_governed_snapshot_for_rebuild_job(job_id)
+    except Exception as exc:
+        # Readers fall back to building the snapshot on first use, failing closed as before.
+        log_event(
+            logger,
+            logging.WARNING,
+            ObservabilityEvent(
+                event="governed_snapshot_warm_failed",
+                message=f"Failed to warm governed snapshot before graph sync: {type(exc).__name__}",
+                metadata={"job_id": job_id, "error": type(exc).__name__},
+            ),
+        )
+        return
+    if not warmed:
+        log_event(
+            logger,
+            logging.INFO,
+            ObservabilityEvent(
+                event="governed_snapshot_warm_skipped",
+                message="Publication for synchronized rebuild is pending; governed snapshot not warmed",
+                metadata={"job_id": job_id},
+            ),
+        )
+
+
+def _prime_publication_binding(job_id: str) -> None:
+    """Resolve the synchronized job's publication binding now so hot reads skip the lookup."""
+    from .services.relationship_index import prime_publication_binding_for_rebuild_job
+
+    try:
+        prime_publication_binding_for_rebuild_job(job_id)
+    except Exception as exc:
+        # Reads retry the lookup and keep failing closed, so a failed warm-up is not fatal.
+        log_event(
+            logger,
+            logging.WARNING,
+            ObservabilityEvent(
+                event="publication_binding_prime_failed",
+                message=f"Failed to prime publication binding for synchronized graph: {type(exc).__name__}",
+                metadata={"job_id": job_id, "error": type(exc).__name__},
+            ),
+        )
 
 
 def _query_latest_successful_rebuild_job_id(
     settings: graph_lifecycle_providers.GraphLifecycleSettings,
 ) -> str | None:
     """Return the latest successful rebuild job id using durable persistence."""
-    from src.data.database import create_engine_from_url, create_session_factory
+    from src.data.database import get_shared_session_factory
     from src.data.repository import AssetGraphRepository, session_scope
 
     resolved_url = graph_lifecycle_providers.resolve_durable_graph_persistence_url(
         _settings_asset_graph_database_url(settings)
     )
-    engine = create_engine_from_url(resolved_url)
-    try:
-        session_factory = create_session_factory(engine)
-        with session_scope(session_factory) as session:
-            repo = AssetGraphRepository(session)
-            latest_job = repo.get_latest_successful_rebuild_job()
-            if latest_job is None:
-                return None
-            return latest_job.job_id
-    finally:
-        engine.dispose()
+    with session_scope(get_shared_session_factory(resolved_url)) as session:
+        latest_job = AssetGraphRepository(session).get_latest_successful_rebuild_job()
+        if latest_job is None:
+            return None
+        return latest_job.job_id
 
 
 def set_graph_factory(
@@ -382,6 +435,7 @@ def set_graph_factory(
         graph_state.startup_metadata = None
         graph_state.last_synced_job_id = None
         _shutdown_to_uninitialized()
+    invalidate_graph_response_cache()
 
 
 def reset_graph() -> None:
@@ -401,6 +455,7 @@ def reset_graph() -> None:
         graph_state.startup_metadata = None
         graph_state.last_synced_job_id = None
         _shutdown_to_uninitialized()
+    invalidate_graph_response_cache()
 
 
 def begin_rebuild() -> None:
@@ -704,7 +759,7 @@ def sync_with_latest_rebuild() -> None:
         return
 
     try:
-        from src.data.database import create_engine_from_url, create_session_factory
+        from src.data.database import get_shared_session_factory
         from src.data.repository import AssetGraphRepository, session_scope
 
         latest_job_id = _query_latest_successful_rebuild_job_id(settings)
@@ -734,25 +789,20 @@ def sync_with_latest_rebuild() -> None:
         resolved_url = graph_lifecycle_providers.resolve_durable_graph_persistence_url(
             _settings_asset_graph_database_url(settings)
         )
-        engine = create_engine_from_url(resolved_url)
-        try:
-            session_factory = create_session_factory(engine)
-            with session_scope(session_factory) as session:
-                repo = AssetGraphRepository(session)
-                new_graph = repo.load_graph()
-            from .metrics import update_graph_metrics
-
-            if synchronize_runtime_graph(
-                new_graph,
-                job_id=latest_job_id,
-                expected_last_synced_job_id=expected_last_synced_job_id,
-            ):
-                update_graph_metrics(
-                    len(new_graph.assets),
-                    sum(len(items) for items in new_graph.relationships.values()),
-                )
-        finally:
-            engine.dispose()
+        with session_scope(get_shared_session_factory(resolved_url)) as session:
+            new_graph = AssetGraphRepository(session).load_graph()
+        warm_governed_snapshot(latest_job_id)
+        from .metrics import update_graph_metrics
+
+        if synchronize_runtime_graph(
+            new_graph,
+            job_id=latest_job_id,
+            expected_last_synced_job_id=expected_last_synced_job_id,
+        ):
+            update_graph_metrics(
+                len(new_graph.assets),
+                sum(len(items) for items in new_graph.relationships.values()),
+            )
     except Exception as exc:
         log_event(
             logger,
@@ -154,6 +154,28 @@ SLO_COMPLIANCE_STATUS = Gauge(
     ["slo_name"],
 )
 
+# Governed relationship snapshot store metrics
+GOVERNED_SNAPSHOT_CACHE_REQUESTS_TOTAL = Counter(
+    "governed_snapshot_cache_requests_total",
+    "Total governed relationship snapshot lookups.",
+    ["result"],  # hit | miss
+)
+
+GOVERNED_SNAPSHOT_CACHE_EVICTIONS_TOTAL = Counter(
+    "governed_snapshot_cache_evictions_total",
+    "Total governed relationship snapshots evicted to stay within the byte budget.",
+)
+
+GOVERNED_SNAPSHOT_CACHE_BYTES = Gauge(
+    "governed_snapshot_cache_bytes",
+    "Estimated bytes held by cached governed relationship snapshots.",
+)
+
+GOVERNED_SNAPSHOT_CACHE_ENTRIES = Gauge(
+    "governed_snapshot_cache_entries",
+    "Number of cached governed relationship snapshots.",
+)
+
 
 def update_graph_metrics(asset_count: int, relationship_count: int) -> None:
     """Update gauge metrics for the current graph state."""
@@ -271,6 +293,27 @@ def record_rebuild_lock_acquisition(status: str) -> None:
     REBUILD_LOCK_ACQUISITION_TOTAL.labels(status=status).inc()
 
 
+def record_governed_snapshot_lookup(result: str) -> None:
+    """
+    Record a governed snapshot store lookup.
+
+    Parameters:
+        result (str): ``"hit"`` or ``"miss"``.
+    """
+    GOVERNED_SNAPSHOT_CACHE_REQUESTS_TOTAL.labels(result=result).inc()
+
+
+def record_governed_snapshot_evictions(count: int) -> None:
+    """Record governed snapshots evicted from the store."""
+    GOVERNED_SNAPSHOT_CACHE_EVICTIONS_TOTAL.inc(count)
+
+
+def update_governed_snapshot_size(size_bytes: int, entries: int) -> None:
+    """Update the governed snapshot store size gauges."""
+    GOVERNED_SNAPSHOT_CACHE_BYTES.set(size_bytes)
+    GOVERNED_SNAPSHOT_CACHE_ENTRIES.set(entries)
+
+
 def _initialize_from_active_job(active_job) -> None:
     """
     Initialize the rebuild-state metric from an active rebuild job.
@@ -7,19 +7,17 @@ from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from threading import Lock
 from typing import Annotated, NoReturn, cast
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy import select
-from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
 
 from src.config.settings import get_settings
-from src.data.database import create_engine_from_url, create_session_factory
+from src.data.database import claim_shared_engine, dispose_shared_engine, get_shared_session_factory
 from src.data.relationship_assertion_db_models import RelationshipAssertionORM, RelationshipEvidenceORM
 from src.data.relationship_assertion_repository import (
     RelationshipAssertionRepository,
@@ -79,6 +77,7 @@ from ..graph_lifecycle_providers import (
 router = APIRouter()
 _UTC = timezone.utc
 _INTERNAL_ERROR_DETAIL = "An internal error occurred. Please try again later."
+_ASSERTION_ENGINE_USER = "assertions"
 _PUBLICATION_EDGE_NOT_FOUND_DETAIL = "unknown publication_id or projection_edge_id"
 _PUBLICATION_INCONSISTENT_DETAIL = "Graph publication metadata is inconsistent"
 _PROPOSAL_AUTHORIZATION_HEADER = "X-Proposal-Authorization"
@@ -90,19 +89,6 @@ _DOMAIN_ERROR_STATUSES: dict[type[Exception], int] = {
     ValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
     IllegalTransition: status.HTTP_422_UNPROCESSABLE_ENTITY,
 }
-_assertion_persistence_lock = Lock()
-
-
-class _AssertionPersistenceRuntime:
-    """Reusable URL-scoped engine and session factory for assertion writes."""
-
-    def __init__(self) -> None:
-        self.url: str | None = None
-        self.engine: Engine | None = None
-        self.session_factory: sessionmaker[Session] | None = None
-
-
-_assertion_persistence_runtime = _AssertionPersistenceRuntime()
 
 
 @dataclass(frozen=True)
@@ -205,35 +191,15 @@ def _resolve_assertion_persistence_url() -> str:
         ) from exc
 
 
-def _assertion_session_factory_for_url(persistence_url: str) -> sessionmaker[Session]:
-    """Reuse one engine/session factory until the configured URL changes."""
-    with _assertion_persistence_lock:
-        if (
-            _assertion_persistence_runtime.url == persistence_url
-            and _assertion_persistence_runtime.session_factory is not None
-        ):
-            return _assertion_persistence_runtime.session_factory
-
-        engine = create_engine_from_url(persistence_url)
-        session_factory = create_session_factory(engine)
-        previous_engine = _assertion_persistence_runtime.engine
-
-        _assertion_persistence_runtime.url = persistence_url
-        _assertion_persistence_runtime.engine = engine
-        _assertion_persistence_runtime.session_factory = session_factory
-
-        if previous_engine is not None:
-            previous_engine.dispose()
-        return session_factory
-
-
 @contextmanager
 def _assertion_repository_session() -> Iterator[Session]:
     """Yield a repository session bound only to durable graph persistence."""
     try:
         persistence_url = _resolve_assertion_persistence_url()
-        session_factory = _assertion_session_factory_for_url(persistence_url)
-        with session_scope(session_factory) as session:
+        unused_url = claim_shared_engine(_ASSERTION_ENGINE_USER, persistence_url)
+        if unused_url is not None:
+            dispose_shared_engine(unused_url)
+        with session_scope(get_shared_session_factory(persistence_url)) as session:
             yield session
     except HTTPException:
         raise
@@ -14,48 +14,56 @@ from ..router_helpers import (
     raise_asset_not_found,
     serialize_asset,
 )
+from ..services.asset_page_index import (
+    AssetPageIndex,
+    InvalidAssetCursorError,
+    asset_page_index,
+    decode_asset_cursor,
+    encode_asset_cursor,
+)
 
 router = APIRouter()
 
 
-@router.get("/api/assets")
+@router.get("/api/assets", responses={400: {"description": "Invalid asset cursor"}})
 async def get_assets(
     asset_class: str | None = None,
     sector: str | None = None,
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=1000)] = 50,
+    cursor: str | None = None,
 ) -> AssetPageResponse:
     """
     Retrieve a paginated list of assets filtered by optional asset class and sector.
 
+    Matching ids come from sorted indexes built once per graph version, so a page costs
+    O(log n + per_page) rather than a filter and sort over every asset.
+
     Parameters:
         asset_class (str | None): If provided, include only assets whose `asset.asset_class.value` equals this string.
         sector (str | None): If provided, include only assets whose `asset.sector` equals this string.
-        page (int): 1-based page number.
+        page (int): 1-based page number; ignored when `cursor` is given.
         per_page (int): Number of items per page (maximum 1000).
+        cursor (str | None): `next_cursor` from a previous page; resumes after its last asset.
 
     Returns:
         AssetPageResponse: Page containing `items` (serialized assets for the requested page),
-            `total` (total matched assets), `page`, `per_page`, and `hasMore`.
+            `total` (total matched assets), `page`, `per_page`, `hasMore`, and `next_cursor`.
 
     Raises:
-        HTTPException: Propagates existing HTTP errors; raises a 500-status `HTTPException`
-            on unexpected internal errors.
+        HTTPException: Raises a 400-status `HTTPException` for a malformed cursor, propagates
+            existing HTTP errors, and raises a 500-status `HTTPException` on unexpected internal errors.
     """
     try:
+        after_id = decode_asset_cursor(cursor) if cursor is not None else None
         g = get_graph()
-        assets = []
-        for asset in g.assets.values():
-            if asset_class and asset.asset_class.value != asset_class:
-                continue
-            if sector and asset.sector != sector:
-                continue
-            assets.append(asset)
-        assets.sort(key=lambda asset: asset.id)
-        total = len(assets)
-        start = (page - 1) * per_page
+        matching_ids = asset_page_index(g).matching(asset_class, sector)
+        total = len(matching_ids)
+        start = (page - 1) * per_page if after_id is None else AssetPageIndex.start_after(matching_ids, after_id)
         end = start + per_page
-        page_assets = assets[start:end]
+        page_assets = [g.assets[asset_id] for asset_id in matching_ids[start:end]]
+    except InvalidAssetCursorError as e:
+        raise HTTPException(status_code=400, detail="Invalid asset cursor") from e
     except HTTPException:
         raise
     except Exception as e:
@@ -72,12 +80,14 @@ async def get_assets(
             status_code=500,
             detail="An internal error occurred. Please try again later.",
         ) from e
+    has_more = end < total
     return AssetPageResponse(
         items=[AssetResponse(**serialize_asset(asset)) for asset in page_assets],
         total=total,
         page=page,
         per_page=per_page,
-        hasMore=(page * per_page) < total,
+        hasMore=has_more,
+        next_cursor=encode_asset_cursor(page_assets[-1].id) if has_more and page_assets else None,
     )
 
 
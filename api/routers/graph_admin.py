@@ -20,11 +20,11 @@ from typing import Annotated, Any, NoReturn, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import text
-from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from src.data.database import create_engine_from_url, create_session_factory
+from src.data.database import get_shared_session_factory
 from src.data.db_models import RebuildJobORM, RebuildJobStatus
 from src.data.distributed_lock import DistributedLock, LockAcquisitionTimeout, LockLifecycleState, LockState
 from src.data.relationship_assertion_repository import (
@@ -63,6 +63,7 @@ from ..graph_lifecycle import (
     complete_rebuild,
     get_runtime_lifecycle_state,
     synchronize_runtime_graph,
+    warm_governed_snapshot,
 )
 from ..graph_lifecycle_providers import (
     GraphLifecycleSettings,
@@ -94,7 +95,7 @@ from ..metrics import (
     update_graph_metrics,
     update_rebuild_state_metric,
 )
-from ..services.relationship_index import invalidate_governed_relationship_index_cache
+from ..services.relationship_index import invalidate_governed_publication_snapshot
 
 # Re-export only the minimal public API used by intra-package routing.
 # Private helpers (prefixed with _) remain module-internal and should be accessed
@@ -1069,60 +1070,38 @@ def _run_rebuild_pipeline(
 
 def _setup_coordination_and_domain_factories(
     settings: GraphLifecycleSettings,
-) -> tuple[Callable[[], Session], Callable[[], Session], str, Engine, Engine | None]:
+) -> tuple[Callable[[], Session], Callable[[], Session], str, bool]:
     """Resolve durable persistence URLs and session factories.
 
-    Provides SQLAlchemy session factories and engines for the domain (graph) and coordination planes.
+    Provides SQLAlchemy session factories for the domain (graph) and coordination planes. Both come
+    from the process-wide engine registry, so rebuilds reuse pooled connections and never dispose them.
 
     Parameters:
         settings (GraphLifecycleSettings): Configuration containing `asset_graph_database_url`
             and optional `coordination_database_url`.
 
     Returns:
-        tuple[Callable[[], Session], Callable[[], Session], str, Engine, Engine | None]:
+        tuple[Callable[[], Session], Callable[[], Session], str, bool]:
             - domain_session_factory: callable that yields a new Session bound to the domain engine.
             - coordination_session_factory: callable that yields a new Session for the coordination
                 engine (may be the same as domain_session_factory).
             - resolved_domain_url: resolved durable URL used for domain persistence.
-            - domain_engine: Engine instance for the domain persistence.
-            - coordination_engine: Engine instance for coordination if a separate coordination database
-                is used, otherwise `None`.
+            - coordination_is_domain: True when coordination uses the domain database.
 
     Raises:
         RuntimeError: If neither `coordination_database_url` nor `asset_graph_database_url` is configured.
     """
     resolved_domain_url, resolved_coordination_url = _resolve_rebuild_database_urls(settings)
-    domain_engine = None
-    coordination_engine = None
-
+    domain_session_factory = get_shared_session_factory(resolved_domain_url)
     try:
-        domain_engine = create_engine_from_url(resolved_domain_url)
-        try:
-            same_db = make_url(resolved_coordination_url) == make_url(resolved_domain_url)
-        except Exception:
-            same_db = resolved_coordination_url == resolved_domain_url
-
-        if same_db:
-            coordination_session_factory = create_session_factory(domain_engine)
-            domain_session_factory = coordination_session_factory
-        else:
-            coordination_engine = create_engine_from_url(resolved_coordination_url)
-            coordination_session_factory = create_session_factory(coordination_engine)
-            domain_session_factory = create_session_factory(domain_engine)
-
-        return (
-            domain_session_factory,
-            coordination_session_factory,
-            resolved_domain_url,
-            domain_engine,
-            coordination_engine,
-        )
+        same_db = make_url(resolved_coordination_url) == make_url(resolved_domain_url)
     except Exception:
-        if domain_engine:
-            domain_engine.dispose()
-        if coordination_engine:
-            coordination_engine.dispose()
-        raise
+        same_db = resolved_coordination_url == resolved_domain_url
+
+    if same_db:
+        return domain_session_factory, domain_session_factory, resolved_domain_url, True
+    coordination_session_factory = get_shared_session_factory(resolved_coordination_url)
+    return domain_session_factory, coordination_session_factory, resolved_domain_url, False
 
 
 def _resolve_rebuild_database_urls(settings: GraphLifecycleSettings) -> tuple[str, str]:
@@ -1210,25 +1189,6 @@ def _release_rebuild_lock_safe(dist_lock: DistributedLock | None, lock_acquired:
         )
 
 
-def _dispose_rebuild_engine_safe(engine: Engine | None, *, event: str, message: str) -> None:
-    """Dispose a rebuild engine without masking the rebuild outcome."""
-    if engine is None:
-        return
-    try:
-        engine.dispose()
-    except Exception as dispose_exc:
-        error_name = type(dispose_exc).__name__
-        log_event(
-            logger,
-            logging.ERROR,
-            ObservabilityEvent(
-                event=event,
-                message=f"{message}: {error_name}",
-                metadata={"error": error_name},
-            ),
-        )
-
-
 def _perform_rebuild_and_persist_sync(
     settings: GraphLifecycleSettings,
     *,
@@ -1240,8 +1200,7 @@ def _perform_rebuild_and_persist_sync(
         domain_session_factory,
         coordination_session_factory,
         resolved_domain_url,
-        domain_engine,
-        coordination_engine,
+        coordination_is_domain,
     ) = _setup_coordination_and_domain_factories(settings)
 
     dist_lock: DistributedLock | None = None
@@ -1289,21 +1248,11 @@ def _perform_rebuild_and_persist_sync(
                 lock_holder_id=dist_lock.holder_id,
                 lock_ttl_seconds=lock_ttl,
                 coordination_session_factory=coordination_session_factory,
-                coordination_is_domain=coordination_engine is None,
+                coordination_is_domain=coordination_is_domain,
             )
 
     finally:
         _release_rebuild_lock_safe(dist_lock, lock_acquired)
-        _dispose_rebuild_engine_safe(
-            coordination_engine,
-            event="rebuild_coordination_engine_dispose_failed",
-            message="Failed to dispose coordination database engine",
-        )
-        _dispose_rebuild_engine_safe(
-            domain_engine,
-            event="rebuild_domain_engine_dispose_failed",
-            message="Failed to dispose domain database engine",
-        )
 
 
 def _validate_coordination_database_primary(session_factory: Callable[[], Session]) -> None:
@@ -1784,7 +1733,7 @@ def _finalize_rebuild_success(
             _guard_publication_lock(coordination_session, lock_holder_id, lock_ttl_seconds, "publication-pre-commit")
             _verify_execution_state(lock_lost, cancel_event, "publication-pre-commit")
 
-        assertion_repo.finalize_projection_publication(
+        published = assertion_repo.finalize_projection_publication(
             FinalizeProjectionPublicationRequest(
                 projection=PersistProjectionRequest(revision=revision, created_at=publication_time),
                 rebuild_job_id=job_id,
@@ -1797,7 +1746,8 @@ def _finalize_rebuild_success(
             pre_success_check=pre_success_check,
             pre_commit_check=pre_commit_check,
         )
-    invalidate_governed_relationship_index_cache()
+    invalidate_governed_publication_snapshot(published.publication_id)
+    warm_governed_snapshot(job_id)
     if not synchronize_runtime_graph(
         publication_graph,
         job_id=job_id,
@@ -1911,16 +1861,12 @@ def _rebuild_persistence_session() -> Generator[Session, None, None]:
             for other failures creating or accessing the persistence engine.
 
     Notes:
-        The underlying engine is disposed when the context manager exits.
+        Sessions come from the process-wide engine registry, so the pooled engine outlives the context.
     """
     settings = get_graph_lifecycle_settings()
-    engine = None
     try:
         persistence_url = resolve_durable_graph_persistence_url(resolve_hosted_graph_database_url(settings))
-        engine = create_engine_from_url(persistence_url)
-        session_factory = create_session_factory(engine)
-
-        with session_scope(session_factory) as session:
+        with session_scope(get_shared_session_factory(persistence_url)) as session:
             yield session
     except HTTPException:
         raise
@@ -1943,9 +1889,6 @@ def _rebuild_persistence_session() -> Generator[Session, None, None]:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Graph persistence database unavailable",
         ) from exc
-    finally:
-        if engine is not None:
-            engine.dispose()
 
 
 def _safe_parse_status(raw_status: str) -> RebuildJobStatus:
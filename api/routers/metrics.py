@@ -1,40 +1,124 @@
 """Graph metrics API routes."""
 
 import logging
+from typing import Annotated
 
 # pylint: disable=import-error
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 
 # pylint: enable=import-error
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_structure import GraphStructure, graph_structure
 from src.observability.facade import ObservabilityEvent, log_event
 
-from ..api_models import MetricsResponse
+from ..api_models import GraphClusterResponse, MetricsResponse, RelationshipResponse
 from ..router_helpers import get_graph, logger
+from ..services.graph_version_cache import GraphVersionCache
+from ..services.response_cache import cached_json_response, graph_response_key
 
 router = APIRouter()
 
+_MAX_TOP_RELATIONSHIPS = 1000
 
-@router.get("/api/graph/metrics", responses={500: {"description": "Internal server error"}})
-async def get_graph_metrics() -> MetricsResponse:
+
+_graph_structures: GraphVersionCache[GraphStructure] = GraphVersionCache()
+
+
+def _graph_structure(graph: AssetRelationshipGraph, communities: bool) -> GraphStructure:
+    """Return the decomposition of the current version of ``graph``, with or without communities."""
+    return _graph_structures.get_or_build(
+        graph, lambda built: graph_structure(built, communities=communities), variant=communities
+    )
+
+
+def _cluster_responses(clusters: list[tuple[str, ...]]) -> list[GraphClusterResponse]:
+    """Build cluster responses numbered in their largest-first order."""
+    return [
+        GraphClusterResponse(id=cluster_id, size=len(asset_ids), asset_ids=list(asset_ids))
+        for cluster_id, asset_ids in enumerate(clusters)
+    ]
+
+
+def _render_graph_metrics(
+    g: AssetRelationshipGraph,
+    top_k: int | None,
+    components: bool = False,
+    communities: bool = False,
+) -> bytes:
+    """Calculate public metrics for ``g`` and serialize them to JSON bytes."""
+    if top_k is None:
+        metrics_dict = g.calculate_metrics()
+        top_relationships = None
+    else:
+        metrics_dict = g.calculate_metrics(top_k=top_k)
+        top_relationships = [
+            RelationshipResponse(
+                source_id=source_id,
+                target_id=target_id,
+                relationship_type=rel_type,
+                strength=strength,
+            )
+            for source_id, target_id, rel_type, strength in metrics_dict["top_relationships"]
+        ]
+    response = MetricsResponse(
+        total_assets=metrics_dict["total_assets"],
+        total_relationships=metrics_dict["total_relationships"],
+        asset_classes=metrics_dict["asset_classes"],
+        avg_degree=metrics_dict["avg_degree"],
+        max_degree=metrics_dict["max_degree"],
+        network_density=metrics_dict["network_density"],
+        top_relationships=top_relationships,
+    )
+    if components or communities:
+        structure = _graph_structure(g, communities)
+        if components:
+            response.components = _cluster_responses(structure.components)
+        if structure.communities is not None:
+            response.communities = _cluster_responses(structure.communities)
+    return response.model_dump_json(exclude_none=True).encode("utf-8")
+
+
+@router.get(
+    "/api/graph/metrics",
+    response_model=MetricsResponse,
+    response_model_exclude_none=True,
+    responses={
+        304: {"description": "The client's cached copy matches the current ETag"},
+        500: {"description": "Internal server error"},
+    },
+)
+async def get_graph_metrics(
+    top_k: Annotated[int | None, Query(ge=1, le=_MAX_TOP_RELATIONSHIPS)] = None,
+    components: bool = False,
+    communities: bool = False,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Retrieve aggregated graph metrics (totals, degrees, and density) for the current asset graph.
 
+    The JSON body is cached per graph version and query; the structural decomposition
+    behind ``components`` and ``communities`` is computed once per graph version.
+
+    Parameters:
+        top_k (int | None): When provided, also return the ``top_k`` strongest relationships,
+            ordered by descending strength with ties in relationship-map order.
+        components (bool): Also return connected components (edge direction ignored),
+            largest first, each with its sorted asset ids.
+        communities (bool): Also return label-propagation communities in the same shape.
+        if_none_match (str | None): ETag(s) the client already holds.
+
     Returns:
-        MetricsResponse: The calculated public metrics for the graph state.
+        Response: The calculated public metrics for the graph state, or `304 Not Modified`
+            when `If-None-Match` matches the current ETag.
 
     Raises:
         HTTPException: Raised with status code 500 if an internal error occurs while calculating metrics.
     """
     try:
         g = get_graph()
-        metrics_dict = g.calculate_metrics()
-        return MetricsResponse(
-            total_assets=metrics_dict["total_assets"],
-            total_relationships=metrics_dict["total_relationships"],
-            asset_classes=metrics_dict["asset_classes"],
-            avg_degree=metrics_dict["avg_degree"],
-            max_degree=metrics_dict["max_degree"],
-            network_density=metrics_dict["network_density"],
+        key = graph_response_key("metrics", g, g.version, variant=(top_k, components, communities))
+        return cached_json_response(
+            key, lambda: _render_graph_metrics(g, top_k, components, communities), if_none_match
         )
     except HTTPException:
         raise
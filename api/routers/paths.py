@@ -0,0 +1,156 @@
+"""Weighted path query API routes."""
+
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.path_engine import PathEngine, PathSearchResult
+from src.observability.facade import ObservabilityEvent, log_event
+
+from ..api_models import PathQueryResponse, WeightedPathResponse
+from ..router_helpers import get_graph, logger, raise_asset_not_found
+from ..services.graph_version_cache import GraphVersionCache
+
+router = APIRouter()
+
+_MAX_PATH_EXPANSIONS = 100_000
+_MAX_EXPOSURE_PATHS = 1000
+# Wall-clock budget per search; results past it are returned with ``truncated`` set.
+_PATH_TIME_BUDGET_S = 0.25
+
+
+_path_engines: GraphVersionCache[PathEngine] = GraphVersionCache()
+
+
+def _path_engine(graph: AssetRelationshipGraph, undirected: bool) -> PathEngine:
+    """Return the path engine for the current version of ``graph`` and one edge orientation."""
+    return _path_engines.get_or_build(
+        graph, lambda built: PathEngine.from_graph(built, undirected=undirected), variant=undirected
+    )
+
+
+def _path_query_response(result: PathSearchResult) -> PathQueryResponse:
+    """Convert an engine search result into the API response shape."""
+    return PathQueryResponse(
+        paths=[
+            WeightedPathResponse(
+                asset_ids=list(path.asset_ids),
+                relationship_types=list(path.relationship_types),
+                cost=path.cost,
+                exposure=path.exposure,
+            )
+            for path in result.paths
+        ],
+        expanded=result.expanded,
+        truncated=result.truncated,
+    )
+
+
+def _log_path_query_failure(event: str, error: Exception, asset_id: str) -> None:
+    """Emit a bounded error event for a failed path query."""
+    log_event(
+        logger,
+        logging.ERROR,
+        ObservabilityEvent(
+            event=event,
+            message=f"Error running path query: {type(error).__name__}",
+            metadata={"asset_id": asset_id, "error": type(error).__name__},
+        ),
+    )
+
+
+@router.get("/api/paths/shortest")
+async def get_shortest_path(
+    source_id: str,
+    target_id: str,
+    undirected: bool = True,
+    max_expansions: Annotated[int, Query(ge=1, le=_MAX_PATH_EXPANSIONS)] = 10_000,
+) -> PathQueryResponse:
+    """
+    Find the highest-exposure path between two assets.
+
+    Edge costs are ``-log(strength)``, so Dijkstra's cheapest path maximizes the product
+    of hop strengths. The search stops after ``max_expansions`` nodes or the latency budget.
+
+    Parameters:
+        source_id (str): Asset the path starts from.
+        target_id (str): Asset the path ends at.
+        undirected (bool): Also walk edges from target to source (default True).
+        max_expansions (int): Node-expansion cap (maximum 100000).
+
+    Returns:
+        PathQueryResponse: At most one path, the expansion count, and whether the search was cut short.
+
+    Raises:
+        HTTPException: 404 if either asset does not exist; 500 if an internal error occurs.
+    """
+    try:
+        g = get_graph()
+        for asset_id in (source_id, target_id):
+            if asset_id not in g.assets:
+                raise_asset_not_found(asset_id)
+        engine = _path_engine(g, undirected)
+        result = engine.shortest_path(
+            source_id,
+            target_id,
+            max_expansions=max_expansions,
+            time_budget_s=_PATH_TIME_BUDGET_S,
+        )
+        return _path_query_response(result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        _log_path_query_failure("api_get_shortest_path_failed", e, source_id)
+        raise HTTPException(
+            status_code=500,
+            detail="An internal error occurred. Please try again later.",
+        ) from e
+
+
+@router.get("/api/assets/{asset_id}/exposure-paths")
+async def get_exposure_paths(
+    asset_id: str,
+    max_paths: Annotated[int, Query(ge=1, le=_MAX_EXPOSURE_PATHS)] = 20,
+    undirected: bool = True,
+    max_expansions: Annotated[int, Query(ge=1, le=_MAX_PATH_EXPANSIONS)] = 10_000,
+) -> PathQueryResponse:
+    """
+    Trace how stress on one asset propagates to the assets most exposed to it.
+
+    Returns the best path to each of the ``max_paths`` nodes with the largest exposure,
+    ordered by decreasing exposure.
+
+    Parameters:
+        asset_id (str): Asset the stress starts from, typically an issuer.
+        max_paths (int): Maximum number of paths (maximum 1000).
+        undirected (bool): Also walk edges from target to source (default True).
+        max_expansions (int): Node-expansion cap (maximum 100000).
+
+    Returns:
+        PathQueryResponse: Paths, the expansion count, and whether the search was cut short.
+
+    Raises:
+        HTTPException: 404 if the asset does not exist; 500 if an internal error occurs.
+    """
+    try:
+        g = get_graph()
+        if asset_id not in g.assets:
+            raise_asset_not_found(asset_id)
+        engine = _path_engine(g, undirected)
+        result = engine.exposure_paths(
+            asset_id,
+            max_paths=max_paths,
+            max_expansions=max_expansions,
+            time_budget_s=_PATH_TIME_BUDGET_S,
+        )
+        return _path_query_response(result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        _log_path_query_failure("api_get_exposure_paths_failed", e, asset_id)
+        raise HTTPException(
+            status_code=500,
+            detail="An internal error occurred. Please try again later.",
+        ) from e
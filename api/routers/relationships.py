@@ -3,21 +3,38 @@
 from __future__ import annotations
 
 import logging
-from typing import TypeAlias
+from collections.abc import Iterator
+from typing import Annotated, Literal, TypeAlias
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
+from src.logic.asset_graph import AssetRelationshipGraph
 from src.observability.facade import ObservabilityEvent, log_event
 
-from ..api_models import RelationshipResponse
+from ..api_models import RelationshipPageResponse, RelationshipResponse
 from ..router_helpers import get_graph, logger, raise_asset_not_found
+from ..services.edge_page_index import (
+    InvalidRelationshipCursorError,
+    decode_relationship_cursor,
+    encode_relationship_cursor,
+    sorted_edge_index,
+)
 from ..services.relationship_index import (
     GovernedRelationshipIndex,
+    governed_relationship_cache_generation,
     load_governed_relationship_index,
+    load_governed_relationship_snapshot,
 )
+from ..services.response_cache import cached_json_response, graph_response_key
 
 router = APIRouter()
 GraphRelationship: TypeAlias = tuple[str, str, float]
+RelationshipDirection: TypeAlias = Literal["in", "out", "both"]
+_RELATIONSHIP_LIST_ADAPTER = TypeAdapter(list[RelationshipResponse])
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_EXPORT_LINES_PER_CHUNK = 512
 
 
 def _relationship_response(
@@ -40,13 +57,22 @@ def _relationship_response(
 
 
 @router.get("/api/assets/{asset_id}/relationships", response_model_exclude_none=True)
-async def get_asset_relationships(asset_id: str) -> list[RelationshipResponse]:
+async def get_asset_relationships(
+    asset_id: str,
+    direction: RelationshipDirection = "out",
+) -> list[RelationshipResponse]:
     """
-    Return outgoing relationships for the specified asset.
+    Return the relationships of the specified asset in the requested direction.
+
+    Parameters:
+        asset_id (str): The asset whose relationships are returned.
+        direction (str): ``"out"`` (default) for edges whose `source_id` is `asset_id`,
+            ``"in"`` for edges whose `target_id` is `asset_id` (served from the graph's
+            reverse index, ordered by source), or ``"both"`` for outgoing then incoming.
 
     Returns:
-        list[RelationshipResponse]: A list of relationship objects where each item has `source_id`
-            set to the provided `asset_id` and includes `target_id`, `relationship_type`, and `strength`.
+        list[RelationshipResponse]: Relationship objects with `source_id`, `target_id`,
+            `relationship_type`, `strength`, and governance metadata where published.
 
     Raises:
         HTTPException: If the asset does not exist (404) or an internal error occurs (500).
@@ -56,10 +82,18 @@ async def get_asset_relationships(asset_id: str) -> list[RelationshipResponse]:
         if asset_id not in g.assets:
             raise_asset_not_found(asset_id)
         governed_index = load_governed_relationship_index(g)
-        return [
-            _relationship_response(asset_id, relationship, governed_index)
-            for relationship in g.relationships.get(asset_id, [])
-        ]
+        responses: list[RelationshipResponse] = []
+        if direction != "in":
+            responses.extend(
+                _relationship_response(asset_id, relationship, governed_index)
+                for relationship in g.relationships.get(asset_id, [])
+            )
+        if direction != "out":
+            responses.extend(
+                _relationship_response(source_id, (asset_id, rel_type, strength), governed_index)
+                for source_id, rel_type, strength in g.incoming_relationships(asset_id)
+            )
+        return responses
     except HTTPException:
         raise
     except Exception as e:
@@ -78,29 +112,129 @@ async def get_asset_relationships(asset_id: str) -> list[RelationshipResponse]:
         ) from e
 
 
-@router.get("/api/relationships", response_model_exclude_none=True)
-async def get_all_relationships() -> list[RelationshipResponse]:
+@router.get(
+    "/api/relationships/page",
+    response_model_exclude_none=True,
+    responses={400: {"description": "Invalid relationship cursor"}},
+)
+async def get_relationship_page(
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    relationship_type: str | None = None,
+    min_strength: Annotated[float | None, Query(ge=0.0, le=1.0)] = None,
+    source_asset_class: str | None = None,
+) -> RelationshipPageResponse:
+    """
+    Retrieve one cursor-paginated, optionally filtered page of relationships.
+
+    Pages are served from a sorted edge index built once per graph version, so a page
+    costs O(limit) for the type and asset-class filters. With ``min_strength`` each
+    matching edge is located through a range-maximum tree over the filtered strengths,
+    in O(log n) per edge, so weaker edges are skipped without being visited.
+
+    Parameters:
+        cursor (str | None): ``next_cursor`` from the previous page; omit for the first page.
+        limit (int): Maximum number of relationships per page (maximum 1000).
+        relationship_type (str | None): Include only relationships of this type.
+        min_strength (float | None): Include only relationships with at least this strength.
+        source_asset_class (str | None): Include only relationships whose source asset has this class.
+
+    Returns:
+        RelationshipPageResponse: Page containing `items`, `limit`, `next_cursor`, and `hasMore`.
+
+    Raises:
+        HTTPException: 400 for a malformed cursor; 500 if an internal error occurs.
+    """
+    try:
+        after = decode_relationship_cursor(cursor) if cursor is not None else None
+        g = get_graph()
+        edges, has_more = sorted_edge_index(g).page(
+            limit=limit,
+            after=after,
+            relationship_type=relationship_type,
+            min_strength=min_strength,
+            source_asset_class=source_asset_class,
+        )
+        governed_index = load_governed_relationship_snapshot(g).governance_index
+        items = [
+            _relationship_response(source_id, (target_id, rel_type, strength), governed_index)
+            for source_id, target_id, rel_type, strength in edges
+        ]
+    except InvalidRelationshipCursorError as e:
+        raise HTTPException(status_code=400, detail="Invalid relationship cursor") from e
+    except HTTPException:
+        raise
+    except Exception as e:
+        log_event(
+            logger,
+            logging.ERROR,
+            ObservabilityEvent(
+                event="api_get_relationship_page_failed",
+                message=f"Error getting relationship page: {type(e).__name__}",
+                metadata={"error": type(e).__name__},
+            ),
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="An internal error occurred. Please try again later.",
+        ) from e
+    next_cursor = encode_relationship_cursor(edges[-1][:3]) if has_more else None
+    return RelationshipPageResponse(items=items, limit=limit, next_cursor=next_cursor, hasMore=has_more)
+
+
+def _render_all_relationships(g: AssetRelationshipGraph, governed_index: GovernedRelationshipIndex) -> bytes:
+    """Serialize every graph relationship, joined with governance metadata, to JSON bytes."""
+    responses = [
+        _relationship_response(source_id, relationship, governed_index)
+        for source_id, rels in g.relationships.items()
+        for relationship in rels
+    ]
+    return _RELATIONSHIP_LIST_ADAPTER.dump_json(responses, exclude_none=True)
+
+
+@router.get(
+    "/api/relationships",
+    response_model=list[RelationshipResponse],
+    response_model_exclude_none=True,
+    responses={304: {"description": "The client's cached copy matches the current ETag"}},
+)
+async def get_all_relationships(
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Retrieve all relationships from the shared graph.
 
     Each relationship is serialized to a RelationshipResponse with
 
-    `source_id`, `target_id`, `relationship_type`, and `strength`.
+    `source_id`, `target_id`, `relationship_type`, and `strength`. The JSON body is
+    cached per graph version, publication and governance cache generation.
+
+    Parameters:
+        if_none_match (str | None): ETag(s) the client already holds.
 
     Returns:
-        list[RelationshipResponse]: All relationships present in the graph.
+        Response: JSON list of all relationships present in the graph, or `304 Not Modified`
+            when `If-None-Match` matches the current ETag.
 
     Raises:
         HTTPException: Raised with status code 500 if an internal error occurs while retrieving relationships.
     """
     try:
         g = get_graph()
-        governed_index = load_governed_relationship_index(g)
-        return [
-            _relationship_response(source_id, relationship, governed_index)
-            for source_id, rels in g.relationships.items()
-            for relationship in rels
-        ]
+        snapshot = load_governed_relationship_snapshot(g)
+        publication_id = snapshot.publication.publication_id if snapshot.publication is not None else None
+        key = graph_response_key(
+            "relationships",
+            g,
+            g.version,
+            publication_id,
+            governed_relationship_cache_generation(),
+        )
+        return cached_json_response(
+            key,
+            lambda: _render_all_relationships(g, snapshot.governance_index),
+            if_none_match,
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -117,3 +251,66 @@ async def get_all_relationships() -> list[RelationshipResponse]:
             status_code=500,
             detail="An internal error occurred. Please try again later.",
         ) from e
+
+
+def _iter_relationship_ndjson(
+    g: AssetRelationshipGraph,
+    governed_index: GovernedRelationshipIndex,
+) -> Iterator[bytes]:
+    """
+    Yield every graph relationship as NDJSON, batched into chunks of complete lines.
+
+    Edges come from `AssetRelationshipGraph.iter_relationships`, so only one chunk of
+    serialized lines is held at a time and the ``"csr"`` backend never builds its dict view.
+    """
+    lines: list[bytes] = []
+    for source_id, target_id, relationship_type, strength in g.iter_relationships():
+        response = _relationship_response(source_id, (target_id, relationship_type, strength), governed_index)
+        lines.append(response.model_dump_json(exclude_none=True).encode("utf-8"))
+        if len(lines) == _EXPORT_LINES_PER_CHUNK:
+            yield b"\n".join(lines) + b"\n"
+            lines.clear()
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+@router.get(
+    "/api/relationships/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {_NDJSON_MEDIA_TYPE: {}}, "description": "One RelationshipResponse per line"}},
+)
+async def export_relationships() -> StreamingResponse:
+    """
+    Stream all relationships as newline-delimited JSON.
+
+    Each line holds the same object `/api/relationships` returns for that edge. Governance
+    metadata is loaded before the first byte is sent, so its failures still map to error
+    statuses; edges are then serialized while streaming, keeping time to first byte and
+    peak memory independent of graph size.
+
+    Returns:
+        StreamingResponse: An `application/x-ndjson` body with one relationship per line.
+
+    Raises:
+        HTTPException: Raised with status code 500 if an internal error occurs before streaming starts.
+    """
+    try:
+        g = get_graph()
+        governed_index = load_governed_relationship_snapshot(g).governance_index
+    except HTTPException:
+        raise
+    except Exception as e:
+        log_event(
+            logger,
+            logging.ERROR,
+            ObservabilityEvent(
+                event="api_export_relationships_failed",
+                message=f"Error exporting relationships: {type(e).__name__}",
+                metadata={"error": type(e).__name__},
+            ),
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="An internal error occurred. Please try again later.",
+        ) from e
+    return StreamingResponse(_iter_relationship_ndjson(g, governed_index), media_type=_NDJSON_MEDIA_TYPE)
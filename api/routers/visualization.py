@@ -5,13 +5,15 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import math
+from functools import lru_cache
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from pydantic import ValidationError as PydanticValidationError
 
 from src.governance.relationship_assertion import ValidationError
 from src.logic.asset_graph import AssetRelationshipGraph, calculate_graph_density
+from src.logic.graph_layout import fibonacci_sphere_layout
 from src.observability.facade import ObservabilityEvent, log_event
 
 from ..api_models import VisualizationDataResponse, VisualizationEdge, VisualizationNode
@@ -21,52 +23,51 @@ from ..router_helpers import (
     _DEFAULT_COLOR,
     get_graph,
     logger,
+    raise_asset_not_found,
 )
 from ..services.relationship_index import (
     PublishedProjectionContext,
     PublishedRelationshipSnapshot,
+    governed_relationship_cache_generation,
     load_governed_relationship_snapshot,
 )
+from ..services.response_cache import cached_json_response, graph_response_key
 
 router = APIRouter()
 
+_MAX_NEIGHBORHOOD_DEPTH = 5
+_MAX_NEIGHBORHOOD_NODES = 5000
+
 
 def _calculate_node_degrees(g: AssetRelationshipGraph) -> dict[str, int]:
     """Return outgoing relationship counts for every graph asset."""
     degree: dict[str, int] = dict.fromkeys(g.assets.keys(), 0)
-    for source_id, rels in g.relationships.items():
-        degree[source_id] = degree.get(source_id, 0) + len(rels)
+    degree.update(g.out_degrees())
     return degree
 
 
-def _compute_fibonacci_position(
-    idx: int,
-    total_nodes: int,
-    golden_ratio: float,
-) -> tuple[float, float, float]:
-    """Return a deterministic Fibonacci-sphere position for one node."""
-    if total_nodes <= 1:
-        return 0.0, 0.0, 0.0
-    theta = math.acos(1 - 2 * (idx + 0.5) / total_nodes)
-    phi = 2 * math.pi * idx / golden_ratio
-    x = math.sin(theta) * math.cos(phi)
-    y = math.sin(theta) * math.sin(phi)
-    z = math.cos(theta)
-    return x, y, z
+@lru_cache(maxsize=8)
+def _fibonacci_coordinates(total_nodes: int) -> list[tuple[float, float, float]]:
+    """Return Fibonacci-sphere coordinates rounded for the response, computed once per node count."""
+    return [(round(x, 6), round(y, 6), round(z, 6)) for x, y, z in fibonacci_sphere_layout(total_nodes).tolist()]
 
 
 def _build_visualization_nodes(
     g: AssetRelationshipGraph,
     asset_ids: list[str],
+    degree: dict[str, int] | None = None,
 ) -> list[VisualizationNode]:
-    """Build visualization nodes with deterministic positions and degree sizes."""
-    degree = _calculate_node_degrees(g)
-    total_nodes = len(asset_ids)
-    golden_ratio = (1 + math.sqrt(5)) / 2
+    """Build visualization nodes with deterministic positions and degree sizes.
+
+    ``degree`` defaults to the outgoing counts of every graph asset; subgraph callers
+    pass counts for ``asset_ids`` only.
+    """
+    if degree is None:
+        degree = _calculate_node_degrees(g)
+    coordinates = _fibonacci_coordinates(len(asset_ids))
     nodes: list[VisualizationNode] = []
-    for idx, asset_id in enumerate(asset_ids):
+    for asset_id, (x, y, z) in zip(asset_ids, coordinates, strict=True):
         asset = g.assets[asset_id]
-        x, y, z = _compute_fibonacci_position(idx, total_nodes, golden_ratio)
         asset_class_val = asset.asset_class.value
         nodes.append(
             VisualizationNode(
@@ -74,9 +75,9 @@ def _build_visualization_nodes(
                 symbol=asset.symbol,
                 name=asset.name,
                 asset_class=asset_class_val,
-                x=round(x, 6),
-                y=round(y, 6),
-                z=round(z, 6),
+                x=x,
+                y=y,
+                z=z,
                 color=_ASSET_CLASS_COLORS.get(asset_class_val, _DEFAULT_COLOR),
                 size=max(5, min(20, 5 + degree.get(asset_id, 0) * 2)),
             )
@@ -122,11 +123,25 @@ def _build_visualization_edges(
     snapshot: PublishedRelationshipSnapshot,
 ) -> list[VisualizationEdge]:
     """Build visualization edges with optional published governance metadata."""
-    edges: list[VisualizationEdge] = []
-    for source_id, rels in g.relationships.items():
-        for target_id, rel_type, strength in rels:
-            edges.append(_build_visualization_edge(source_id, target_id, rel_type, strength, snapshot))
-    return edges
+    return [
+        _build_visualization_edge(source_id, target_id, rel_type, strength, snapshot)
+        for source_id, target_id, rel_type, strength in g.iter_relationships()
+    ]
+
+
+def _build_neighborhood_edges(
+    g: AssetRelationshipGraph,
+    asset_ids: list[str],
+    snapshot: PublishedRelationshipSnapshot,
+) -> list[VisualizationEdge]:
+    """Build visualization edges whose source and target are both in ``asset_ids``."""
+    members = set(asset_ids)
+    return [
+        _build_visualization_edge(source_id, target_id, rel_type, strength, snapshot)
+        for source_id in asset_ids
+        for target_id, rel_type, strength in g.outgoing_relationships(source_id)
+        if target_id in members
+    ]
 
 
 def _legacy_edge_id(source_id: str, target_id: str, relationship_type: str) -> str:
@@ -144,34 +159,128 @@ def _publication_response(
     return PublishedProjectionContextResponse.from_source(publication)
 
 
+def _render_visualization_data(g: AssetRelationshipGraph, snapshot: PublishedRelationshipSnapshot) -> bytes:
+    """Build the visualization payload for ``g`` and serialize it to JSON bytes."""
+    asset_ids = list(g.assets.keys())
+    nodes = _build_visualization_nodes(g, asset_ids)
+    edges = _build_visualization_edges(g, snapshot)
+    network_density = calculate_graph_density(len(asset_ids), len(edges))
+    response = VisualizationDataResponse(
+        nodes=nodes,
+        edges=edges,
+        network_density=network_density,
+        publication=_publication_response(snapshot.publication),
+    )
+    return response.model_dump_json(exclude_none=True).encode("utf-8")
+
+
 @router.get(
     "/api/visualization",
+    response_model=VisualizationDataResponse,
     response_model_exclude_none=True,
-    responses={503: {"description": "Graph publication metadata is inconsistent or database is unavailable"}},
+    responses={
+        304: {"description": "The client's cached copy matches the current ETag"},
+        503: {"description": "Graph publication metadata is inconsistent or database is unavailable"},
+    },
 )
-async def get_visualization_data() -> VisualizationDataResponse:
+async def get_visualization_data(
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Produce visualization nodes and edges for the current asset relationship graph.
 
+    The JSON body is cached per graph version, publication and governance cache generation.
+
+    Parameters:
+        if_none_match (str | None): ETag(s) the client already holds.
+
     Returns:
-        VisualizationDataResponse: Object containing `nodes` (list of node dictionaries)
-            and `edges` (list of edge dictionaries).
+        Response: JSON object containing `nodes` (list of node dictionaries)
+            and `edges` (list of edge dictionaries), or `304 Not Modified` when
+            `If-None-Match` matches the current ETag.
 
     Raises:
         HTTPException: Raised with status code 500 when an internal error prevents assembling the visualization data.
     """
     try:
         g = get_graph()
-        asset_ids = list(g.assets.keys())
-        nodes = _build_visualization_nodes(g, asset_ids)
         snapshot = load_governed_relationship_snapshot(g)
-        edges = _build_visualization_edges(g, snapshot)
-        effective_assets_count = len(asset_ids)
-        network_density = calculate_graph_density(effective_assets_count, len(edges))
+        publication_id = snapshot.publication.publication_id if snapshot.publication is not None else None
+        key = graph_response_key(
+            "visualization",
+            g,
+            g.version,
+            publication_id,
+            governed_relationship_cache_generation(),
+        )
+        return cached_json_response(key, lambda: _render_visualization_data(g, snapshot), if_none_match)
+    except HTTPException:
+        raise
+    except (ValidationError, PydanticValidationError, ValueError) as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Graph publication metadata is inconsistent",
+        ) from e
+    except Exception as e:
+        log_event(
+            logger,
+            logging.ERROR,
+            ObservabilityEvent(
+                event="api_get_visualization_data_failed",
+                message=f"Error getting visualization data: {type(e).__name__}",
+                metadata={"error": type(e).__name__},
+            ),
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="An internal error occurred. Please try again later.",
+        ) from e
+
+
+@router.get(
+    "/api/assets/{asset_id}/neighborhood",
+    response_model_exclude_none=True,
+    responses={503: {"description": "Graph publication metadata is inconsistent or database is unavailable"}},
+)
+async def get_asset_neighborhood(
+    asset_id: str,
+    depth: Annotated[int, Query(ge=1, le=_MAX_NEIGHBORHOOD_DEPTH)] = 1,
+    max_nodes: Annotated[int, Query(ge=1, le=_MAX_NEIGHBORHOOD_NODES)] = 200,
+) -> VisualizationDataResponse:
+    """
+    Produce visualization data for the subgraph around one asset.
+
+    A breadth-first search follows relationships in both directions for up to ``depth``
+    hops and stops at ``max_nodes`` assets. Edges between the collected assets are
+    returned in the `/api/visualization` shape, with node sizes from outgoing degree and
+    Fibonacci-sphere positions over the subgraph, the root asset first.
+
+    Parameters:
+        asset_id (str): The asset at the centre of the neighborhood.
+        depth (int): Maximum hop distance from ``asset_id`` (maximum 5).
+        max_nodes (int): Maximum number of assets returned (maximum 5000).
+
+    Returns:
+        VisualizationDataResponse: Subgraph `nodes`, `edges`, their `network_density`, and the
+            publication context.
+
+    Raises:
+        HTTPException: 404 if the asset does not exist, 503 for inconsistent publication
+            metadata, or 500 when an internal error prevents assembling the subgraph.
+    """
+    try:
+        g = get_graph()
+        if asset_id not in g.assets:
+            raise_asset_not_found(asset_id)
+        asset_ids = g.neighborhood(asset_id, depth, max_nodes)
+        snapshot = load_governed_relationship_snapshot(g)
+        degree = {member_id: g.out_degree(member_id) for member_id in asset_ids}
+        nodes = _build_visualization_nodes(g, asset_ids, degree)
+        edges = _build_neighborhood_edges(g, asset_ids, snapshot)
         return VisualizationDataResponse(
             nodes=nodes,
             edges=edges,
-            network_density=network_density,
+            network_density=calculate_graph_density(len(asset_ids), len(edges)),
             publication=_publication_response(snapshot.publication),
         )
     except HTTPException:
@@ -186,9 +295,9 @@ async def get_visualization_data() -> VisualizationDataResponse:
             logger,
             logging.ERROR,
             ObservabilityEvent(
-                event="api_get_visualization_data_failed",
-                message=f"Error getting visualization data: {type(e).__name__}",
-                metadata={"error": type(e).__name__},
+                event="api_get_asset_neighborhood_failed",
+                message=f"Error getting asset neighborhood: {type(e).__name__}",
+                metadata={"asset_id": asset_id, "error": type(e).__name__},
             ),
         )
         raise HTTPException(
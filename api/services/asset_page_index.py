@@ -0,0 +1,95 @@
+"""Sorted asset id indexes backing filtered and paginated asset reads.
+
+Ids are kept sorted overall, per asset class, per sector and per pair of both,
+and the index is built once per graph object and version. A filtered page is
+one dict lookup plus a slice, or a bisect plus a slice when resuming from a
+cursor, instead of a filter-and-sort over every asset.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from bisect import bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import Asset
+
+from .graph_version_cache import GraphVersionCache
+
+_NO_IDS: list[str] = []
+
+
+class InvalidAssetCursorError(ValueError):
+    """Raised when an asset pagination cursor cannot be decoded."""
+
+
+def encode_asset_cursor(asset_id: str) -> str:
+    """Return an opaque, URL-safe cursor resuming after ``asset_id``."""
+    return base64.urlsafe_b64encode(asset_id.encode("utf-8")).decode("ascii")
+
+
+def decode_asset_cursor(cursor: str) -> str:
+    """
+    Decode a cursor produced by `encode_asset_cursor`.
+
+    Raises:
+        InvalidAssetCursorError: If the cursor is not a well-formed encoded asset id.
+    """
+    try:
+        asset_id = base64.b64decode(cursor.encode("ascii"), altchars=b"-_", validate=True).decode("utf-8")
+    except (UnicodeError, binascii.Error, ValueError) as exc:
+        raise InvalidAssetCursorError("Invalid asset cursor") from exc
+    if not asset_id:
+        raise InvalidAssetCursorError("Invalid asset cursor")
+    return asset_id
+
+
+@dataclass(frozen=True, slots=True)
+class AssetPageIndex:
+    """Asset ids sorted ascending, overall and per filter value."""
+
+    ids: list[str]
+    by_class: dict[str, list[str]]
+    by_sector: dict[str, list[str]]
+    by_class_and_sector: dict[tuple[str, str], list[str]]
+
+    @classmethod
+    def from_assets(cls, assets: Mapping[str, Asset]) -> AssetPageIndex:
+        """Sort the ids of ``assets`` and group them by asset class and sector."""
+        ids = sorted(assets)
+        by_class: dict[str, list[str]] = {}
+        by_sector: dict[str, list[str]] = {}
+        by_class_and_sector: dict[tuple[str, str], list[str]] = {}
+        for asset_id in ids:
+            asset = assets[asset_id]
+            asset_class = asset.asset_class.value
+            by_class.setdefault(asset_class, []).append(asset_id)
+            by_sector.setdefault(asset.sector, []).append(asset_id)
+            by_class_and_sector.setdefault((asset_class, asset.sector), []).append(asset_id)
+        return cls(ids=ids, by_class=by_class, by_sector=by_sector, by_class_and_sector=by_class_and_sector)
+
+    def matching(self, asset_class: str | None = None, sector: str | None = None) -> list[str]:
+        """Return the sorted ids of assets matching both optional filters; treat the result as read-only."""
+        if not asset_class and not sector:
+            return self.ids
+        if not sector:
+            return self.by_class.get(asset_class, _NO_IDS)
+        if not asset_class:
+            return self.by_sector.get(sector, _NO_IDS)
+        return self.by_class_and_sector.get((asset_class, sector), _NO_IDS)
+
+    @staticmethod
+    def start_after(ids: list[str], after_id: str) -> int:
+        """Return the position in ``ids`` of the first id greater than ``after_id``."""
+        return bisect_right(ids, after_id)
+
+
+_asset_page_indexes: GraphVersionCache[AssetPageIndex] = GraphVersionCache()
+
+
+def asset_page_index(graph: AssetRelationshipGraph) -> AssetPageIndex:
+    """Return the asset index for the current version of ``graph``, building it on first use."""
+    return _asset_page_indexes.get_or_build(graph, lambda built: AssetPageIndex.from_assets(built.assets))
@@ -0,0 +1,205 @@
+"""Sorted edge index backing cursor-paginated relationship reads.
+
+The index is built once per graph object and version. Edges are ordered by
+``(source_id, target_id, relationship_type)``, with position lists per
+relationship type, source asset class and both combined. A page then costs a
+bisect plus one step per returned edge. ``min_strength`` is answered from a
+range-maximum tree over each position list's strengths, built on first use, so
+runs of weaker edges are skipped in O(log E) instead of being scanned.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from src.logic.asset_graph import AssetRelationshipGraph
+
+from .graph_version_cache import GraphVersionCache
+
+EdgeKey = tuple[str, str, str]
+IndexedEdge = tuple[str, str, str, float]
+
+_EMPTY_POSITIONS: Sequence[int] = ()
+
+
+class InvalidRelationshipCursorError(ValueError):
+    """Raised when a relationship pagination cursor cannot be decoded."""
+
+
+def _edge_key(edge: IndexedEdge) -> EdgeKey:
+    """Return the ``(source_id, target_id, relationship_type)`` ordering key of an edge."""
+    return edge[0], edge[1], edge[2]
+
+
+def encode_relationship_cursor(key: EdgeKey) -> str:
+    """Return an opaque, URL-safe cursor resuming after the edge with ``key``."""
+    payload = json.dumps(list(key), separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_relationship_cursor(cursor: str) -> EdgeKey:
+    """
+    Decode a cursor produced by `encode_relationship_cursor`.
+
+    Raises:
+        InvalidRelationshipCursorError: If the cursor is not a well-formed encoded edge key.
+    """
+    try:
+        key = json.loads(base64.b64decode(cursor.encode("ascii"), altchars=b"-_", validate=True))
+    except (UnicodeError, binascii.Error, ValueError) as exc:
+        raise InvalidRelationshipCursorError("Invalid relationship cursor") from exc
+    if not isinstance(key, list) or len(key) != 3 or not all(isinstance(part, str) for part in key):
+        raise InvalidRelationshipCursorError("Invalid relationship cursor")
+    return key[0], key[1], key[2]
+
+
+class _StrengthMaxTree:
+    """Range-maximum tree over the strengths of one position list, in list order."""
+
+    __slots__ = ("count", "maxima", "size")
+
+    def __init__(self, strengths: Sequence[float]) -> None:
+        """Build the tree bottom-up; padding leaves hold -inf so they never match."""
+        size = 1
+        while size < len(strengths):
+            size *= 2
+        maxima = array("d", [-math.inf]) * (2 * size)
+        maxima[size : size + len(strengths)] = array("d", strengths)
+        for node in range(size - 1, 0, -1):
+            maxima[node] = max(maxima[2 * node], maxima[2 * node + 1])
+        self.count = len(strengths)
+        self.size = size
+        self.maxima = maxima
+
+    def first_at_least(self, start: int, threshold: float) -> int:
+        """Return the first list index at or after ``start`` with strength >= ``threshold``, else ``count``."""
+        if start >= self.count:
+            return self.count
+        maxima = self.maxima
+        node = start + self.size
+        while maxima[node] < threshold:
+            # Climb past right children, then step to the next subtree on the right.
+            while node & 1:
+                node >>= 1
+            if node == 0:
+                return self.count
+            node += 1
+        while node < self.size:
+            node = 2 * node if maxima[2 * node] >= threshold else 2 * node + 1
+        return node - self.size
+
+
+@dataclass(frozen=True, slots=True)
+class SortedEdgeIndex:
+    """Edges in key order with per-filter position lists into that order."""
+
+    edges: list[IndexedEdge]
+    by_type: dict[str, array[int]]
+    by_source_class: dict[str, array[int]]
+    by_source_class_and_type: dict[tuple[str, str], array[int]]
+    _strength_trees: dict[tuple[str | None, str | None], _StrengthMaxTree] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_graph(cls, graph: AssetRelationshipGraph) -> SortedEdgeIndex:
+        """Sort every relationship of ``graph`` and partition the positions by filter value."""
+        # Keys are unique per graph, so plain tuple order equals key order.
+        edges = sorted(graph.iter_relationships())
+        asset_classes = {asset_id: asset.asset_class.value for asset_id, asset in graph.assets.items()}
+        by_type: dict[str, array[int]] = {}
+        by_source_class: dict[str, array[int]] = {}
+        by_source_class_and_type: dict[tuple[str, str], array[int]] = {}
+        for position, (source_id, _target_id, relationship_type, _strength) in enumerate(edges):
+            by_type.setdefault(relationship_type, array("q")).append(position)
+            asset_class = asset_classes.get(source_id)
+            if asset_class is None:
+                continue
+            by_source_class.setdefault(asset_class, array("q")).append(position)
+            by_source_class_and_type.setdefault((asset_class, relationship_type), array("q")).append(position)
+        return cls(
+            edges=edges,
+            by_type=by_type,
+            by_source_class=by_source_class,
+            by_source_class_and_type=by_source_class_and_type,
+        )
+
+    def _positions(self, relationship_type: str | None, source_asset_class: str | None) -> Sequence[int]:
+        """Return the ascending edge positions matching the indexed filters."""
+        if relationship_type is None and source_asset_class is None:
+            return range(len(self.edges))
+        if source_asset_class is None:
+            return self.by_type.get(relationship_type, _EMPTY_POSITIONS)
+        if relationship_type is None:
+            return self.by_source_class.get(source_asset_class, _EMPTY_POSITIONS)
+        return self.by_source_class_and_type.get((source_asset_class, relationship_type), _EMPTY_POSITIONS)
+
+    def _strength_tree(self, relationship_type: str | None, source_asset_class: str | None) -> _StrengthMaxTree:
+        """Return the strength tree for one filter combination, building it on first use."""
+        key = (relationship_type, source_asset_class)
+        tree = self._strength_trees.get(key)
+        if tree is None:
+            edges = self.edges
+            positions = self._positions(relationship_type, source_asset_class)
+            tree = self._strength_trees[key] = _StrengthMaxTree([edges[position][3] for position in positions])
+        return tree
+
+    def page(
+        self,
+        *,
+        limit: int,
+        after: EdgeKey | None = None,
+        relationship_type: str | None = None,
+        min_strength: float | None = None,
+        source_asset_class: str | None = None,
+    ) -> tuple[list[IndexedEdge], bool]:
+        """
+        Return up to ``limit`` matching edges ordered after ``after``.
+
+        Costs a bisect plus O(log E) per returned edge, including with ``min_strength``.
+
+        Parameters:
+            limit (int): Maximum number of edges to return.
+            after (EdgeKey | None): Key of the last edge of the previous page. The key need
+                not exist in this index, so cursors survive graph changes.
+            relationship_type (str | None): Keep only edges of this type.
+            min_strength (float | None): Keep only edges with at least this strength.
+            source_asset_class (str | None): Keep only edges whose source asset has this class.
+
+        Returns:
+            tuple[list[IndexedEdge], bool]: The page and whether more matching edges follow it.
+        """
+        positions = self._positions(relationship_type, source_asset_class)
+        start = 0
+        if after is not None:
+            start = bisect_left(positions, bisect_right(self.edges, after, key=_edge_key))
+        page: list[IndexedEdge] = []
+        if min_strength is None:
+            for index in range(start, len(positions)):
+                if len(page) == limit:
+                    return page, True
+                page.append(self.edges[positions[index]])
+            return page, False
+        tree = self._strength_tree(relationship_type, source_asset_class)
+        index = tree.first_at_least(start, min_strength)
+        while index < len(positions):
+            if len(page) == limit:
+                return page, True
+            page.append(self.edges[positions[index]])
+            index = tree.first_at_least(index + 1, min_strength)
+        return page, False
+
+
+_sorted_edge_indexes: GraphVersionCache[SortedEdgeIndex] = GraphVersionCache()
+
+
+def sorted_edge_index(graph: AssetRelationshipGraph) -> SortedEdgeIndex:
+    """Return the edge index for the current version of ``graph``, building it on first use."""
+    return _sorted_edge_indexes.get_or_build(graph, SortedEdgeIndex.from_graph)
@@ -0,0 +1,71 @@
+"""Per-graph caches of values derived from one graph version.
+
+Derived indexes are keyed on the graph object through a ``WeakKeyDictionary``, like
+the runtime publication bindings in `relationship_index`, so a graph replaced by a
+sync or rebuild is released together with everything built from it. Each graph keeps
+only the values built for its current version.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+from src.logic.asset_graph import AssetRelationshipGraph
+
+T = TypeVar("T")
+
+
+class GraphVersionCache(Generic[T]):  # noqa: UP046
+    """Values derived from a graph, stored per graph object for its current version only."""
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._entries: WeakKeyDictionary[AssetRelationshipGraph, tuple[int, dict[Hashable, T]]] = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def get_or_build(
+        self,
+        graph: AssetRelationshipGraph,
+        build: Callable[[AssetRelationshipGraph], T],
+        variant: Hashable = None,
+    ) -> T:
+        """
+        Return the value for ``graph``'s current version and ``variant``, building it on a miss.
+
+        ``build`` runs outside the lock and must not keep a reference to ``graph``, or the
+        entry would keep its own key alive. Values built for an older version are dropped
+        when the first value for a newer version is stored.
+
+        Parameters:
+            graph (AssetRelationshipGraph): Graph the value is derived from.
+            build (Callable[[AssetRelationshipGraph], T]): Builds the value from ``graph``.
+            variant (Hashable): Distinguishes values built with different options.
+        """
+        version = graph.version
+        with self._lock:
+            entry = self._entries.get(graph)
+            if entry is not None and entry[0] == version and variant in entry[1]:
+                return entry[1][variant]
+
+        value = build(graph)
+
+        with self._lock:
+            entry = self._entries.get(graph)
+            if entry is None or entry[0] < version:
+                entry = self._entries[graph] = (version, {})
+            if entry[0] == version:
+                entry[1][variant] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of graphs with cached values."""
+        with self._lock:
+            return len(self._entries)
@@ -13,13 +13,13 @@ from weakref import WeakKeyDictionary
 from fastapi import HTTPException, status
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy import select
-from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.data.database import create_engine_from_url, create_session_factory
+from src.data.database import claim_shared_engine, dispose_shared_engine, get_shared_session_factory
 from src.data.relationship_assertion_db_models import (
     RelationshipAssertionORM,
+    RelationshipProjectionEdgeORM,
 )
 from src.data.relationship_assertion_repository import PublishedProjectionRevision, RelationshipAssertionRepository
 from src.data.relationship_projection_persistence import PersistedProjectionRevision
@@ -37,15 +37,20 @@ from ..graph_lifecycle_providers import (
     resolve_durable_graph_persistence_url,
     resolve_hosted_graph_database_url,
 )
+from .response_cache import invalidate_graph_response_cache
+from .snapshot_store import governed_snapshot_store
 
 _GRAC_CURRENT_PURPOSE = "financial_graph_current_view"
 _GRAPH_PERSISTENCE_MISCONFIGURED_DETAIL = "Graph persistence database is misconfigured"
 _GRAPH_PERSISTENCE_UNAVAILABLE_DETAIL = "Graph persistence database is unavailable"
 _GRAPH_PUBLICATION_INCONSISTENT_DETAIL = "Graph publication metadata is inconsistent"
 _IN_CLAUSE_CHUNK_SIZE = 400
+_GOVERNANCE_ENGINE_USER = "governance"
+_JOIN_YIELD_PER = 5000
 _cache_generation_lock = Lock()
 _persistence_runtime_lock = Lock()
 _runtime_graph_bindings_lock = Lock()
+_publication_bindings_lock = Lock()
 
 
 class _CacheGeneration:
@@ -56,17 +61,19 @@ class _CacheGeneration:
 
 
 class _PersistenceRuntime:
-    """Reusable URL-scoped engine and session factory for governance reads."""
+    """URL-scoped session factory for governance reads, taken from the shared engine registry."""
 
     def __init__(self) -> None:
         self.url: str | None = None
-        self.engine: Engine | None = None
         self.session_factory: sessionmaker[Session] | None = None
 
 
 _cache_generation = _CacheGeneration()
 _persistence_runtime = _PersistenceRuntime()
 _runtime_graph_bindings: WeakKeyDictionary[AssetRelationshipGraph, str | None] = WeakKeyDictionary()
+# rebuild_job_id -> (revision_id, publication_id); only found bindings are kept, so a
+# pending publication is re-checked on every read until it appears.
+_publication_bindings: dict[str, tuple[str, str]] = {}
 
 
 class GovernanceMetadata(TypedDict):
@@ -126,6 +133,11 @@ def _current_cache_generation() -> int:
         return _cache_generation.value
 
 
+def governed_relationship_cache_generation() -> int:
+    """Return the cache generation that derived response caches key on."""
+    return _current_cache_generation()
+
+
 @lru_cache(maxsize=1)
 def _load_contract_predicates() -> PredicatesDocument:
     """Load validated predicates once from the immutable pinned contract bundle."""
@@ -141,26 +153,33 @@ def _resolve_governance_persistence_url() -> str:
 
 
 def _session_factory_for_url(persistence_url: str) -> sessionmaker[Session]:
-    """Reuse one engine/session factory until the configured URL changes."""
+    """
+    Return the shared session factory for ``persistence_url``, dropping derived caches when the URL changes.
+
+    The engine for the previous URL is disposed once no other subsystem claims it.
+    """
     with _persistence_runtime_lock:
         if _persistence_runtime.url == persistence_url and _persistence_runtime.session_factory is not None:
             return _persistence_runtime.session_factory
 
-        engine = create_engine_from_url(persistence_url)
-        session_factory = create_session_factory(engine)
-        previous_engine = _persistence_runtime.engine
-
+        session_factory = get_shared_session_factory(persistence_url)
         _persistence_runtime.url = persistence_url
-        _persistence_runtime.engine = engine
         _persistence_runtime.session_factory = session_factory
+        unused_url = claim_shared_engine(_GOVERNANCE_ENGINE_USER, persistence_url)
+        _clear_publication_bindings()
         _load_governed_relationship_snapshot.cache_clear()
-        _load_bound_governed_relationship_snapshot.cache_clear()
+        governed_snapshot_store.clear()
         _load_governed_relationship_index.cache_clear()
-        _load_bound_governed_relationship_index.cache_clear()
+        invalidate_graph_response_cache()
+    if unused_url is not None:
+        dispose_shared_engine(unused_url)
+    return session_factory
 
-        if previous_engine is not None:
-            previous_engine.dispose()
-        return session_factory
+
+def _clear_publication_bindings() -> None:
+    """Forget every cached rebuild-job publication binding."""
+    with _publication_bindings_lock:
+        _publication_bindings.clear()
 
 
 def _governance_session_factory() -> sessionmaker[Session]:
@@ -169,20 +188,20 @@ def _governance_session_factory() -> sessionmaker[Session]:
 
 
 def _reset_governance_persistence_runtime() -> None:
-    """Dispose and clear the reusable persistence runtime for tests or reconfiguration."""
+    """Forget the governance session factory and derived caches for tests or reconfiguration."""
     with _persistence_runtime_lock:
-        engine = _persistence_runtime.engine
         _persistence_runtime.url = None
-        _persistence_runtime.engine = None
         _persistence_runtime.session_factory = None
-        if engine is not None:
-            engine.dispose()
+        unused_url = claim_shared_engine(_GOVERNANCE_ENGINE_USER, None)
+    if unused_url is not None:
+        dispose_shared_engine(unused_url)
     with _runtime_graph_bindings_lock:
         _runtime_graph_bindings.clear()
+    _clear_publication_bindings()
     _load_governed_relationship_snapshot.cache_clear()
-    _load_bound_governed_relationship_snapshot.cache_clear()
+    governed_snapshot_store.clear()
     _load_governed_relationship_index.cache_clear()
-    _load_bound_governed_relationship_index.cache_clear()
+    invalidate_graph_response_cache()
 
 
 def _assertion_predicates_for_edges(
@@ -190,10 +209,23 @@ def _assertion_predicates_for_edges(
     published: PersistedProjectionRevision,
 ) -> dict[str, str]:
     """Load the exact predicate owner for every assertion referenced by the revision."""
-    assertion_ids = sorted({edge.assertion_id for edge in published.revision.edges})
+    assertion_ids = {edge.assertion_id for edge in published.revision.edges}
     if not assertion_ids:
         return {}
 
+    if session.get_bind().dialect.name == "sqlite":
+        assertion_predicates = _assertion_predicates_by_id_chunks(session, sorted(assertion_ids))
+    else:
+        assertion_predicates = _assertion_predicates_by_revision_join(session, published)
+
+    missing = sorted(assertion_ids - assertion_predicates.keys())
+    if missing:
+        raise ValidationError(f"published projection references missing assertions: {missing}")
+    return assertion_predicates
+
+
+def _assertion_predicates_by_id_chunks(session: Session, assertion_ids: list[str]) -> dict[str, str]:
+    """Resolve assertion predicates with one bounded ``IN`` query per id chunk."""
     assertion_predicates: dict[str, str] = {}
     for start in range(0, len(assertion_ids), _IN_CLAUSE_CHUNK_SIZE):
         assertion_id_chunk = assertion_ids[start : start + _IN_CLAUSE_CHUNK_SIZE]
@@ -208,10 +240,33 @@ def _assertion_predicates_for_edges(
         )
         for assertion_id, predicate_id in rows:
             assertion_predicates[assertion_id] = predicate_id
+    return assertion_predicates
 
-    missing = sorted(set(assertion_ids) - assertion_predicates.keys())
-    if missing:
-        raise ValidationError(f"published projection references missing assertions: {missing}")
+
+def _assertion_predicates_by_revision_join(
+    session: Session,
+    published: PersistedProjectionRevision,
+) -> dict[str, str]:
+    """Resolve assertion predicates by joining the revision's stored edges to their assertions.
+
+    One server-side query streams ``(edge_id, predicate_id)`` rows in batches, so
+    revisions with many edges cost a single round trip instead of one per id chunk.
+    """
+    assertion_by_edge_id = {
+        edge_id: edge.assertion_id for edge_id, edge in zip(published.edge_ids, published.revision.edges, strict=True)
+    }
+    rows = session.execute(
+        select(RelationshipProjectionEdgeORM.id, RelationshipAssertionORM.predicate_id)
+        .join(RelationshipAssertionORM, RelationshipAssertionORM.id == RelationshipProjectionEdgeORM.assertion_id)
+        .where(RelationshipProjectionEdgeORM.revision_id == published.revision_id)
+        .execution_options(yield_per=_JOIN_YIELD_PER)
+    ).tuples()
+    assertion_predicates: dict[str, str] = {}
+    for edge_id, predicate_id in rows:
+        assertion_id = assertion_by_edge_id.get(edge_id)
+        if assertion_id is None:
+            raise ValidationError(f"stored projection edge {edge_id} is not part of the published revision")
+        assertion_predicates[assertion_id] = predicate_id
     return assertion_predicates
 
 
@@ -417,6 +472,53 @@ def _published_projection_binding_for_rebuild_job_from_persistence(
         ) from exc
 
 
+def _published_projection_binding_for_rebuild_job(rebuild_job_id: str) -> tuple[str, str] | None:
+    """Return the publication bound to one rebuild job, from the process cache when known.
+
+    A succeeded rebuild job's publication binding never changes once written, so a found
+    binding is kept until the next publication write or persistence reset. A missing
+    binding is not cached and keeps failing closed until it is published.
+    """
+    with _publication_bindings_lock:
+        binding = _publication_bindings.get(rebuild_job_id)
+    if binding is not None:
+        return binding
+    binding = _published_projection_binding_for_rebuild_job_from_persistence(rebuild_job_id)
+    if binding is not None:
+        with _publication_bindings_lock:
+            _publication_bindings[rebuild_job_id] = binding
+    return binding
+
+
+def prime_publication_binding_for_rebuild_job(rebuild_job_id: str) -> None:
+    """Cache the publication binding of a newly synchronized rebuild job ahead of the first read.
+
+    Raises:
+        HTTPException: With status 503 if persistence is misconfigured, unavailable, or
+            holds inconsistent publication metadata.
+    """
+    _published_projection_binding_for_rebuild_job(rebuild_job_id)
+
+
+def warm_governed_snapshot_for_rebuild_job(rebuild_job_id: str) -> bool:
+    """Build and store the governed snapshot of a rebuild job's publication ahead of its first read.
+
+    Returns:
+        bool: True if the job has a publication and its snapshot is now stored, False
+            while the publication is still pending.
+
+    Raises:
+        HTTPException: With status 503 if persistence is misconfigured, unavailable, or
+            holds inconsistent publication metadata.
+    """
+    binding = _published_projection_binding_for_rebuild_job(rebuild_job_id)
+    if binding is None:
+        return False
+    revision_id, publication_id = binding
+    _load_bound_governed_relationship_snapshot(revision_id, publication_id)
+    return True
+
+
 def _load_governed_relationship_snapshot_for_publication(
     revision_id: str,
     publication_id: str,
@@ -528,14 +630,16 @@ def _load_governed_relationship_snapshot(
     return _load_governed_relationship_snapshot_from_persistence()
 
 
-@lru_cache(maxsize=8)
 def _load_bound_governed_relationship_snapshot(
     revision_id: str,
     publication_id: str,
-    _generation: int,
 ) -> PublishedRelationshipSnapshot:
-    """Load one immutable publication snapshot and cache generation."""
-    return _load_governed_relationship_snapshot_for_publication(revision_id, publication_id)
+    """Return one immutable publication snapshot from the byte-bounded snapshot store."""
+    return governed_snapshot_store.get_or_load(
+        revision_id,
+        publication_id,
+        lambda: _load_governed_relationship_snapshot_for_publication(revision_id, publication_id),
+    )
 
 
 @lru_cache(maxsize=4)
@@ -547,16 +651,6 @@ def _load_governed_relationship_index(
     return _load_governed_relationship_snapshot(graph, generation).governance_index
 
 
-@lru_cache(maxsize=8)
-def _load_bound_governed_relationship_index(
-    revision_id: str,
-    publication_id: str,
-    generation: int,
-) -> GovernedRelationshipIndex:
-    """Backward-compatible bound index cache wrapper for existing tests/callers."""
-    return _load_bound_governed_relationship_snapshot(revision_id, publication_id, generation).governance_index
-
-
 def load_governed_relationship_snapshot(graph: AssetRelationshipGraph) -> PublishedRelationshipSnapshot:
     """Return publication envelope, governed index, and persisted edge bindings for ``graph``."""
     managed, rebuild_job_id = _runtime_graph_publication_binding(graph)
@@ -576,7 +670,7 @@ def load_governed_relationship_snapshot(graph: AssetRelationshipGraph) -> Publis
             pass
         return PublishedRelationshipSnapshot(publication=None, governance_index={}, projection_bindings={})
 
-    binding = _published_projection_binding_for_rebuild_job_from_persistence(rebuild_job_id)
+    binding = _published_projection_binding_for_rebuild_job(rebuild_job_id)
 
     if binding is None:
         raise HTTPException(
@@ -586,19 +680,15 @@ def load_governed_relationship_snapshot(graph: AssetRelationshipGraph) -> Publis
 
     revision_id, publication_id = binding
 
-    return _load_bound_governed_relationship_snapshot(
-        revision_id,
-        publication_id,
-        generation,
-    )
+    return _load_bound_governed_relationship_snapshot(revision_id, publication_id)
 
 
 def load_governed_relationship_index(graph: AssetRelationshipGraph) -> GovernedRelationshipIndex:
     """Return governance metadata consistent with the supplied graph snapshot.
 
     Lifecycle-managed graphs are bound to the rebuild job that produced them.
-    Every read checks the shared latest publication version before consulting the
-    expensive metadata cache. If this process has not synchronized that publication,
+    Every read resolves that job's publication, from the process binding cache once it
+    has been published, before consulting the expensive metadata cache. If this process has not synchronized that publication,
     the read fails closed instead of returning stale or misattributed provenance.
     Managed startup graphs with no governed publication binding omit optional
     governance metadata. Unmanaged graph objects retain the legacy path used by
@@ -607,11 +697,34 @@ def load_governed_relationship_index(graph: AssetRelationshipGraph) -> GovernedR
     return load_governed_relationship_snapshot(graph).governance_index
 
 
-def invalidate_governed_relationship_index_cache() -> None:
-    """Advance the cache generation and clear entries after publication writes."""
+def _advance_cache_generation() -> None:
+    """Advance the cache generation and drop the latest-publication snapshots of unmanaged graphs."""
     with _cache_generation_lock:
         _cache_generation.value += 1
         _load_governed_relationship_snapshot.cache_clear()
-        _load_bound_governed_relationship_snapshot.cache_clear()
         _load_governed_relationship_index.cache_clear()
-        _load_bound_governed_relationship_index.cache_clear()
+
+
+def invalidate_governed_relationship_index_cache() -> None:
+    """Advance the cache generation and forget every publication binding, snapshot and rendered response.
+
+    This is the full reset for reconfiguration and tests. Publication writes call
+    `invalidate_governed_publication_snapshot` instead, which leaves the bindings and
+    snapshots of other, immutable publications in place.
+    """
+    _advance_cache_generation()
+    _clear_publication_bindings()
+    governed_snapshot_store.clear()
+    invalidate_graph_response_cache()
+
+
+def invalidate_governed_publication_snapshot(publication_id: str) -> None:
+    """Account for one newly written publication.
+
+    Drops any stored snapshot of ``publication_id``, advances the cache generation so
+    unmanaged graphs re-read the latest publication, and clears rendered responses.
+    Bindings of already-published rebuild jobs never change and are kept.
+    """
+    governed_snapshot_store.invalidate_publication(publication_id)
+    _advance_cache_generation()
+    invalidate_graph_response_cache()
@@ -0,0 +1,161 @@
+"""Pre-serialized JSON bodies for graph read endpoints.
+
+Graph-derived payloads only change when the graph, its publication binding or the
+governed relationship index cache generation changes. Bodies are cached as JSON
+bytes under a key built from those values, so repeat reads skip graph traversal
+and Pydantic validation entirely. Keys refer to the graph through a weak reference,
+so a replaced graph is not kept alive by its cached bodies, and each endpoint has its
+own LRU bound, so a client cycling through query parameters of one endpoint cannot
+evict the bodies of another.
+
+Each body carries a strong ETag. Clients that send it back in ``If-None-Match``
+get ``304 Not Modified`` until the graph version or publication changes the body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from threading import Lock
+
+from fastapi import Response
+
+_MAX_CACHED_RESPONSES = 16
+_CACHE_CONTROL = "no-cache"
+
+GraphResponseKey = tuple[Hashable, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedGraphResponse:
+    """A serialized JSON body and its strong entity tag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> RenderedGraphResponse:
+        """
+        Wrap ``body`` with an ETag derived from its SHA-256 digest.
+
+        Hashing the bytes rather than formatting the graph version keeps tags unique across
+        graph replacements and process restarts, where in-memory versions start over.
+        """
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()}"')
+
+
+class GraphResponseCache:
+    """LRU maps of graph response keys to rendered JSON bodies, bounded per endpoint."""
+
+    def __init__(self, max_entries: int = _MAX_CACHED_RESPONSES) -> None:
+        """Create an empty cache holding at most ``max_entries`` bodies for each endpoint."""
+        # endpoint (first key element) -> LRU of that endpoint's bodies
+        self._entries: dict[Hashable, OrderedDict[GraphResponseKey, RenderedGraphResponse]] = {}
+        self._lock = Lock()
+        self._max_entries = max_entries
+        self._epoch = 0
+
+    def get_or_render(self, key: GraphResponseKey, render: Callable[[], bytes]) -> RenderedGraphResponse:
+        """
+        Return the cached response for ``key``, rendering and storing it on a miss.
+
+        The first element of ``key`` names the endpoint; only bodies of the same endpoint
+        compete for its ``max_entries`` slots. ``render`` runs outside the lock. A body
+        rendered while `clear` ran is returned to its caller but not stored, so an
+        invalidation is never undone by a slow render. Exceptions from ``render``
+        propagate and leave the cache unchanged.
+        """
+        with self._lock:
+            entries = self._entries.get(key[0])
+            rendered = entries.get(key) if entries is not None else None
+            if rendered is not None:
+                entries.move_to_end(key)
+                return rendered
+            epoch = self._epoch
+
+        rendered = RenderedGraphResponse.from_body(render())
+
+        with self._lock:
+            if epoch == self._epoch:
+                entries = self._entries.setdefault(key[0], OrderedDict())
+                entries[key] = rendered
+                entries.move_to_end(key)
+                while len(entries) > self._max_entries:
+                    entries.popitem(last=False)
+        return rendered
+
+    def clear(self) -> None:
+        """Drop every cached body."""
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+
+    def __len__(self) -> int:
+        """Return the number of cached bodies across all endpoints."""
+        with self._lock:
+            return sum(len(entries) for entries in self._entries.values())
+
+
+graph_response_cache = GraphResponseCache()
+
+
+def graph_response_key(
+    endpoint: str,
+    graph: object,
+    graph_version: int,
+    publication_id: str | None = None,
+    cache_generation: int = 0,
+    variant: Hashable = None,
+) -> GraphResponseKey:
+    """
+    Return the cache key for one endpoint rendering of one graph and publication state.
+
+    Parameters:
+        endpoint: Endpoint name; bodies are bounded per endpoint.
+        graph: Graph the body is rendered from, held only through a weak reference.
+        graph_version: Mutation version of ``graph``.
+        publication_id: Publication whose governance metadata the body carries, if any.
+        cache_generation: Governed relationship index cache generation.
+        variant: Query parameters that change the body within one endpoint.
+    """
+    return (endpoint, weakref.ref(graph), graph_version, publication_id, cache_generation, variant)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header matches ``etag`` under weak comparison."""
+    if not if_none_match:
+        return False
+    candidates = (candidate.strip().removeprefix("W/") for candidate in if_none_match.split(","))
+    return any(candidate in ("*", etag) for candidate in candidates)
+
+
+def cached_json_response(
+    key: GraphResponseKey,
+    render: Callable[[], bytes],
+    if_none_match: str | None = None,
+) -> Response:
+    """
+    Return a JSON response whose body comes from the shared graph response cache.
+
+    Parameters:
+        key: Cache key from `graph_response_key`.
+        render: Callable producing the JSON body on a cache miss.
+        if_none_match: Raw ``If-None-Match`` request header, if any.
+
+    Returns:
+        Response: ``200`` with the body, or an empty ``304 Not Modified`` when the client
+            already holds the current ETag. Both carry ``ETag`` and ``Cache-Control: no-cache``.
+    """
+    rendered = graph_response_cache.get_or_render(key, render)
+    headers = {"ETag": rendered.etag, "Cache-Control": _CACHE_CONTROL}
+    if _etag_matches(if_none_match, rendered.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
+
+
+def invalidate_graph_response_cache() -> None:
+    """Drop all cached graph responses after the active graph or its publication changes."""
+    graph_response_cache.clear()
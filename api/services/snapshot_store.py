@@ -0,0 +1,138 @@
+"""Byte-bounded store of governed relationship snapshots keyed by publication.
+
+A publication and its revision never change once written, so a snapshot built for
+``(revision_id, publication_id)`` stays valid until that publication is explicitly
+invalidated or persistence is reconfigured. Entries are evicted least recently used
+first once their estimated size exceeds the byte budget, so workers serving several
+publications during a rollout keep all of them warm instead of rebuilding from SQL.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from ..metrics import (
+    record_governed_snapshot_evictions,
+    record_governed_snapshot_lookup,
+    update_governed_snapshot_size,
+)
+
+if TYPE_CHECKING:
+    from .relationship_index import PublishedRelationshipSnapshot
+
+_DEFAULT_MAX_SNAPSHOT_BYTES = 256 * 1024 * 1024
+# Approximate per-entry container overhead beyond the strings it references.
+_INDEX_ENTRY_OVERHEAD_BYTES = 200
+_BINDING_OVERHEAD_BYTES = 120
+
+SnapshotKey = tuple[str, str]
+
+
+def estimate_snapshot_bytes(snapshot: PublishedRelationshipSnapshot) -> int:
+    """
+    Estimate the memory held by ``snapshot``.
+
+    Counts the index and binding containers, the strings of every runtime key and the
+    per-edge identifiers. Metadata shared by a forward and reverse key is counted once
+    per key, which slightly overestimates bidirectional edges.
+    """
+    total = sys.getsizeof(snapshot.governance_index) + sys.getsizeof(snapshot.projection_bindings)
+    for key, metadata in snapshot.governance_index.items():
+        total += _INDEX_ENTRY_OVERHEAD_BYTES + sum(map(sys.getsizeof, key)) + sys.getsizeof(metadata["assertion_id"])
+    for binding in snapshot.projection_bindings.values():
+        total += _BINDING_OVERHEAD_BYTES + sys.getsizeof(binding.projection_edge_id)
+    return total
+
+
+class GovernedSnapshotStore:
+    """LRU map of ``(revision_id, publication_id)`` to snapshots, bounded by estimated bytes."""
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_SNAPSHOT_BYTES) -> None:
+        """Create an empty store holding at most ``max_bytes`` of estimated snapshot memory."""
+        self._entries: OrderedDict[SnapshotKey, tuple[PublishedRelationshipSnapshot, int]] = OrderedDict()
+        self._lock = Lock()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._epoch = 0
+
+    def get_or_load(
+        self,
+        revision_id: str,
+        publication_id: str,
+        load: Callable[[], PublishedRelationshipSnapshot],
+    ) -> PublishedRelationshipSnapshot:
+        """
+        Return the snapshot for one publication, loading and storing it on a miss.
+
+        ``load`` runs outside the lock. A snapshot loaded while `clear` or
+        `invalidate_publication` ran is returned but not stored. The newest snapshot is
+        kept even when it alone exceeds the budget, so one oversized publication is not
+        rebuilt on every read. Exceptions from ``load`` propagate and store nothing.
+        """
+        key = (revision_id, publication_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            epoch = self._epoch
+        if entry is not None:
+            record_governed_snapshot_lookup("hit")
+            return entry[0]
+        record_governed_snapshot_lookup("miss")
+
+        snapshot = load()
+        size = estimate_snapshot_bytes(snapshot)
+
+        with self._lock:
+            if epoch != self._epoch:
+                return snapshot
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (snapshot, size)
+            self._bytes += size
+            evicted = 0
+            while self._bytes > self._max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                evicted += 1
+            stored_bytes, stored_entries = self._bytes, len(self._entries)
+        if evicted:
+            record_governed_snapshot_evictions(evicted)
+        update_governed_snapshot_size(stored_bytes, stored_entries)
+        return snapshot
+
+    def invalidate_publication(self, publication_id: str) -> None:
+        """Drop the snapshot of one publication, for any revision."""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == publication_id]:
+                self._bytes -= self._entries.pop(key)[1]
+            self._epoch += 1
+            stored_bytes, stored_entries = self._bytes, len(self._entries)
+        update_governed_snapshot_size(stored_bytes, stored_entries)
+
+    def clear(self) -> None:
+        """Drop every snapshot."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._epoch += 1
+        update_governed_snapshot_size(0, 0)
+
+    @property
+    def size_bytes(self) -> int:
+        """Return the estimated bytes currently held."""
+        with self._lock:
+            return self._bytes
+
+    def __len__(self) -> int:
+        """Return the number of stored snapshots."""
+        with self._lock:
+            return len(self._entries)
+
+
+governed_snapshot_store = GovernedSnapshotStore()
@@ -22,6 +22,9 @@ _INTEGER_ENV_FIELDS = frozenset(
         "rebuild_lock_ttl_seconds",
         "slo_rebuild_duration_max_seconds",
         "gradio_port",
+        "database_pool_size",
+        "database_max_overflow",
+        "database_pool_recycle_seconds",
         _POSTGRES_REQUEST_STATEMENT_TIMEOUT_FIELD,
     }
 )
@@ -140,6 +143,21 @@ class Settings(BaseModel):
         default=120_000,
         description="Server-side statement timeout for ordinary PostgreSQL request connections",
     )
+    database_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Connections kept open per database URL by the shared engine registry",
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Connections opened beyond the pool size under load, per database URL",
+    )
+    database_pool_recycle_seconds: int = Field(
+        default=1800,
+        ge=-1,
+        description="Age in seconds (at least 1) after which pooled connections are replaced; -1 disables recycling",
+    )
 
     # UI Configuration
     gradio_host: str = Field(default="127.0.0.1")
@@ -172,6 +190,9 @@ class Settings(BaseModel):
         "slo_evaluation_interval_seconds",
         "gradio_port",
         "postgres_request_statement_timeout_milliseconds",
+        "database_pool_size",
+        "database_max_overflow",
+        "database_pool_recycle_seconds",
         mode="before",
     )
     @classmethod
@@ -231,6 +252,14 @@ class Settings(BaseModel):
             )
         return value
 
+    @field_validator("database_pool_recycle_seconds")
+    @classmethod
+    def validate_pool_recycle(cls, value: int) -> int:
+        """Reject 0, which SQLAlchemy would treat as recycling every connection on checkout."""
+        if value == 0:
+            raise ValueError("DATABASE_POOL_RECYCLE_SECONDS must be -1 or at least 1.")
+        return value
+
     @property
     def allowed_origins(self) -> list[str]:
         """Return CORS allowed origins as a list."""
@@ -249,8 +278,8 @@ def load_settings() -> Settings:
     Load runtime settings from environment variables and return a configured Settings instance.
 
     Reads environment variables (for example: ENV, VERCEL_ENV, LOG_LEVEL, SECRET_KEY, DATABASE_URL,
-    POSTGRES_URL, COORDINATION_DATABASE_URL, POSTGRES_REQUEST_STATEMENT_TIMEOUT_MILLISECONDS, ALLOWED_ORIGINS,
-    REBUILD_LOCK_TTL_SECONDS)
+    POSTGRES_URL, COORDINATION_DATABASE_URL, POSTGRES_REQUEST_STATEMENT_TIMEOUT_MILLISECONDS, DATABASE_POOL_SIZE,
+    DATABASE_MAX_OVERFLOW, DATABASE_POOL_RECYCLE_SECONDS, ALLOWED_ORIGINS, REBUILD_LOCK_TTL_SECONDS)
     and maps them to Settings fields, delegating type coercion and validation to Pydantic.
     REBUILD_LOCK_TTL_SECONDS is passed unchanged for field-level parsing. DATABASE_URL
     falls back to POSTGRES_URL when unset; COORDINATION_DATABASE_URL falls back to
@@ -285,6 +314,9 @@ def load_settings() -> Settings:
         coordination_database_url=os.getenv("COORDINATION_DATABASE_URL") or os.getenv("DATABASE_URL") or postgres_url,
         postgres_url=postgres_url,
         postgres_request_statement_timeout_milliseconds=postgres_request_statement_timeout_milliseconds,
+        database_pool_size=os.getenv("DATABASE_POOL_SIZE"),  # type: ignore[arg-type]
+        database_max_overflow=os.getenv("DATABASE_MAX_OVERFLOW"),  # type: ignore[arg-type]
+        database_pool_recycle_seconds=os.getenv("DATABASE_POOL_RECYCLE_SECONDS"),  # type: ignore[arg-type]
         gradio_host=os.getenv("GRADIO_HOST", "127.0.0.1"),
         gradio_port=os.getenv("GRADIO_SERVER_PORT", os.getenv("GRADIO_PORT", "7860")),  # type: ignore[arg-type]
         frontend_port=os.getenv("FRONTEND_PORT", "3000"),  # type: ignore[arg-type]
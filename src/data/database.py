@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from threading import Lock
+from typing import Any
 
 from sqlalchemy import (
     CheckConstraint,
@@ -167,7 +169,14 @@ def configure_sqlite_engine(engine: Engine) -> Engine:
 _configure_sqlite_engine = configure_sqlite_engine
 
 
-def create_engine_from_url(url: str | None = None) -> Engine:
+def create_engine_from_url(
+    url: str | None = None,
+    *,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool = False,
+) -> Engine:
     """
     Resolve a database URL and create a SQLAlchemy Engine for the asset store.
 
@@ -179,9 +188,16 @@ def create_engine_from_url(url: str | None = None) -> Engine:
     query ``mode=memory``), the engine uses ``check_same_thread=False`` and
     ``StaticPool``.
 
+    Pool options apply to server backends only; SQLite engines keep their
+    default or static pool. Omitted options keep SQLAlchemy's defaults.
+
     Parameters:
         url: Optional database URL. None uses settings; empty string uses the
             default file-based SQLite URL.
+        pool_size: Connections kept open in the pool.
+        max_overflow: Connections allowed beyond ``pool_size`` under load.
+        pool_recycle: Seconds after which a pooled connection is replaced.
+        pool_pre_ping: Test each connection on checkout and replace it if stale.
 
     Returns:
         Engine configured for the resolved URL, including SQLite in-memory
@@ -231,7 +247,14 @@ def create_engine_from_url(url: str | None = None) -> Engine:
             )
         )
 
-    return create_engine(resolved_url, future=True)
+    pool_options: dict[str, Any] = {"pool_pre_ping": pool_pre_ping}
+    if pool_size is not None:
+        pool_options["pool_size"] = pool_size
+    if max_overflow is not None:
+        pool_options["max_overflow"] = max_overflow
+    if pool_recycle is not None:
+        pool_options["pool_recycle"] = pool_recycle
+    return create_engine(resolved_url, future=True, **pool_options)
 
 
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
@@ -255,6 +278,119 @@ def create_session_factory(engine: Engine) -> sessionmaker[Session]:
     )
 
 
+_shared_engines: dict[str, tuple[Engine, sessionmaker[Session]]] = {}
+# user name -> URL it currently reads and writes through; see `claim_shared_engine`.
+_shared_engine_users: dict[str, str] = {}
+_shared_engines_lock = Lock()
+
+
+def _shared_engine_entry(url: str) -> tuple[Engine, sessionmaker[Session]]:
+    """Return the registered engine and session factory for ``url``, creating them on first use."""
+    with _shared_engines_lock:
+        entry = _shared_engines.get(url)
+    if entry is not None:
+        return entry
+
+    # Engine construction (dialect import, pool setup) runs outside the lock so lookups
+    # for other URLs are not held up; a thread that loses the race disposes its engine.
+    settings = get_settings()
+    engine = create_engine_from_url(
+        url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_recycle=settings.database_pool_recycle_seconds,
+        pool_pre_ping=True,
+    )
+    created = (engine, create_session_factory(engine))
+    with _shared_engines_lock:
+        entry = _shared_engines.setdefault(url, created)
+    if entry is not created:
+        engine.dispose()
+    return entry
+
+
+def get_shared_engine(url: str) -> Engine:
+    """
+    Return the process-wide pooled engine for a database URL.
+
+    Long-lived callers (graph sync polling, rebuilds, governance reads and
+    assertion writes) share one engine per URL instead of creating and disposing
+    one per operation, so server connections are opened once and reused. Server
+    backends use ``DATABASE_POOL_SIZE``, ``DATABASE_MAX_OVERFLOW`` and
+    ``DATABASE_POOL_RECYCLE_SECONDS`` with pre-ping enabled. Callers must not
+    dispose the returned engine; use `dispose_shared_engine` or
+    `dispose_shared_engines` instead.
+
+    Parameters:
+        url: Resolved database URL; it is also the registry key.
+
+    Returns:
+        The engine registered for ``url``.
+    """
+    return _shared_engine_entry(url)[0]
+
+
+def get_shared_session_factory(url: str) -> sessionmaker[Session]:
+    """
+    Return the session factory bound to the shared engine for a database URL.
+
+    Parameters:
+        url: Resolved database URL; it is also the registry key.
+
+    Returns:
+        The session factory registered for ``url``.
+    """
+    return _shared_engine_entry(url)[1]
+
+
+def claim_shared_engine(user: str, url: str | None) -> str | None:
+    """
+    Record which shared engine URL a long-lived subsystem currently uses.
+
+    Parameters:
+        user: Stable name of the subsystem, such as ``"governance"``.
+        url: URL the subsystem uses from now on, or ``None`` when it stops using one.
+
+    Returns:
+        The URL ``user`` claimed before when it differs from ``url`` and no other user
+        still claims it, so the caller can pass it to `dispose_shared_engine`;
+        otherwise ``None``.
+    """
+    with _shared_engines_lock:
+        previous = _shared_engine_users.pop(user, None)
+        if url is not None:
+            _shared_engine_users[user] = url
+        if previous is None or previous == url or previous in _shared_engine_users.values():
+            return None
+        return previous
+
+
+def dispose_shared_engine(url: str) -> None:
+    """
+    Dispose and forget the shared engine for one URL, if one is registered.
+
+    Sessions already checked out keep their connections until they close; the next
+    lookup for ``url`` creates a fresh engine.
+
+    Parameters:
+        url: Resolved database URL whose engine should be released.
+    """
+    with _shared_engines_lock:
+        entry = _shared_engines.pop(url, None)
+    if entry is not None:
+        entry[0].dispose()
+
+
+def dispose_shared_engines() -> None:
+    """Dispose every registered engine and empty the registry, at shutdown or between tests."""
+    with _shared_engines_lock:
+        entries = list(_shared_engines.values())
+        _shared_engines.clear()
+        _shared_engine_users.clear()
+    for engine, _session_factory in entries:
+        engine.dispose()
+
+
 def init_db(engine: Engine) -> None:
     """
     Create database tables for all ORM models declared on Base.metadata.
@@ -22,6 +22,7 @@ from src.models.financial_models import (
     Equity,
     RegulatoryActivity,
     RegulatoryEvent,
+    trusted_construction,
 )
 from src.observability.events import ObservabilityEvent
 from src.observability.logger import log_event
@@ -1014,11 +1015,13 @@ def _deserialize_graph(payload: dict[str, Any]) -> AssetRelationshipGraph:
         corporate_bond_strength=settings.corporate_bond_strength,
     )
 
-    for asset_data in payload.get("assets", []):
-        graph.add_asset(_deserialize_asset(dict(asset_data)))
+    # The cache is written from validated models, so reloading skips per-instance validation.
+    with trusted_construction():
+        for asset_data in payload.get("assets", []):
+            graph.add_asset(_deserialize_asset(dict(asset_data)))
 
-    for event_data in payload.get("regulatory_events", []):
-        graph.add_regulatory_event(_deserialize_event(event_data))
+        for event_data in payload.get("regulatory_events", []):
+            graph.add_regulatory_event(_deserialize_event(event_data))
 
     relationships_payload = payload.get("relationships", {})
     for source, rels in relationships_payload.items():
@@ -23,6 +23,7 @@ from src.models.financial_models import (
     Equity,
     RegulatoryActivity,
     RegulatoryEvent,
+    trusted_construction,
 )
 
 from .db_models import (
@@ -675,7 +676,9 @@ class AssetGraphRepository:
                 ordered by asset id.
         """
         result = self.session.execute(select(AssetORM).order_by(AssetORM.id)).scalars().all()
-        return [self._to_asset_model(record) for record in result]
+        # Rows were validated when written, so bulk reads skip per-instance validation.
+        with trusted_construction():
+            return [self._to_asset_model(record) for record in result]
 
     def get_assets_map(self) -> dict[str, Asset]:
         """
@@ -981,7 +984,8 @@ class AssetGraphRepository:
             .scalars()
             .all()
         )
-        return [self._to_regulatory_event_model(record) for record in result]
+        with trusted_construction():
+            return [self._to_regulatory_event_model(record) for record in result]
 
     def delete_regulatory_event(self, event_id: str) -> None:
         """
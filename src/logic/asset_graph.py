@@ -2,15 +2,315 @@
 
 from __future__ import annotations
 
-from typing import Any
+import multiprocessing
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Literal, SupportsIndex
 
 import numpy as np
 
+from src.logic import metrics_engine
+from src.logic.compact_adjacency import CompactAdjacency
+from src.logic.graph_layout import circular_layout
+from src.logic.relationship_aggregates import DEFAULT_TOP_RELATIONSHIPS, RelationshipAggregates
 from src.logic.relationship_parser import parse_relationship_args
 from src.models.financial_models import Asset, Bond, RegulatoryEvent
 
 Relationship = tuple[str, str, float]
 TopRelationship = tuple[str, str, str, float]
+RelationshipKey = tuple[str, str]
+GraphBackend = Literal["dict", "csr"]
+# (version, positions, asset_ids, colors, hover) of a cached 3D visualization layout.
+_VisualizationLayout = tuple[int, np.ndarray, tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+_GRAPH_BACKENDS: tuple[GraphBackend, ...] = ("dict", "csr")
+# Sources per build block; large sectors are split so parallel builds stay balanced.
+_BUILD_BLOCK_SIZE = 512
+
+
+def _sector_block_outgoing(
+    block: list[str],
+    members: list[str],
+    issuer_links: dict[str, tuple[str, int]],
+    same_sector_strength: float,
+    corporate_bond_strength: float,
+) -> dict[str, list[Relationship]]:
+    """
+    Return the same-sector and corporate-link lists of every non-empty source in ``block``.
+
+    Module-level and fed only plain containers so it can run in a worker process.
+
+    Parameters:
+        block (list[str]): Source asset IDs, all from one sector (or all unsectored).
+        members (list[str]): Every member of that sector in insertion order; empty when unsectored.
+        issuer_links (dict[str, tuple[str, int]]): Bond ID to its issuer ID and the list
+            index the corporate link is inserted at.
+        same_sector_strength (float): Strength of same-sector edges.
+        corporate_bond_strength (float): Strength of corporate-link edges.
+    """
+    outgoing: dict[str, list[Relationship]] = {}
+    for asset_id in block:
+        rels: list[Relationship] = [
+            (target_id, "same_sector", same_sector_strength) for target_id in members if target_id != asset_id
+        ]
+        issuer_link = issuer_links.get(asset_id)
+        if issuer_link is not None:
+            issuer_id, insert_at = issuer_link
+            rels.insert(insert_at, (issuer_id, "corporate_link", corporate_bond_strength))
+        if rels:
+            outgoing[asset_id] = rels
+    return outgoing
+
+
+def _raise_if_cancelled(cancel_event: threading.Event | None) -> None:
+    """Raise RebuildCancelledError if the cancellation event is set."""
+    if cancel_event is not None and cancel_event.is_set():
+        from src.logic.reconciliation_engine import RebuildCancelledError
+
+        raise RebuildCancelledError("Rebuild cancelled via API request")
+
+
+class _MutationLog:
+    """Counter bumped by every in-place change to a graph's relationship map or its lists."""
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        """Start counting from zero."""
+        self.count = 0
+
+
+class _TrackedRelationshipList(list):  # type: ignore[type-arg]
+    """Outgoing relationship list that records in-place edits in its graph's mutation log."""
+
+    __slots__ = ("_log",)
+
+    def __init__(self, log: _MutationLog, rels: Iterable[Relationship] = ()) -> None:
+        """Copy ``rels`` without counting the copy as an edit."""
+        super().__init__(rels)
+        self._log = log
+
+    def __reduce__(self) -> tuple[type[list], tuple[list[Relationship]]]:  # type: ignore[type-arg]
+        """Copy and pickle as a plain list detached from the graph."""
+        return list, (list(self),)
+
+    def _touch(self) -> None:
+        self._log.count += 1
+
+    def append(self, rel: Relationship) -> None:  # type: ignore[override]
+        super().append(rel)
+        self._touch()
+
+    def extend(self, rels: Iterable[Relationship]) -> None:  # type: ignore[override]
+        super().extend(rels)
+        self._touch()
+
+    def insert(self, index: SupportsIndex, rel: Relationship) -> None:  # type: ignore[override]
+        super().insert(index, rel)
+        self._touch()
+
+    def remove(self, rel: Relationship) -> None:  # type: ignore[override]
+        super().remove(rel)
+        self._touch()
+
+    def pop(self, index: SupportsIndex = -1) -> Relationship:
+        rel = super().pop(index)
+        self._touch()
+        return rel
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._touch()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._touch()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._touch()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._touch()
+
+    def __iadd__(self, rels: Iterable[Relationship]) -> _TrackedRelationshipList:  # type: ignore[override]
+        super().__iadd__(rels)
+        self._touch()
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> _TrackedRelationshipList:
+        super().__imul__(count)
+        self._touch()
+        return self
+
+
+class _TrackedMap(dict):  # type: ignore[type-arg]
+    """Dict that records edits to itself in a mutation log; subclasses may wrap stored values."""
+
+    __slots__ = ("_log",)
+
+    def __init__(self, log: _MutationLog, items: Mapping[str, Any]) -> None:
+        """Copy ``items`` without counting the copy as an edit."""
+        super().__init__()
+        self._log = log
+        for key, value in items.items():
+            super().__setitem__(key, self._store(value))
+
+    def __reduce__(self) -> tuple[type[dict], tuple[dict[str, Any]]]:  # type: ignore[type-arg]
+        """Copy and pickle as a plain dict detached from the graph."""
+        return dict, (dict(self),)
+
+    def _store(self, value: Any) -> Any:
+        """Return ``value`` as it should be stored in the map."""
+        return value
+
+    def _touch(self) -> None:
+        self._log.count += 1
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, self._store(value))
+        self._touch()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._touch()
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        item = super().popitem()
+        self._touch()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> _TrackedMap:  # type: ignore[override]
+        self.update(other)
+        return self
+
+
+class _TrackedRelationshipMap(_TrackedMap):
+    """
+    Relationship map that records edits to itself and to its lists in one mutation log.
+
+    Lists stored in the map are wrapped as `_TrackedRelationshipList` copies, so later edits
+    must go through ``graph.relationships[source_id]`` rather than the list that was assigned.
+    """
+
+    __slots__ = ()
+
+    def _store(self, value: Any) -> Any:
+        """Return ``value`` as a list recording edits in this map's log; other values are stored as given."""
+        if isinstance(value, _TrackedRelationshipList) and value._log is self._log:
+            return value
+        if isinstance(value, list):
+            return _TrackedRelationshipList(self._log, value)
+        return value
+
+
+class _TrackedAssetMap(_TrackedMap):
+    """Asset map that records inserts, replacements and removals in its graph's asset mutation log."""
+
+    __slots__ = ()
+
+
+class _SourceKeyIndex:
+    """Duplicate-detection keys for one source's outgoing relationship list."""
+
+    __slots__ = ("indexed_count", "keys", "rels")
+
+    def __init__(self, rels: list[Relationship]) -> None:
+        """Index every ``(target_id, rel_type)`` key already present in ``rels``."""
+        self.rels = rels
+        self.indexed_count = len(rels)
+        self.keys: set[RelationshipKey] = {(target_id, rel_type) for target_id, rel_type, _ in rels}
+
+
+class _AssetIndex:
+    """Sector and issuer indexes over the graph's assets for incremental relationship updates."""
+
+    __slots__ = ("bonds_by_issuer", "next_sequence", "sector_ids", "sector_sequences", "sequence")
+
+    def __init__(self, assets: dict[str, Asset]) -> None:
+        """Index ``assets`` in insertion order; sequence numbers preserve that order across removals."""
+        self.sequence: dict[str, int] = {}
+        self.next_sequence = 0
+        self.sector_ids: dict[str, list[str]] = {}
+        self.sector_sequences: dict[str, list[int]] = {}
+        self.bonds_by_issuer: dict[str, set[str]] = {}
+        for asset in assets.values():
+            self.add(asset)
+
+    def add(self, asset: Asset) -> None:
+        """Index a newly inserted asset or re-index one that replaces an asset with the same ID."""
+        sequence = self.sequence.get(asset.id)
+        if sequence is None:
+            sequence = self.sequence[asset.id] = self.next_sequence
+            self.next_sequence += 1
+        if asset.sector != "Unknown":
+            sequences = self.sector_sequences.setdefault(asset.sector, [])
+            insert_at = bisect_left(sequences, sequence)
+            sequences.insert(insert_at, sequence)
+            self.sector_ids.setdefault(asset.sector, []).insert(insert_at, asset.id)
+        if isinstance(asset, Bond) and asset.issuer_id is not None:
+            self.bonds_by_issuer.setdefault(asset.issuer_id, set()).add(asset.id)
+
+    def discard(self, asset: Asset, *, keep_sequence: bool) -> None:
+        """Remove ``asset`` from the sector and issuer indexes, optionally keeping its sequence number."""
+        sequence = self.sequence[asset.id]
+        if asset.sector != "Unknown":
+            sequences = self.sector_sequences[asset.sector]
+            position = bisect_left(sequences, sequence)
+            del sequences[position]
+            del self.sector_ids[asset.sector][position]
+            if not sequences:
+                del self.sector_sequences[asset.sector]
+                del self.sector_ids[asset.sector]
+        if isinstance(asset, Bond) and asset.issuer_id is not None:
+            bonds = self.bonds_by_issuer[asset.issuer_id]
+            bonds.discard(asset.id)
+            if not bonds:
+                del self.bonds_by_issuer[asset.issuer_id]
+        if not keep_sequence:
+            del self.sequence[asset.id]
+
+
+class _EventIndex:
+    """Regulatory events grouped by source asset and by related asset."""
+
+    __slots__ = ("events", "events_by_source", "indexed_count", "sources_by_related")
+
+    def __init__(self, events: list[RegulatoryEvent]) -> None:
+        """Index every event currently stored in ``events``."""
+        self.events = events
+        self.indexed_count = len(events)
+        self.events_by_source: dict[str, list[RegulatoryEvent]] = {}
+        self.sources_by_related: dict[str, set[str]] = {}
+        for event in events:
+            self.events_by_source.setdefault(event.asset_id, []).append(event)
+            for related_id in event.related_assets:
+                self.sources_by_related.setdefault(related_id, set()).add(event.asset_id)
 
 
 class AssetRelationshipGraph:
@@ -21,6 +321,7 @@ class AssetRelationshipGraph:
         database_url: str | None = None,
         same_sector_strength: float | None = None,
         corporate_bond_strength: float | None = None,
+        backend: GraphBackend = "dict",
     ) -> None:
         """
         Initialize the AssetRelationshipGraph with empty internal stores.
@@ -33,6 +334,10 @@ class AssetRelationshipGraph:
                 assets in the same sector (must be in range [-1.0, 1.0]). Defaults to settings.
             corporate_bond_strength (float | None): The default connection strength from
                 a corporate bond to its issuer (must be in range [-1.0, 1.0]). Defaults to settings.
+            backend (str): Relationship storage backend. ``"dict"`` (default) keeps the
+                dict-of-lists map as the only store. ``"csr"`` packs edges into NumPy CSR
+                arrays after every build or `compact()` call, serves metrics and degrees
+                from those arrays, and materializes the dict view lazily on first access.
 
         Attributes created:
             assets (dict[str, Asset]): Mapping of asset ID to Asset.
@@ -41,8 +346,27 @@ class AssetRelationshipGraph:
             regulatory_events (list[RegulatoryEvent]): List of regulatory events
                 associated with assets.
         """
-        self.assets: dict[str, Asset] = {}
-        self.relationships: dict[str, list[Relationship]] = {}
+        if backend not in _GRAPH_BACKENDS:
+            raise ValueError(f"backend must be one of {_GRAPH_BACKENDS}, got {backend!r}")
+
+        self.backend: GraphBackend = backend
+        self._asset_log = _MutationLog()
+        self._assets: dict[str, Asset] = _TrackedAssetMap(self._asset_log, {})
+        self._relationship_log = _MutationLog()
+        self._relationships: dict[str, list[Relationship]] | None = _TrackedRelationshipMap(self._relationship_log, {})
+        self._relationship_keys: dict[str, _SourceKeyIndex] = {}
+        self._compact: CompactAdjacency | None = None
+        # Relationship edit count the CSR snapshot was packed at.
+        self._compact_edits = 0
+        self._asset_index: _AssetIndex | None = None
+        self._event_index: _EventIndex | None = None
+        self._aggregates: RelationshipAggregates | None = None
+        # Reverse adjacency: target ID -> {(source_id, rel_type): strength}.
+        self._incoming: dict[str, dict[RelationshipKey, float]] | None = None
+        self._version = 0
+        self._observed: tuple[int, ...] | None = None
+        # Last 3D visualization layout, reused while the version is unchanged.
+        self._visualization_layout: _VisualizationLayout | None = None
         self.regulatory_events: list[RegulatoryEvent] = []
         self.database_url = database_url
 
@@ -63,6 +387,248 @@ class AssetRelationshipGraph:
         self.same_sector_strength = same_sector_strength
         self.corporate_bond_strength = corporate_bond_strength
 
+    @property
+    def assets(self) -> dict[str, Asset]:
+        """
+        Mapping of asset ID to Asset, in insertion order.
+
+        The map counts its own inserts, replacements and removals, so assets written directly
+        (``graph.assets[asset_id] = asset``) are noticed by `version` and drop the running
+        indexes. An assigned mapping is stored as a copy.
+        """
+        return self._assets
+
+    @assets.setter
+    def assets(self, assets: Mapping[str, Asset]) -> None:
+        """Replace the asset map; the replacement is counted as an edit to the old one."""
+        self._assets = _TrackedAssetMap(self._asset_log, assets)
+        self._asset_log.count += 1
+
+    @property
+    def relationships(self) -> dict[str, list[Relationship]]:
+        """
+        Mapping of source asset ID to its outgoing ``(target_id, rel_type, strength)`` tuples.
+
+        On the ``"csr"`` backend this view is materialized from the CSR arrays on first
+        access after `compact()`. Editing it in place makes the CSR snapshot stale, so
+        the snapshot is re-packed from the view on its next use.
+
+        The map and its lists count their own in-place edits, which is how `version`
+        notices changes made without graph methods. Assigned lists are stored as copies.
+        """
+        if self._relationships is None:
+            relationships = self._compact_view().to_relationships()
+            self._relationships = _TrackedRelationshipMap(self._relationship_log, relationships)
+        return self._relationships
+
+    @relationships.setter
+    def relationships(self, relationships: dict[str, list[Relationship]]) -> None:
+        """Replace the relationship map and drop key, CSR and metric state built for the old one."""
+        self._relationships = _TrackedRelationshipMap(self._relationship_log, relationships)
+        self._relationship_keys = {}
+        self._compact = None
+        self._aggregates = None
+        self._incoming = None
+        self._observed = None
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter bumped whenever assets, events or relationships change.
+
+        Changes made through graph methods bump it directly. Edits applied straight to the
+        public `assets` and `relationships` maps are counted by the maps themselves, and
+        edits to the public `regulatory_events` list are detected by comparing its identity
+        and size, so derived caches can key on this value. Reading it is O(1).
+        """
+        self._observe_external_changes()
+        return self._version
+
+    def _observation(self) -> tuple[int, ...]:
+        """Return the relationship and asset edit counts and the event list identity and size."""
+        return (
+            self._relationship_log.count,
+            self._asset_log.count,
+            id(self.regulatory_events),
+            len(self.regulatory_events),
+        )
+
+    def _observe_external_changes(self) -> None:
+        """Bump the version and drop running indexes if the containers changed behind the graph's back."""
+        observation = self._observation()
+        observed = self._observed
+        if observation != observed:
+            if observed is None or observed[1] != observation[1]:
+                self._asset_index = None
+            self._observed = observation
+            self._aggregates = None
+            self._incoming = None
+            self._version += 1
+
+    def _record_change(self, *, events: int = 0) -> None:
+        """
+        Bump the version for a change made through a graph method and absorb it into the observation.
+
+        Public mutators run `_observe_external_changes` before changing anything, so every
+        relationship and asset edit counted since then was made by the graph itself.
+        """
+        self._version += 1
+        observed = self._observed
+        if observed is not None:
+            self._observed = (
+                self._relationship_log.count,
+                self._asset_log.count,
+                observed[2],
+                observed[3] + events,
+            )
+
+    def compact(self) -> CompactAdjacency:
+        """
+        Pack the relationship map into CSR arrays.
+
+        On the ``"csr"`` backend the snapshot is retained and the dict view is released
+        until it is next accessed. On the ``"dict"`` backend a detached snapshot is returned.
+
+        Returns:
+            CompactAdjacency: The CSR snapshot of the current relationships.
+        """
+        adjacency = self._compact_view()
+        if self.backend == "csr":
+            self._relationships = None
+            self._relationship_keys = {}
+        return adjacency
+
+    def _compact_view(self) -> CompactAdjacency:
+        """Return the CSR snapshot, rebuilding it from the dict view when stale."""
+        compact = self._compact
+        if compact is not None and (self._relationships is None or self._compact_edits == self._relationship_log.count):
+            return compact
+        if self._relationships is None:
+            raise RuntimeError("relationship storage is empty: neither dict nor CSR view is available")
+        adjacency = CompactAdjacency.from_relationships(self._relationships)
+        if self.backend == "csr":
+            self._compact = adjacency
+            self._compact_edits = self._relationship_log.count
+        return adjacency
+
+    def iter_relationships(self) -> Iterator[tuple[str, str, str, float]]:
+        """
+        Yield every stored relationship as ``(source_id, target_id, rel_type, strength)``.
+
+        Iteration follows source and list order. On the ``"csr"`` backend edges are
+        decoded from the arrays without materializing the dict view.
+        """
+        if self.backend == "csr":
+            yield from self._compact_view().iter_edges()
+            return
+        for source_id, rels in self.relationships.items():
+            for target_id, rel_type, strength in rels:
+                yield source_id, target_id, rel_type, strength
+
+    def outgoing_relationships(self, source_id: str) -> list[Relationship]:
+        """Return the outgoing relationships of ``source_id`` (empty when it has none)."""
+        if self.backend == "csr" and self._relationships is None:
+            return self._compact_view().outgoing(source_id)
+        return list(self.relationships.get(source_id, []))
+
+    def incoming_relationships(self, target_id: str) -> list[Relationship]:
+        """
+        Return the relationships pointing at ``target_id`` as ``(source_id, rel_type, strength)`` tuples.
+
+        Served from a reverse index built on first use and then kept in step with every
+        change made through graph methods, so a lookup costs the number of incoming edges
+        rather than a scan of the whole map. Results are ordered by source ID, then type.
+        """
+        self._observe_external_changes()
+        incoming = self._incoming_index().get(target_id)
+        if not incoming:
+            return []
+        return [(source_id, rel_type, strength) for (source_id, rel_type), strength in sorted(incoming.items())]
+
+    def _incoming_index(self) -> dict[str, dict[RelationshipKey, float]]:
+        """Return the reverse adjacency index, building it from the relationship map when absent."""
+        if self._incoming is None:
+            incoming: dict[str, dict[RelationshipKey, float]] = {}
+            for source_id, target_id, rel_type, strength in self.iter_relationships():
+                incoming.setdefault(target_id, {})[(source_id, rel_type)] = strength
+            self._incoming = incoming
+        return self._incoming
+
+    def neighborhood(self, asset_id: str, depth: int, max_nodes: int) -> list[str]:
+        """
+        Return the stored assets within ``depth`` hops of ``asset_id`` in breadth-first order.
+
+        Edges are followed in both directions through the outgoing lists and the reverse
+        index, so the cost is bounded by the edges of visited nodes rather than the graph
+        size. Referenced IDs that are not stored assets are skipped.
+
+        Parameters:
+            asset_id (str): Stored asset to start from; always the first returned ID.
+            depth (int): Maximum number of hops from ``asset_id``.
+            max_nodes (int): Stop once this many IDs have been collected.
+
+        Returns:
+            list[str]: Asset IDs ordered by hop distance, then discovery order.
+
+        Raises:
+            KeyError: If ``asset_id`` is not a stored asset.
+        """
+        if asset_id not in self.assets:
+            raise KeyError(f"Asset not found: {asset_id}")
+        self._observe_external_changes()
+        incoming = self._incoming_index()
+        visited = {asset_id}
+        order = [asset_id]
+        frontier = [asset_id]
+        for _ in range(depth):
+            next_frontier: list[str] = []
+            for node_id in frontier:
+                targets = [target_id for target_id, _, _ in self.outgoing_relationships(node_id)]
+                sources = [source_id for source_id, _ in incoming.get(node_id, {})]
+                for neighbor_id in targets + sources:
+                    if neighbor_id in visited or neighbor_id not in self.assets:
+                        continue
+                    if len(order) >= max_nodes:
+                        return order
+                    visited.add(neighbor_id)
+                    order.append(neighbor_id)
+                    next_frontier.append(neighbor_id)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return order
+
+    def _index_incoming(self, source_id: str, edge: Relationship, *, added: bool) -> None:
+        """Add ``edge`` from ``source_id`` to, or remove it from, the reverse index when one is built."""
+        incoming = self._incoming
+        if incoming is None:
+            return
+        target_id, rel_type, strength = edge
+        if added:
+            incoming.setdefault(target_id, {})[(source_id, rel_type)] = strength
+            return
+        sources = incoming.get(target_id)
+        if sources is not None:
+            sources.pop((source_id, rel_type), None)
+            if not sources:
+                del incoming[target_id]
+
+    def out_degree(self, source_id: str) -> int:
+        """Return the number of outgoing relationships stored for ``source_id``."""
+        if self.backend == "csr":
+            return self._compact_view().out_degree(source_id)
+        return len(self.relationships.get(source_id, []))
+
+    def out_degrees(self) -> dict[str, int]:
+        """Return outgoing relationship counts for every source in the relationship map."""
+        if self.backend == "csr":
+            adjacency = self._compact_view()
+            return dict(
+                zip(adjacency.node_ids[: adjacency.source_count], adjacency.out_degrees().tolist(), strict=True)
+            )
+        return {source_id: len(rels) for source_id, rels in self.relationships.items()}
+
     def add_asset(self, asset: Asset) -> None:
         """
         Add or update an asset in the graph.
@@ -70,14 +636,101 @@ class AssetRelationshipGraph:
         Parameters:
             asset (Asset): Asset to store; placed in the graph keyed by its `id`.
             If an asset with the same `id` already exists it will be replaced.
+
+        Relationships are not updated; call `build_relationships` afterwards, or use
+        `upsert_asset` to keep an already built relationship map in sync.
         """
+        self._observe_external_changes()
+        previous = self.assets.get(asset.id)
         self.assets[asset.id] = asset
+        self._asset_index = None
+        self._record_asset_change(previous, asset)
 
     def add_regulatory_event(self, event: RegulatoryEvent) -> None:
         """Append a regulatory event to the graph."""
+        self._observe_external_changes()
         self.regulatory_events.append(event)
+        self._record_change(events=1)
+
+    def upsert_asset(self, asset: Asset) -> None:
+        """
+        Insert or replace an asset and update only the relationships that touch it.
+
+        Same-sector edges are retracted from the asset's previous sector and added to its
+        new one, corporate links of bonds issued by the asset are re-resolved, and event
+        impacts naming the asset are re-applied. The work is proportional to the sizes of
+        the sectors involved rather than to the whole asset universe.
+
+        The relationship map must have been produced by `build_relationships` for the
+        current assets; the result then equals a full rebuild, including the order of
+        each source's outgoing list (the order of source keys may differ). Before the first
+        build, peers without the edges being retracted are skipped rather than raising.
+
+        Parameters:
+            asset (Asset): Asset to store, keyed by its `id`. An existing asset with the
+                same `id` keeps its position in insertion order.
+        """
+        self._observe_external_changes()
+        asset_id = asset.id
+        index = self._incremental_asset_index()
+        previous = self.assets.get(asset_id)
+        issued_bonds = self._detach_issued_bond_links(asset_id)
+
+        if previous is not None:
+            index.discard(previous, keep_sequence=True)
+        self.assets[asset_id] = asset
+        index.add(asset)
+        self._record_asset_change(previous, asset)
+
+        if previous is None or previous.sector != asset.sector:
+            if previous is not None:
+                self._retract_same_sector_edges(asset_id, previous.sector)
+            self._insert_same_sector_edges(asset_id, asset.sector)
+        self._set_outgoing(asset_id, self._structural_relationships(asset_id) + self._event_relationships(asset_id))
+        self._attach_issued_bond_links(issued_bonds)
+        if previous is None:
+            self._refresh_event_impacts_targeting(asset_id)
+
+    def remove_asset(self, asset_id: str) -> Asset:
+        """
+        Remove an asset and retract every relationship that touches it.
+
+        Uses the same sector, issuer and event indexes as `upsert_asset` and leaves the
+        relationship map equal to a full rebuild over the remaining assets.
+
+        Parameters:
+            asset_id (str): ID of the asset to remove.
 
-    def build_relationships(self) -> None:
+        Returns:
+            Asset: The removed asset.
+
+        Raises:
+            KeyError: If no asset with `asset_id` is stored.
+        """
+        if asset_id not in self.assets:
+            raise KeyError(f"Asset not found: {asset_id}")
+        self._observe_external_changes()
+        index = self._incremental_asset_index()
+        issued_bonds = self._detach_issued_bond_links(asset_id)
+        removed = self.assets.pop(asset_id)
+        index.discard(removed, keep_sequence=False)
+        self._record_asset_change(removed, None)
+
+        self._retract_same_sector_edges(asset_id, removed.sector)
+        self._set_outgoing(asset_id, [])
+        self._attach_issued_bond_links(issued_bonds)
+        self._refresh_event_impacts_targeting(asset_id)
+        return removed
+
+    def build_relationships(
+        self,
+        *,
+        blocked: bool = True,
+        parallel: bool = False,
+        workers: int | None = None,
+        cancel_event: threading.Event | None = None,
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
         """
         Rebuild the internal relationships mapping based on asset metrics.
 
@@ -88,9 +741,49 @@ class AssetRelationshipGraph:
           its issuer when an issuer relationship exists.
         After pairwise processing, applies regulatory event impacts as
         event-driven relationships.
+
+        Parameters:
+            blocked (bool): When True (default), group assets by sector and index
+                bonds by issuer so only real edges are visited (O(n + E)). When False,
+                compare every asset pair (O(n²)). Both modes produce an identical
+                relationship map, including list and key order.
+            parallel (bool): When True, build the sector blocks on a process pool and
+                merge them in block order, so the map is identical to a serial build.
+                Worker start-up and result transfer cost more than they save on small
+                universes, so use it for large builds only. Requires ``blocked=True``.
+            workers (int | None): Process pool size for parallel builds. Defaults to
+                ``os.cpu_count()``.
+            cancel_event (threading.Event | None): Checked before every block merge; when
+                set, the build stops and the previous relationship map is left in place.
+            on_progress (Callable | None): Invoked after each merged block with
+                ``merged_source_count`` (sources merged so far), ``completed_blocks`` and
+                ``total_blocks``. Progress only; it is not a resumable checkpoint.
+
+        Raises:
+            ValueError: If ``parallel`` is requested without ``blocked`` or ``workers < 1``.
+            RebuildCancelledError: If ``cancel_event`` is set during the build.
         """
-        self.relationships = {}
+        if parallel and not blocked:
+            raise ValueError("parallel relationship builds require blocked=True")
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        _raise_if_cancelled(cancel_event)
+        if blocked:
+            self._build_blocked_relationships(
+                workers=(workers or os.cpu_count() or 1) if parallel else None,
+                cancel_event=cancel_event,
+                on_progress=on_progress,
+            )
+        else:
+            self.relationships = {}
+            self._build_pairwise_relationships()
+        self._apply_event_impacts()
+        if self.backend == "csr":
+            self.compact()
 
+    def _build_pairwise_relationships(self) -> None:
+        """Add same-sector and issuer relationships by comparing every asset pair."""
         asset_ids = list(self.assets.keys())
         for idx, source_id in enumerate(asset_ids):
             for target_id in asset_ids[idx + 1 :]:
@@ -117,7 +810,126 @@ class AssetRelationshipGraph:
                         bidirectional=False,
                     )
 
-        self._apply_event_impacts()
+    def _build_blocked_relationships(
+        self,
+        *,
+        workers: int | None = None,
+        cancel_event: threading.Event | None = None,
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        """
+        Add same-sector and issuer relationships from sector blocks and an issuer index.
+
+        Each source's outgoing list is emitted in asset insertion order of its targets,
+        and sources are keyed in the order the pairwise scan would first create them,
+        so the resulting map matches `_build_pairwise_relationships` exactly. Blocks
+        are independent, so with ``workers`` set they run on a process pool (the
+        per-block work is pure Python and would serialize on the GIL in threads);
+        results are merged in block order either way.
+        """
+        positions = {asset_id: idx for idx, asset_id in enumerate(self.assets)}
+        sector_members: dict[str, list[str]] = {}
+        unsectored: list[str] = []
+        for asset_id, asset in self.assets.items():
+            if asset.sector != "Unknown":
+                sector_members.setdefault(asset.sector, []).append(asset_id)
+            else:
+                unsectored.append(asset_id)
+        sector_positions = {
+            sector: [positions[member_id] for member_id in members] for sector, members in sector_members.items()
+        }
+        # (same-sector peers, sources) per group; unsectored assets have no peers.
+        groups = [*((members, members) for members in sector_members.values()), ([], unsectored)]
+        block_args = [
+            (
+                block,
+                peers,
+                self._block_issuer_links(block, positions, sector_positions),
+                self.same_sector_strength,
+                self.corporate_bond_strength,
+            )
+            for peers, sources in groups
+            for start in range(0, len(sources), _BUILD_BLOCK_SIZE)
+            for block in [sources[start : start + _BUILD_BLOCK_SIZE]]
+        ]
+
+        outgoing: dict[str, list[Relationship]] = {}
+        merged_source_count = 0
+
+        def merge(block_index: int, block_outgoing: dict[str, list[Relationship]]) -> None:
+            nonlocal merged_source_count
+            _raise_if_cancelled(cancel_event)
+            outgoing.update(block_outgoing)
+            merged_source_count += len(block_args[block_index][0])
+            if on_progress:
+                on_progress(
+                    {
+                        "merged_source_count": merged_source_count,
+                        "completed_blocks": block_index + 1,
+                        "total_blocks": len(block_args),
+                    }
+                )
+
+        if workers is None:
+            for block_index, args in enumerate(block_args):
+                _raise_if_cancelled(cancel_event)
+                merge(block_index, _sector_block_outgoing(*args))
+        else:
+            # Spawned workers: forking a server process that runs other threads is unsafe.
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            try:
+                futures = [pool.submit(_sector_block_outgoing, *args) for args in block_args]
+                for block_index, future in enumerate(futures):
+                    merge(block_index, future.result())
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+        _raise_if_cancelled(cancel_event)
+
+        def first_pair_order(source_id: str) -> tuple[int, int, int]:
+            source_pos = positions[source_id]
+            target_pos = positions[outgoing[source_id][0][0]]
+            return min(source_pos, target_pos), max(source_pos, target_pos), source_pos
+
+        self.relationships = {source_id: outgoing[source_id] for source_id in sorted(outgoing, key=first_pair_order)}
+
+    def _block_issuer_links(
+        self,
+        block: list[str],
+        positions: dict[str, int],
+        sector_positions: dict[str, list[int]],
+    ) -> dict[str, tuple[str, int]]:
+        """Return each linking bond in ``block`` with its issuer ID and outgoing-list insertion index."""
+        links: dict[str, tuple[str, int]] = {}
+        for asset_id in block:
+            asset = self.assets[asset_id]
+            issuer_id = self._blocked_issuer_link(asset_id, asset, positions)
+            if issuer_id is None:
+                continue
+            insert_at = bisect_right(sector_positions.get(asset.sector, []), positions[issuer_id])
+            if asset.sector != "Unknown" and positions[asset_id] < positions[issuer_id]:
+                insert_at -= 1
+            links[asset_id] = (issuer_id, insert_at)
+        return links
+
+    def _blocked_issuer_link(self, bond_id: str, asset: Asset, positions: dict[str, int]) -> str | None:
+        """
+        Resolve a bond's issuer link by lookup instead of a pairwise scan.
+
+        Mirrors `_issuer_link` tie-breaking: when two bonds name each other as issuer,
+        only the bond inserted first links to the other.
+
+        Returns:
+            str | None: The issuer ID ``bond_id`` links to, or None.
+        """
+        if not isinstance(asset, Bond):
+            return None
+        issuer_id = asset.issuer_id
+        if issuer_id is None or issuer_id == bond_id or issuer_id not in positions:
+            return None
+        issuer = self.assets[issuer_id]
+        if isinstance(issuer, Bond) and issuer.issuer_id == bond_id and positions[issuer_id] < positions[bond_id]:
+            return None
+        return issuer_id
 
     def add_relationship(
         self,
@@ -142,6 +954,7 @@ class AssetRelationshipGraph:
             relationship_args,
             kwargs,
         )
+        self._observe_external_changes()
         self._append_relationship(
             source_id=source_id,
             target_id=target_id,
@@ -179,10 +992,13 @@ class AssetRelationshipGraph:
             return 0.0
         return count / (count + k)
 
-    def calculate_metrics(self) -> dict[str, Any]:
+    def calculate_metrics(self, top_k: int = DEFAULT_TOP_RELATIONSHIPS) -> dict[str, Any]:
         """
         Produce aggregated network metrics, distributions, and a composite quality score for the current asset graph.
 
+        Parameters:
+            top_k (int): Number of strongest relationships to report in ``top_relationships``.
+
         Returns:
             metrics (dict): Mapping of metric names to values with the following keys:
                 - total_assets (int): Number of participating assets (present in assets or referenced by relationships).
@@ -196,18 +1012,24 @@ class AssetRelationshipGraph:
                   Zero-degree assets (those absent from ``relationships``) are excluded from this average.
                 - max_degree (int): Maximum outgoing relationship count for sources in the relationship map.
                   Zero-degree assets (those absent from ``relationships``) are excluded from this maximum.
-                - top_relationships (list[tuple[str, str, str, float]]): Up to 10 relationships sorted by strength as (source_id, target_id, rel_type, strength).
+                - top_relationships (list[tuple[str, str, str, float]]): Up to ``top_k`` relationships sorted by strength as (source_id, target_id, rel_type, strength).
                 - regulatory_event_count (int): Number of stored regulatory events.
                 - regulatory_event_norm (float): Normalized regulatory event count in [0.0, 1.0) using a saturating mapping.
                 - quality_score (float): Composite score in [0.0, 1.0] combining normalized average strength and regulatory-event influence.
+
+        Raises:
+            ValueError: If ``top_k`` is negative.
         """
-        effective_assets_count = len(self.collect_participating_asset_ids())
+        if top_k < 0:
+            raise ValueError(f"top_k must be non-negative, got {top_k}")
+        self._observe_external_changes()
+        effective_assets_count = self._participating_asset_count()
         (
             rel_dist,
             top_relationships,
             total_relationships,
             avg_strength,
-        ) = self._summarize_relationships()
+        ) = self._summarize_relationships(top_k)
         network_density = calculate_graph_density(
             effective_assets_count,
             total_relationships,
@@ -237,34 +1059,49 @@ class AssetRelationshipGraph:
 
     def _summarize_relationships(
         self,
+        top_k: int = DEFAULT_TOP_RELATIONSHIPS,
     ) -> tuple[dict[str, int], list[TopRelationship], int, float]:
         """
         Summarize the graph's stored directed relationships by type, top strengths, total count, and average strength.
 
+        On the ``"dict"`` backend the values come from running aggregates kept in step with
+        graph mutations, so repeated calls do not walk every edge. The strongest relationships
+        are chosen by bounded selection (a heap over the map, or a partition over the CSR
+        strengths) rather than a full sort; ties keep relationship-map order either way.
+
+        Parameters:
+            top_k (int): Number of strongest relationships to return.
+
         Returns:
             rel_dist (dict[str, int]): Mapping from relationship type to its occurrence count.
-            top_relationships (list[TopRelationship]): Up to 10 relationships sorted by descending strength; each is (source_id, target_id, relationship_type, strength).
+            top_relationships (list[TopRelationship]): Up to ``top_k`` relationships sorted by descending strength; each is (source_id, target_id, relationship_type, strength).
             total_relationships (int): Total number of directed relationships.
             average_strength (float): Mean strength across all returned relationships, or 0.0 if there are none.
         """
-        rel_dist: dict[str, int] = {}
-        all_rels: list[TopRelationship] = []
-        total_relationships = 0
-        strength_sum = 0.0
-        strength_count = 0
-
-        for src, rels in self.relationships.items():
-            total_relationships += len(rels)
-            for target, rtype, strength in rels:
-                rel_dist[rtype] = rel_dist.get(rtype, 0) + 1
-                strength_f = float(strength)
-                all_rels.append((src, target, rtype, strength_f))
-                strength_sum += strength_f
-                strength_count += 1
-
-        all_rels.sort(key=lambda relationship: relationship[3], reverse=True)
-        avg_strength = (strength_sum / strength_count) if strength_count else 0.0
-        return rel_dist, all_rels[:10], total_relationships, avg_strength
+        if self.backend == "csr":
+            adjacency = self._compact_view()
+            return (
+                metrics_engine.relationship_type_distribution(adjacency),
+                adjacency.top_edges(top_k),
+                adjacency.edge_count,
+                metrics_engine.average_strength(adjacency),
+            )
+
+        aggregates = self._metric_aggregates()
+        edge_count = aggregates.edge_count
+        avg_strength = (aggregates.strength_sum / edge_count) if edge_count else 0.0
+        return (
+            dict(aggregates.type_counts),
+            aggregates.top_relationships(self.relationships, top_k),
+            edge_count,
+            avg_strength,
+        )
+
+    def _participating_asset_count(self) -> int:
+        """Return ``len(collect_participating_asset_ids())`` without building the set on the dict backend."""
+        if self.backend == "csr":
+            return metrics_engine.participating_count(self._compact_view(), self.assets)
+        return self._metric_aggregates().participating_count(self.assets)
 
     def _quality_metrics(self, avg_strength: float, regulatory_event_count: int) -> tuple[float, float]:
         """
@@ -299,26 +1136,32 @@ class AssetRelationshipGraph:
         Positions are arranged on a unit circle in the XY plane (z = 0).
         If there are no assets, returns a single placeholder point.
 
+        The layout is computed once per graph `version`; later calls return the same
+        read-only positions array and fresh lists.
+
         Returns:
-            positions (np.ndarray): Array of shape (N, 3) with XYZ
+            positions (np.ndarray): Read-only array of shape (N, 3) with XYZ
                 coordinates for each node.
             asset_ids (list[str]): Ordered list of asset identifiers
                 corresponding to rows in `positions`.
             colors (list[str]): Hex color strings for each node.
             hover (list[str]): Hover text labels for each node.
         """
-        asset_ids = sorted(self.collect_participating_asset_ids())
-        if not asset_ids:
-            positions = np.zeros((1, 3))
-            return positions, ["A"], ["#888888"], ["Asset A"]
-
-        n = len(asset_ids)
-        theta = np.linspace(0, 2 * np.pi, n, endpoint=False)
-        positions = np.stack((np.cos(theta), np.sin(theta), np.zeros_like(theta)), axis=1)
-
-        colors = ["#4ECDC4"] * n
-        hover = [f"Asset: {aid}" for aid in asset_ids]
-        return positions, asset_ids, colors, hover
+        version = self.version
+        cached = self._visualization_layout
+        if cached is None or cached[0] != version:
+            asset_ids = tuple(sorted(self.collect_participating_asset_ids()))
+            if asset_ids:
+                positions = circular_layout(len(asset_ids))
+                colors = ("#4ECDC4",) * len(asset_ids)
+                hover = tuple(f"Asset: {aid}" for aid in asset_ids)
+            else:
+                positions = np.zeros((1, 3))
+                positions.setflags(write=False)
+                asset_ids, colors, hover = ("A",), ("#888888",), ("Asset A",)
+            cached = self._visualization_layout = (version, positions, asset_ids, colors, hover)
+        _, positions, asset_ids, colors, hover = cached
+        return positions, list(asset_ids), list(colors), list(hover)
 
     @staticmethod
     def _should_link_same_sector(asset1: Asset, asset2: Asset) -> bool:
@@ -402,6 +1245,7 @@ class AssetRelationshipGraph:
 
         This creates the relationship list for source_id if absent and appends a tuple (target_id, rel_type, strength).
         Duplicate detection is based on (target_id, rel_type) only; an existing entry with the same target and type prevents appending even if strength differs.
+        The check is a constant-time lookup in the per-source key index.
 
         Parameters:
             source_id (str): ID of the source asset whose relationship list will be updated.
@@ -409,10 +1253,263 @@ class AssetRelationshipGraph:
             rel_type (str): Semantic type of the relationship (e.g., "same_sector", "corporate_link").
             strength (float): Numerical strength of the relationship, typically in [0.0, 1.0].
         """
-        rels = self.relationships.setdefault(source_id, [])
-        if any(t == target_id and rt == rel_type for t, rt, _ in rels):
+        relationships = self.relationships
+        rels = relationships.get(source_id)
+        if rels is None:
+            relationships[source_id] = []
+            rels = relationships[source_id]
+            self._record_source_added(source_id)
+        keys = self._source_relationship_keys(source_id, rels)
+        key = (target_id, rel_type)
+        if key in keys.keys:
             return
         rels.append((target_id, rel_type, strength))
+        self._record_edge_change(source_id, rels, (target_id, rel_type, strength), len(rels) - 1, added=True)
+        keys.keys.add(key)
+        keys.indexed_count += 1
+
+    def _record_source_added(self, source_id: str) -> None:
+        """Account for a new, empty outgoing list stored under ``source_id``."""
+        if self._aggregates is not None:
+            self._aggregates.add_source(source_id, self.assets)
+        self._compact = None
+        self._record_change()
+
+    def _record_edge_change(
+        self,
+        source_id: str,
+        rels: list[Relationship],
+        edge: Relationship,
+        position: int,
+        *,
+        added: bool,
+    ) -> None:
+        """Account for ``edge`` having just been inserted into or removed from ``position`` in ``source_id``'s list ``rels``."""
+        aggregates = self._aggregates
+        if aggregates is not None:
+            target_id, rel_type, strength = edge
+            if added:
+                aggregates.add_edge(source_id, target_id, rel_type, strength, position, len(rels) - 1, self.assets)
+            else:
+                aggregates.remove_edge(source_id, target_id, rel_type, strength, position, len(rels) + 1, self.assets)
+        self._index_incoming(source_id, edge, added=added)
+        self._compact = None
+        self._record_change()
+
+    def _record_asset_change(self, previous: Asset | None, current: Asset | None) -> None:
+        """Account for an asset stored, replaced or removed through a graph method."""
+        aggregates = self._aggregates
+        if aggregates is not None:
+            if previous is not None:
+                aggregates.remove_asset(previous, self.assets)
+            if current is not None:
+                aggregates.add_asset(current, self.assets)
+        self._record_change()
+
+    def _metric_aggregates(self) -> RelationshipAggregates:
+        """
+        Return running metric aggregates for the dict backend, building them from the map when absent.
+
+        Callers are expected to have run `_observe_external_changes` first so that edits made
+        directly to the public containers have already discarded stale aggregates.
+        """
+        if self._aggregates is None:
+            self._aggregates = RelationshipAggregates.from_relationships(self.assets, self.relationships)
+        return self._aggregates
+
+    def _source_relationship_keys(self, source_id: str, rels: list[Relationship]) -> _SourceKeyIndex:
+        """
+        Return the key index for ``rels``, catching up with edits made directly to the public map.
+
+        Entries appended to the list outside ``add_relationship`` are indexed incrementally.
+        A replaced, truncated or removed list is re-indexed from scratch.
+        """
+        index = self._relationship_keys.get(source_id)
+        if index is None or index.rels is not rels or index.indexed_count > len(rels):
+            index = _SourceKeyIndex(rels)
+            self._relationship_keys[source_id] = index
+        elif index.indexed_count < len(rels):
+            index.keys.update((target_id, rel_type) for target_id, rel_type, _ in rels[index.indexed_count :])
+            index.indexed_count = len(rels)
+        return index
+
+    def _incremental_asset_index(self) -> _AssetIndex:
+        """Return the sector and issuer index, building it from the stored assets when absent."""
+        if self._asset_index is None:
+            self._asset_index = _AssetIndex(self.assets)
+        return self._asset_index
+
+    def _incremental_event_index(self) -> _EventIndex:
+        """Return the event index, rebuilding it when the event list was replaced or changed size."""
+        index = self._event_index
+        if index is None or index.events is not self.regulatory_events or index.indexed_count != len(index.events):
+            index = self._event_index = _EventIndex(self.regulatory_events)
+        return index
+
+    def _resolved_issuer(self, bond_id: str) -> str | None:
+        """Return the issuer ``bond_id`` links to, mirroring `_blocked_issuer_link` tie-breaking."""
+        bond = self.assets.get(bond_id)
+        if not isinstance(bond, Bond):
+            return None
+        issuer_id = bond.issuer_id
+        if issuer_id is None or issuer_id == bond_id or issuer_id not in self.assets:
+            return None
+        issuer = self.assets[issuer_id]
+        sequence = self._incremental_asset_index().sequence
+        if isinstance(issuer, Bond) and issuer.issuer_id == bond_id and sequence[issuer_id] < sequence[bond_id]:
+            return None
+        return issuer_id
+
+    def _corporate_link_position(self, bond_id: str, issuer_id: str) -> int:
+        """Return where the pairwise build places ``bond_id``'s corporate link among its same-sector edges."""
+        index = self._incremental_asset_index()
+        sector = self.assets[bond_id].sector
+        insert_at = bisect_right(index.sector_sequences.get(sector, []), index.sequence[issuer_id])
+        if sector != "Unknown" and index.sequence[bond_id] < index.sequence[issuer_id]:
+            insert_at -= 1
+        return insert_at
+
+    def _structural_relationships(self, source_id: str) -> list[Relationship]:
+        """Return ``source_id``'s same-sector and corporate-link edges in pairwise build order."""
+        index = self._incremental_asset_index()
+        rels: list[Relationship] = [
+            (target_id, "same_sector", self.same_sector_strength)
+            for target_id in index.sector_ids.get(self.assets[source_id].sector, [])
+            if target_id != source_id
+        ]
+        issuer_id = self._resolved_issuer(source_id)
+        if issuer_id is not None:
+            rels.insert(
+                self._corporate_link_position(source_id, issuer_id),
+                (issuer_id, "corporate_link", self.corporate_bond_strength),
+            )
+        return rels
+
+    def _event_relationships(self, source_id: str) -> list[Relationship]:
+        """Return the event-impact edges `_apply_event_impacts` adds for ``source_id``."""
+        if source_id not in self.assets:
+            return []
+        rels: list[Relationship] = []
+        seen: set[str] = set()
+        for event in self._incremental_event_index().events_by_source.get(source_id, []):
+            for target_id in event.related_assets:
+                if target_id in self.assets and target_id not in seen:
+                    seen.add(target_id)
+                    rels.append((target_id, "event_impact", abs(event.impact_score)))
+        return rels
+
+    def _set_outgoing(self, source_id: str, rels: list[Relationship]) -> None:
+        """Store ``rels`` as ``source_id``'s outgoing list, dropping the key when it is empty."""
+        relationships = self.relationships
+        previous = relationships.get(source_id)
+        if rels:
+            relationships[source_id] = rels
+            rels = relationships[source_id]
+        else:
+            relationships.pop(source_id, None)
+        self._relationship_keys.pop(source_id, None)
+        self._compact = None
+        new_rels = rels or None
+        if self._aggregates is not None:
+            self._aggregates.replace_source(source_id, previous, new_rels, self.assets)
+        if self._incoming is not None:
+            for edge in previous or ():
+                self._index_incoming(source_id, edge, added=False)
+            for edge in rels:
+                self._index_incoming(source_id, edge, added=True)
+        self._record_change()
+
+    def _retract_same_sector_edges(self, asset_id: str, sector: str) -> None:
+        """
+        Remove the ``same_sector`` edge to ``asset_id`` from every remaining member of ``sector``.
+
+        The edge is matched on target and type, so edges built with a different strength are
+        retracted too. Members without such an edge, as before the first build, are skipped.
+        """
+        if sector == "Unknown":
+            return
+        relationships = self.relationships
+        for member_id in self._incremental_asset_index().sector_ids.get(sector, []):
+            rels = relationships.get(member_id) or []
+            position = next(
+                (
+                    pos
+                    for pos, (target_id, rel_type, _) in enumerate(rels)
+                    if (target_id, rel_type) == (asset_id, "same_sector")
+                ),
+                None,
+            )
+            if position is None:
+                continue
+            edge = rels.pop(position)
+            self._record_edge_change(member_id, rels, edge, position, added=False)
+            if not rels:
+                self._set_outgoing(member_id, rels)
+            else:
+                self._relationship_keys.pop(member_id, None)
+
+    def _insert_same_sector_edges(self, asset_id: str, sector: str) -> None:
+        """Insert a ``same_sector`` edge to ``asset_id`` into every other member of ``sector``, in order."""
+        if sector == "Unknown":
+            return
+        index = self._incremental_asset_index()
+        relationships = self.relationships
+        sequence = index.sequence[asset_id]
+        rank = bisect_left(index.sector_sequences[sector], sequence)
+        edge = (asset_id, "same_sector", self.same_sector_strength)
+        for member_id in index.sector_ids[sector]:
+            if member_id == asset_id:
+                continue
+            insert_at = rank - 1 if index.sequence[member_id] < sequence else rank
+            issuer_id = self._resolved_issuer(member_id)
+            if issuer_id is not None and index.sequence[issuer_id] < sequence:
+                insert_at += 1
+            rels = relationships.get(member_id)
+            if rels is None:
+                relationships[member_id] = []
+                rels = relationships[member_id]
+                self._record_source_added(member_id)
+            rels.insert(insert_at, edge)
+            self._record_edge_change(member_id, rels, edge, insert_at, added=True)
+            self._relationship_keys.pop(member_id, None)
+
+    def _detach_issued_bond_links(self, issuer_id: str) -> list[str]:
+        """
+        Strip the corporate links of bonds that name ``issuer_id`` as their issuer.
+
+        Returns:
+            list[str]: IDs of the affected bonds, to be re-linked with `_attach_issued_bond_links`.
+        """
+        bond_ids = sorted(self._incremental_asset_index().bonds_by_issuer.get(issuer_id, set()) - {issuer_id})
+        relationships = self.relationships
+        for bond_id in bond_ids:
+            rels = relationships.get(bond_id)
+            if rels is not None:
+                self._set_outgoing(bond_id, [rel for rel in rels if rel[1] != "corporate_link"])
+        return bond_ids
+
+    def _attach_issued_bond_links(self, bond_ids: list[str]) -> None:
+        """Re-insert the corporate links of ``bond_ids`` where they still resolve to an issuer."""
+        relationships = self.relationships
+        for bond_id in bond_ids:
+            issuer_id = self._resolved_issuer(bond_id)
+            if issuer_id is None:
+                continue
+            rels = list(relationships.get(bond_id, []))
+            rels.insert(
+                self._corporate_link_position(bond_id, issuer_id),
+                (issuer_id, "corporate_link", self.corporate_bond_strength),
+            )
+            self._set_outgoing(bond_id, rels)
+
+    def _refresh_event_impacts_targeting(self, asset_id: str) -> None:
+        """Re-apply the event-impact edges of every event source that names ``asset_id`` as related."""
+        relationships = self.relationships
+        for source_id in sorted(self._incremental_event_index().sources_by_related.get(asset_id, set())):
+            if source_id == asset_id:
+                continue
+            rels = [rel for rel in relationships.get(source_id, []) if rel[1] != "event_impact"]
+            self._set_outgoing(source_id, rels + self._event_relationships(source_id))
 
     def collect_participating_asset_ids(self) -> set[str]:  # pylint: disable=unsubscriptable-object
         """
@@ -423,6 +1520,9 @@ class AssetRelationshipGraph:
                 relationship targets.
         """
         all_ids = set(self.assets.keys())
+        if self.backend == "csr":
+            all_ids.update(self._compact_view().node_ids)
+            return all_ids
         all_ids.update(self.relationships.keys())
         for rels in self.relationships.values():
             for target_id, _, _ in rels:
@@ -437,11 +1537,9 @@ class AssetRelationshipGraph:
             dist (dict[str, int]): Mapping from asset_class.value to the number of
                 assets with that class.
         """
-        dist: dict[str, int] = {}
-        for asset in self.assets.values():
-            key = asset.asset_class.value
-            dist[key] = dist.get(key, 0) + 1
-        return dist
+        if self.backend == "csr":
+            return metrics_engine.asset_class_distribution(self.assets)
+        return dict(self._metric_aggregates().asset_class_counts)
 
     def _degree_metrics(self) -> tuple[float, int]:
         """
@@ -451,10 +1549,13 @@ class AssetRelationshipGraph:
             tuple[float, int]: Average and maximum outgoing relationship counts
                 across sources present in `relationships`.
         """
-        degrees = [len(rels) for rels in self.relationships.values()]
-        if not degrees:
+        if self.backend == "csr":
+            return metrics_engine.degree_summary(self._compact_view())
+
+        aggregates = self._metric_aggregates()
+        if aggregates.source_count == 0:
             return 0.0, 0
-        return sum(degrees) / len(degrees), max(degrees)
+        return aggregates.edge_count / aggregates.source_count, aggregates.max_degree
 
 
 def calculate_graph_density(asset_count: int, relationship_count: int) -> float:
@@ -0,0 +1,226 @@
+"""Columnar (CSR) adjacency storage for asset relationship graphs."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+CompactRelationship = tuple[str, str, float]
+CompactEdge = tuple[str, str, str, float]
+# float32 stores strengths in [-1, 1] within 6e-8, so rounding to 6 places restores any 6-place input.
+_STRENGTH_DECIMALS = 6
+
+
+def decode_strengths(strengths: np.ndarray) -> list[float]:
+    """
+    Convert float32 strengths back to the Python floats they were stored from.
+
+    Values are widened to float64 and rounded to ``_STRENGTH_DECIMALS`` places, so
+    strengths such as ``0.7`` round-trip exactly instead of surfacing as
+    ``0.699999988079071``.
+
+    Parameters:
+        strengths (np.ndarray): One-dimensional float32 array of edge strengths.
+
+    Returns:
+        list[float]: Python floats in the same order as ``strengths``.
+    """
+    return np.round(strengths.astype(np.float64), _STRENGTH_DECIMALS).tolist()
+
+
+@dataclass(frozen=True, eq=False)
+class CompactAdjacency:
+    """
+    Immutable CSR snapshot of a ``source_id -> [(target_id, rel_type, strength)]`` map.
+
+    Node and relationship-type strings are interned to integer codes. Sources keep
+    their mapping order and occupy node codes ``0 .. source_count - 1``; nodes that
+    only appear as targets follow. Row ``i`` of the CSR arrays holds the outgoing
+    edges of node ``i`` in their original list order.
+
+    Attributes:
+        node_ids (tuple[str, ...]): Interned node identifiers indexed by node code.
+        relationship_types (tuple[str, ...]): Interned relationship types indexed by type code.
+        source_count (int): Number of source rows, including sources with no edges.
+        indptr (np.ndarray): int64 row offsets of length ``source_count + 1``.
+        targets (np.ndarray): int32 target node code per edge.
+        type_codes (np.ndarray): Unsigned integer relationship-type code per edge.
+        strengths (np.ndarray): float32 strength per edge.
+        strength_sum (float): Exact float64 sum of the original strengths in edge order.
+    """
+
+    node_ids: tuple[str, ...]
+    relationship_types: tuple[str, ...]
+    source_count: int
+    indptr: np.ndarray
+    targets: np.ndarray
+    type_codes: np.ndarray
+    strengths: np.ndarray
+    strength_sum: float
+    node_index: dict[str, int] = field(repr=False)
+
+    @classmethod
+    def from_relationships(cls, relationships: Mapping[str, Sequence[CompactRelationship]]) -> CompactAdjacency:
+        """
+        Intern and pack a relationship map into CSR arrays.
+
+        Parameters:
+            relationships (Mapping[str, Sequence[tuple[str, str, float]]]): Outgoing relationships
+                keyed by source ID, as stored in ``AssetRelationshipGraph.relationships``.
+
+        Returns:
+            CompactAdjacency: A snapshot preserving source order and per-source edge order.
+        """
+        node_index: dict[str, int] = {source_id: code for code, source_id in enumerate(relationships)}
+        type_index: dict[str, int] = {}
+        source_count = len(node_index)
+        edge_count = sum(len(rels) for rels in relationships.values())
+
+        indptr = np.zeros(source_count + 1, dtype=np.int64)
+        targets = np.empty(edge_count, dtype=np.int32)
+        type_codes_list: list[int] = []
+        strengths_list: list[float] = []
+        strength_sum = 0.0
+        position = 0
+        for row, rels in enumerate(relationships.values()):
+            for target_id, rel_type, strength in rels:
+                target_code = node_index.get(target_id)
+                if target_code is None:
+                    target_code = node_index[target_id] = len(node_index)
+                targets[position] = target_code
+                type_code = type_index.get(rel_type)
+                if type_code is None:
+                    type_code = type_index[rel_type] = len(type_index)
+                type_codes_list.append(type_code)
+                strength_f = float(strength)
+                strengths_list.append(strength_f)
+                strength_sum += strength_f
+                position += 1
+            indptr[row + 1] = position
+
+        type_dtype = np.uint16 if len(type_index) <= np.iinfo(np.uint16).max else np.uint32
+        return cls(
+            node_ids=tuple(node_index),
+            relationship_types=tuple(type_index),
+            source_count=source_count,
+            indptr=indptr,
+            targets=targets,
+            type_codes=np.asarray(type_codes_list, dtype=type_dtype),
+            strengths=np.asarray(strengths_list, dtype=np.float32),
+            strength_sum=strength_sum,
+            node_index=node_index,
+        )
+
+    @property
+    def edge_count(self) -> int:
+        """Return the number of stored directed edges."""
+        return int(self.targets.size)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes held by the CSR arrays (excluding interned strings)."""
+        return int(
+            self.indptr.nbytes + self.targets.nbytes + self.type_codes.nbytes + self.strengths.nbytes,
+        )
+
+    def out_degrees(self) -> np.ndarray:
+        """Return the outgoing edge count of every source row."""
+        return np.diff(self.indptr)
+
+    def out_degree(self, source_id: str) -> int:
+        """Return the outgoing edge count of ``source_id`` (0 when it has no row)."""
+        row = self.node_index.get(source_id)
+        if row is None or row >= self.source_count:
+            return 0
+        return int(self.indptr[row + 1] - self.indptr[row])
+
+    def edge_sources(self, edge_positions: np.ndarray) -> np.ndarray:
+        """Return the source node code owning each edge position."""
+        return np.searchsorted(self.indptr, edge_positions, side="right") - 1
+
+    def top_edges(self, k: int) -> list[CompactEdge]:
+        """
+        Return up to ``k`` edges by descending strength.
+
+        Ties keep edge storage order, matching a stable sort over the dict view. Only the
+        ``k`` candidates picked by a linear-time partition are sorted.
+        """
+        edge_count = self.edge_count
+        if k <= 0 or edge_count == 0:
+            return []
+        strengths = self.strengths
+        if k >= edge_count:
+            candidates = np.arange(edge_count)
+        else:
+            threshold = np.partition(strengths, edge_count - k)[edge_count - k]
+            above = np.flatnonzero(strengths > threshold)
+            tied = np.flatnonzero(strengths == threshold)[: k - above.size]
+            candidates = np.sort(np.concatenate((above, tied)))
+        order = candidates[np.argsort(-strengths[candidates], kind="stable")]
+        return self._edges_at(order)
+
+    def outgoing(self, source_id: str) -> list[CompactRelationship]:
+        """Return the outgoing ``(target_id, rel_type, strength)`` tuples of ``source_id``."""
+        row = self.node_index.get(source_id)
+        if row is None or row >= self.source_count:
+            return []
+        return self._row_relationships(row)
+
+    def iter_edges(self, chunk_size: int = 65_536) -> Iterator[CompactEdge]:
+        """Yield ``(source_id, target_id, rel_type, strength)`` for every edge in storage order."""
+        for start in range(0, self.edge_count, chunk_size):
+            yield from self._edges_at(np.arange(start, min(start + chunk_size, self.edge_count)))
+
+    def to_relationships(self) -> dict[str, list[CompactRelationship]]:
+        """Materialize the dict-of-lists relationship map this snapshot was built from."""
+        node_ids = self.node_ids
+        rel_types = self.relationship_types
+        target_ids = [node_ids[code] for code in self.targets.tolist()]
+        type_names = [rel_types[code] for code in self.type_codes.tolist()]
+        strengths = decode_strengths(self.strengths)
+        offsets = self.indptr.tolist()
+        return {
+            node_ids[row]: list(
+                zip(
+                    target_ids[offsets[row] : offsets[row + 1]],
+                    type_names[offsets[row] : offsets[row + 1]],
+                    strengths[offsets[row] : offsets[row + 1]],
+                    strict=True,
+                )
+            )
+            for row in range(self.source_count)
+        }
+
+    def _row_relationships(self, row: int) -> list[CompactRelationship]:
+        """Decode one CSR row into relationship tuples."""
+        start, end = int(self.indptr[row]), int(self.indptr[row + 1])
+        return [
+            (self.node_ids[target], self.relationship_types[type_code], strength)
+            for target, type_code, strength in zip(
+                self.targets[start:end].tolist(),
+                self.type_codes[start:end].tolist(),
+                decode_strengths(self.strengths[start:end]),
+                strict=True,
+            )
+        ]
+
+    def _edges_at(self, edge_positions: np.ndarray) -> list[CompactEdge]:
+        """Decode the edges stored at ``edge_positions`` into 4-tuples."""
+        sources = self.edge_sources(edge_positions).tolist()
+        return [
+            (
+                self.node_ids[source],
+                self.node_ids[target],
+                self.relationship_types[type_code],
+                strength,
+            )
+            for source, target, type_code, strength in zip(
+                sources,
+                self.targets[edge_positions].tolist(),
+                self.type_codes[edge_positions].tolist(),
+                decode_strengths(self.strengths[edge_positions]),
+                strict=True,
+            )
+        ]
@@ -0,0 +1,57 @@
+"""Vectorized node layouts shared by the API, Gradio and MCP visualizations.
+
+Positions depend only on the node count, so each layout is computed once per count
+with NumPy and returned as a read-only array. Graphs cache the layout of their
+participating assets per version on top of this (see
+`AssetRelationshipGraph.get_3d_visualization_data_enhanced`).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+_GOLDEN_RATIO = (1 + np.sqrt(5)) / 2
+
+
+@lru_cache(maxsize=8)
+def circular_layout(node_count: int) -> np.ndarray:
+    """
+    Return ``node_count`` points evenly spaced on the unit circle in the XY plane.
+
+    Parameters:
+        node_count (int): Number of nodes to place.
+
+    Returns:
+        np.ndarray: Read-only float64 array of shape ``(node_count, 3)`` with z = 0.
+    """
+    theta = np.linspace(0, 2 * np.pi, node_count, endpoint=False)
+    positions = np.stack((np.cos(theta), np.sin(theta), np.zeros_like(theta)), axis=1)
+    positions.setflags(write=False)
+    return positions
+
+
+@lru_cache(maxsize=8)
+def fibonacci_sphere_layout(node_count: int) -> np.ndarray:
+    """
+    Return ``node_count`` points spread over the unit sphere along a Fibonacci spiral.
+
+    A single node sits at the origin.
+
+    Parameters:
+        node_count (int): Number of nodes to place.
+
+    Returns:
+        np.ndarray: Read-only float64 array of shape ``(node_count, 3)``.
+    """
+    if node_count <= 1:
+        positions = np.zeros((node_count, 3))
+    else:
+        index = np.arange(node_count, dtype=np.float64)
+        theta = np.arccos(1 - 2 * (index + 0.5) / node_count)
+        phi = 2 * np.pi * index / _GOLDEN_RATIO
+        sin_theta = np.sin(theta)
+        positions = np.stack((sin_theta * np.cos(phi), sin_theta * np.sin(phi), np.cos(theta)), axis=1)
+    positions.setflags(write=False)
+    return positions
@@ -0,0 +1,136 @@
+"""Structural decomposition of an asset relationship graph.
+
+Connected components come from a union-find pass over every relationship, with
+edge direction ignored. Communities come from label propagation over the same
+undirected adjacency, weighted by relationship strength. Both are returned as
+clusters of sorted asset ids, largest first, so a UI can colour nodes without
+walking the graph itself.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.logic.asset_graph import AssetRelationshipGraph
+
+DEFAULT_LABEL_PROPAGATION_ROUNDS = 20
+
+
+@dataclass(frozen=True, slots=True)
+class GraphStructure:
+    """Connected components and, when requested, label-propagation communities."""
+
+    components: list[tuple[str, ...]]
+    communities: list[tuple[str, ...]] | None = None
+
+
+class _UnionFind:
+    """Disjoint sets over integer node indexes with path halving and union by size."""
+
+    __slots__ = ("parent", "size")
+
+    def __init__(self, count: int) -> None:
+        self.parent = list(range(count))
+        self.size = [1] * count
+
+    def find(self, node: int) -> int:
+        """Return the root of ``node``'s set, halving the path on the way."""
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, left: int, right: int) -> None:
+        """Merge the sets of ``left`` and ``right``, attaching the smaller under the larger."""
+        left, right = self.find(left), self.find(right)
+        if left == right:
+            return
+        if self.size[left] < self.size[right]:
+            left, right = right, left
+        self.parent[right] = left
+        self.size[left] += self.size[right]
+
+
+def _clusters(node_ids: list[str], labels: list[int]) -> list[tuple[str, ...]]:
+    """Group ``node_ids`` by label, largest group first and ties by first asset id."""
+    groups: dict[int, list[str]] = {}
+    for asset_id, label in zip(node_ids, labels, strict=True):
+        groups.setdefault(label, []).append(asset_id)
+    # node_ids is sorted, so each group is already sorted and starts with its smallest id.
+    return sorted((tuple(group) for group in groups.values()), key=lambda group: (-len(group), group[0]))
+
+
+def _label_propagation(neighbors: list[dict[int, float]], max_rounds: int) -> list[int]:
+    """
+    Assign each node the label carrying the most neighbour strength until labels settle.
+
+    Nodes are visited in index order and updated in place, so results are deterministic.
+    Ties keep the current label when it is among the best, otherwise take the smallest.
+    """
+    labels = list(range(len(neighbors)))
+    for _ in range(max_rounds):
+        changed = False
+        for node, node_neighbors in enumerate(neighbors):
+            if not node_neighbors:
+                continue
+            weights: dict[int, float] = {}
+            for neighbor, weight in node_neighbors.items():
+                label = labels[neighbor]
+                weights[label] = weights.get(label, 0.0) + weight
+            best_weight = max(weights.values())
+            current = labels[node]
+            if weights.get(current) == best_weight:
+                continue
+            labels[node] = min(label for label, weight in weights.items() if weight == best_weight)
+            changed = True
+        if not changed:
+            break
+    return labels
+
+
+def graph_structure(
+    graph: AssetRelationshipGraph,
+    *,
+    communities: bool = False,
+    max_rounds: int = DEFAULT_LABEL_PROPAGATION_ROUNDS,
+) -> GraphStructure:
+    """
+    Decompose ``graph`` into connected components and, optionally, communities.
+
+    Parameters:
+        graph (AssetRelationshipGraph): Graph to decompose. Stored assets without
+            relationships form singleton clusters.
+        communities (bool): When True, also run label propagation.
+        max_rounds (int): Upper bound on label-propagation sweeps.
+
+    Returns:
+        GraphStructure: Clusters of sorted asset ids, largest first.
+    """
+    edges = list(graph.iter_relationships())
+    participants = set(graph.assets)
+    participants.update(chain.from_iterable((source_id, target_id) for source_id, target_id, _, _ in edges))
+    node_ids = sorted(participants)
+    index = {asset_id: position for position, asset_id in enumerate(node_ids)}
+
+    union_find = _UnionFind(len(node_ids))
+    for source_id, target_id, _rel_type, _strength in edges:
+        union_find.union(index[source_id], index[target_id])
+    components = _clusters(node_ids, [union_find.find(node) for node in range(len(node_ids))])
+    if not communities:
+        return GraphStructure(components=components)
+
+    neighbors: list[dict[int, float]] = [{} for _ in node_ids]
+    for source_id, target_id, _rel_type, strength in edges:
+        source, target = index[source_id], index[target_id]
+        if strength <= 0 or source == target:
+            continue
+        neighbors[source][target] = neighbors[source].get(target, 0.0) + strength
+        neighbors[target][source] = neighbors[target].get(source, 0.0) + strength
+    return GraphStructure(
+        components=components,
+        communities=_clusters(node_ids, _label_propagation(neighbors, max_rounds)),
+    )
@@ -0,0 +1,77 @@
+"""NumPy metrics engine over interned (CSR) relationship storage."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+
+from src.logic.compact_adjacency import CompactAdjacency
+from src.models.financial_models import Asset
+
+
+def degree_summary(adjacency: CompactAdjacency) -> tuple[float, int]:
+    """
+    Return the mean and maximum outgoing degree across source rows.
+
+    Matches `AssetRelationshipGraph._degree_metrics`: sources with empty lists are
+    included and an empty map yields ``(0.0, 0)``.
+    """
+    if adjacency.source_count == 0:
+        return 0.0, 0
+    degrees = adjacency.out_degrees()
+    return int(degrees.sum()) / adjacency.source_count, int(degrees.max())
+
+
+def relationship_type_distribution(adjacency: CompactAdjacency) -> dict[str, int]:
+    """Return edge counts per relationship type in first-seen type order."""
+    counts = np.bincount(adjacency.type_codes, minlength=len(adjacency.relationship_types))
+    return {rel_type: int(count) for rel_type, count in zip(adjacency.relationship_types, counts, strict=True)}
+
+
+def value_distribution(values: Iterable[str]) -> dict[str, int]:
+    """
+    Count occurrences of each value, keyed in first-seen order.
+
+    Values are arbitrary strings with no interned codes, so a hashing ``Counter`` is
+    used rather than ``np.unique``, which would sort the Python objects.
+
+    Parameters:
+        values (Iterable[str]): Values to count.
+
+    Returns:
+        dict[str, int]: Mapping from each distinct value to its count.
+    """
+    return dict(Counter(values))
+
+
+def asset_class_distribution(assets: Mapping[str, Asset]) -> dict[str, int]:
+    """Return asset counts per ``asset_class.value`` in first-seen asset order."""
+    return value_distribution(asset.asset_class.value for asset in assets.values())
+
+
+def participating_count(adjacency: CompactAdjacency, assets: Mapping[str, Asset]) -> int:
+    """
+    Count stored assets plus interned node IDs that are not stored assets.
+
+    Equals ``len(AssetRelationshipGraph.collect_participating_asset_ids())`` without
+    building the union set.
+    """
+    node_count = len(adjacency.node_ids)
+    if node_count == 0:
+        return len(assets)
+    node_index = adjacency.node_index
+    asset_codes = np.fromiter(
+        (code for code in map(node_index.get, assets) if code is not None),
+        dtype=np.int64,
+    )
+    is_asset = np.zeros(node_count, dtype=bool)
+    is_asset[asset_codes] = True
+    return len(assets) + node_count - int(np.count_nonzero(is_asset))
+
+
+def average_strength(adjacency: CompactAdjacency) -> float:
+    """Return the mean edge strength from the exact float64 sum kept at pack time (0.0 without edges)."""
+    edge_count = adjacency.edge_count
+    return (adjacency.strength_sum / edge_count) if edge_count else 0.0
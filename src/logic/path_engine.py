@@ -0,0 +1,260 @@
+"""Weighted path queries over an asset relationship graph.
+
+Relationship strengths are turned into additive costs with ``-log(strength)``, so the
+cheapest path is the one whose strengths multiply to the largest exposure. Searches
+run Dijkstra with a binary heap over an integer-indexed adjacency built once from the
+graph, and stop early on a node-expansion cap or a wall-clock budget.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.logic.asset_graph import AssetRelationshipGraph
+
+# Expansions between wall-clock checks; keeps perf_counter calls off the hot path.
+_BUDGET_CHECK_INTERVAL = 64
+
+
+@dataclass(frozen=True, slots=True)
+class WeightedPath:
+    """One path with the relationship type of each hop and its total cost."""
+
+    asset_ids: tuple[str, ...]
+    relationship_types: tuple[str, ...]
+    cost: float
+
+    @property
+    def exposure(self) -> float:
+        """Return the product of the hop strengths, ``exp(-cost)``."""
+        return math.exp(-self.cost)
+
+
+@dataclass(frozen=True, slots=True)
+class PathSearchResult:
+    """Paths found by a search and whether a cap or budget cut it short."""
+
+    paths: list[WeightedPath]
+    expanded: int
+    truncated: bool
+
+
+class PathEngine:
+    """
+    Integer-indexed adjacency with ``-log(strength)`` costs and Dijkstra searches.
+
+    Edges with a non-positive strength carry no exposure and are left out; strengths
+    above 1.0 are clamped so every cost is non-negative.
+    """
+
+    __slots__ = ("asset_ids", "costs", "index", "neighbors", "relationship_types")
+
+    def __init__(
+        self,
+        asset_ids: list[str],
+        neighbors: list[list[int]],
+        costs: list[list[float]],
+        relationship_types: list[list[str]],
+    ) -> None:
+        """
+        Wrap prebuilt adjacency lists; use `from_graph` to build them.
+
+        Parameters:
+            asset_ids (list[str]): Node IDs by integer index.
+            neighbors (list[list[int]]): Neighbor indexes per node.
+            costs (list[list[float]]): Edge costs aligned with ``neighbors``.
+            relationship_types (list[list[str]]): Edge types aligned with ``neighbors``.
+        """
+        self.asset_ids = asset_ids
+        self.index = {asset_id: position for position, asset_id in enumerate(asset_ids)}
+        self.neighbors = neighbors
+        self.costs = costs
+        self.relationship_types = relationship_types
+
+    @classmethod
+    def from_graph(cls, graph: AssetRelationshipGraph, *, undirected: bool = True) -> PathEngine:
+        """
+        Build the adjacency from every relationship of ``graph``.
+
+        Parameters:
+            graph (AssetRelationshipGraph): Graph to index.
+            undirected (bool): When True (default), every edge can also be walked from its
+                target back to its source, so exposure flows against edge direction too,
+                for example from an issuer to the bonds that link to it.
+
+        Returns:
+            PathEngine: Engine over the graph's current relationships.
+        """
+        index: dict[str, int] = {}
+        asset_ids: list[str] = []
+        neighbors: list[list[int]] = []
+        costs: list[list[float]] = []
+        relationship_types: list[list[str]] = []
+
+        def position_of(asset_id: str) -> int:
+            position = index.get(asset_id)
+            if position is None:
+                position = index[asset_id] = len(asset_ids)
+                asset_ids.append(asset_id)
+                neighbors.append([])
+                costs.append([])
+                relationship_types.append([])
+            return position
+
+        for source_id, target_id, rel_type, strength in graph.iter_relationships():
+            if strength <= 0:
+                continue
+            cost = -math.log(min(strength, 1.0))
+            source = position_of(source_id)
+            target = position_of(target_id)
+            neighbors[source].append(target)
+            costs[source].append(cost)
+            relationship_types[source].append(rel_type)
+            if undirected:
+                neighbors[target].append(source)
+                costs[target].append(cost)
+                relationship_types[target].append(rel_type)
+        return cls(asset_ids, neighbors, costs, relationship_types)
+
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        *,
+        max_expansions: int,
+        time_budget_s: float | None = None,
+    ) -> PathSearchResult:
+        """
+        Return the highest-exposure path from ``source_id`` to ``target_id``, if one is found.
+
+        Parameters:
+            source_id (str): Start node.
+            target_id (str): End node.
+            max_expansions (int): Maximum number of nodes whose edges are relaxed.
+            time_budget_s (float | None): Optional wall-clock budget in seconds.
+
+        Returns:
+            PathSearchResult: At most one path; ``truncated`` is True when the search stopped
+                on the cap or budget before reaching ``target_id``.
+        """
+        source = self.index.get(source_id)
+        target = self.index.get(target_id)
+        if source is None or target is None:
+            return PathSearchResult(paths=[], expanded=0, truncated=False)
+        settled, predecessors, expanded, truncated = self._dijkstra(
+            source,
+            stop_at=target,
+            max_settled=None,
+            max_expansions=max_expansions,
+            time_budget_s=time_budget_s,
+        )
+        if not settled or settled[-1][0] != target:
+            return PathSearchResult(paths=[], expanded=expanded, truncated=truncated)
+        return PathSearchResult(
+            paths=[self._path_to(target, settled[-1][1], predecessors)],
+            expanded=expanded,
+            truncated=False,
+        )
+
+    def exposure_paths(
+        self,
+        source_id: str,
+        *,
+        max_paths: int,
+        max_expansions: int,
+        time_budget_s: float | None = None,
+    ) -> PathSearchResult:
+        """
+        Return the best path from ``source_id`` to each of its most exposed nodes.
+
+        Nodes are settled in order of increasing cost, so the first ``max_paths`` settled
+        nodes are those with the largest exposure to ``source_id``.
+
+        Parameters:
+            source_id (str): Node the stress starts from.
+            max_paths (int): Maximum number of paths (one per reached node).
+            max_expansions (int): Maximum number of nodes whose edges are relaxed.
+            time_budget_s (float | None): Optional wall-clock budget in seconds.
+
+        Returns:
+            PathSearchResult: Paths ordered by decreasing exposure.
+        """
+        source = self.index.get(source_id)
+        if source is None:
+            return PathSearchResult(paths=[], expanded=0, truncated=False)
+        settled, predecessors, expanded, truncated = self._dijkstra(
+            source,
+            stop_at=None,
+            max_settled=max_paths + 1,
+            max_expansions=max_expansions,
+            time_budget_s=time_budget_s,
+        )
+        paths = [self._path_to(node, cost, predecessors) for node, cost in settled if node != source]
+        return PathSearchResult(paths=paths[:max_paths], expanded=expanded, truncated=truncated)
+
+    def _dijkstra(
+        self,
+        source: int,
+        *,
+        stop_at: int | None,
+        max_settled: int | None,
+        max_expansions: int,
+        time_budget_s: float | None,
+    ) -> tuple[list[tuple[int, float]], dict[int, tuple[int, str]], int, bool]:
+        """
+        Settle nodes from ``source`` in cost order until a stop condition holds.
+
+        Returns:
+            tuple: Settled ``(node, cost)`` pairs in settlement order, the predecessor and
+                hop type of each reached node, the expansion count, and whether the cap or
+                budget ended the search.
+        """
+        deadline = time.perf_counter() + time_budget_s if time_budget_s is not None else None
+        neighbors, costs, relationship_types = self.neighbors, self.costs, self.relationship_types
+        best = {source: 0.0}
+        predecessors: dict[int, tuple[int, str]] = {}
+        settled: list[tuple[int, float]] = []
+        done: set[int] = set()
+        heap = [(0.0, source)]
+        expanded = 0
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            done.add(node)
+            settled.append((node, cost))
+            if node == stop_at or len(settled) == max_settled:
+                return settled, predecessors, expanded, False
+            if expanded == max_expansions:
+                return settled, predecessors, expanded, True
+            if deadline is not None and expanded % _BUDGET_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+                return settled, predecessors, expanded, True
+            expanded += 1
+            for neighbor, edge_cost, rel_type in zip(
+                neighbors[node], costs[node], relationship_types[node], strict=True
+            ):
+                candidate = cost + edge_cost
+                if candidate < best.get(neighbor, math.inf):
+                    best[neighbor] = candidate
+                    predecessors[neighbor] = (node, rel_type)
+                    heapq.heappush(heap, (candidate, neighbor))
+        return settled, predecessors, expanded, False
+
+    def _path_to(self, node: int, cost: float, predecessors: dict[int, tuple[int, str]]) -> WeightedPath:
+        """Walk predecessors back from ``node`` and return the path in source-to-node order."""
+        nodes = [node]
+        hop_types: list[str] = []
+        while node in predecessors:
+            node, rel_type = predecessors[node]
+            nodes.append(node)
+            hop_types.append(rel_type)
+        return WeightedPath(
+            asset_ids=tuple(self.asset_ids[position] for position in reversed(nodes)),
+            relationship_types=tuple(reversed(hop_types)),
+            cost=cost,
+        )
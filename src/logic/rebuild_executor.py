@@ -42,13 +42,17 @@ class RebuildExecutor:
         Parameters:
             assets: Iterable of assets to add to the graph.
             regulatory_events: Iterable of regulatory events to add to the graph.
-            on_checkpoint: Optional callback invoked every 50 assets.
+            on_checkpoint: Optional callback invoked every 50 assets and after the asset loop with the
+                resumable ``processed_ids`` state. Relationship block progress is logged instead, so the
+                last checkpoint always carries ``processed_ids``.
             initial_checkpoint: Optional dict state used to resume a partial rebuild. Expected to contain
                 'processed_ids' (list of str).
             cancel_event: Optional threading.Event to signal rebuild cancellation.
             execution_id: Optional string identifying the current execution process.
             expected_execution_id: Optional string (or callable returning a string) identifying the expected owner.
                 Rebuild raises if execution_id != expected_execution_id.
+            relationship_workers: Optional worker process count; when set, relationships are built in
+                parallel sector blocks. The cancel_event is honoured between blocks either way.
 
         Returns:
             AssetRelationshipGraph: The fully reconstructed graph.
@@ -67,6 +71,7 @@ class RebuildExecutor:
             "cancel_event",
             "execution_id",
             "expected_execution_id",
+            "relationship_workers",
         }
         unexpected = set(kwargs.keys()) - allowed_kwargs
         if unexpected:
@@ -98,7 +103,13 @@ class RebuildExecutor:
 
         self._check_cancellation(cancel_event, "relationship building preparation")
         self._validate_execution_ownership(**kwargs)
-        graph.build_relationships()
+        relationship_workers = kwargs.get("relationship_workers")
+        graph.build_relationships(
+            parallel=relationship_workers is not None,
+            workers=relationship_workers,
+            cancel_event=cancel_event,
+            on_progress=self._log_relationship_progress,
+        )
 
         self._log_rebuild_completion(graph)
         return graph
@@ -212,6 +223,21 @@ class RebuildExecutor:
             self._check_cancellation(cancel_event, "regulatory event processing")
             graph.add_regulatory_event(event)
 
+    def _log_relationship_progress(self, progress: dict[str, Any]) -> None:
+        """Log one merged relationship block of the rebuild."""
+        log_event(
+            logger,
+            logging.DEBUG,
+            ObservabilityEvent(
+                event="reconciliation_relationship_block_merged",
+                message=(
+                    f"Relationship block {progress['completed_blocks']}/{progress['total_blocks']} merged: "
+                    f"{progress['merged_source_count']} sources"
+                ),
+                metadata=progress,
+            ),
+        )
+
     def _log_rebuild_completion(self, graph: AssetRelationshipGraph) -> None:
         """Log the successful completion of the rebuild."""
         log_event(
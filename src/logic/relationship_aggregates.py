@@ -0,0 +1,339 @@
+"""Running relationship statistics for the in-memory asset graph."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Mapping, Sequence
+
+from src.models.financial_models import Asset
+
+AggregateRelationship = tuple[str, str, float]
+AggregateTopRelationship = tuple[str, str, str, float]
+# (source_id, target_id, rel_type, strength, position in the source's list) of a buffered edge.
+_TopEntry = tuple[str, str, str, float, int]
+
+DEFAULT_TOP_RELATIONSHIPS = 10
+
+
+class RelationshipAggregates:
+    """
+    Metric inputs kept in step with a relationship map as edges and assets change.
+
+    Tracks the relationship-type distribution, the strength sum, a histogram of
+    outgoing degrees, the asset-class distribution and the set of referenced IDs
+    that are not stored assets, so metrics can be read without walking every edge.
+    The strongest relationships are kept in an ordered buffer of up to ``2 * top_k``
+    entries: added edges are inserted in place and removed ones are deleted, and the
+    map is only rescanned once removals leave fewer than the requested entries.
+    Buffered entries carry their list position, so ties within a source are ordered
+    without searching the source's list.
+    """
+
+    __slots__ = (
+        "asset_class_counts",
+        "degree_histogram",
+        "edge_count",
+        "external_ids",
+        "reference_counts",
+        "source_count",
+        "strength_sum",
+        "top_k",
+        "type_counts",
+        "_next_source_order",
+        "_source_order",
+        "_top",
+    )
+
+    def __init__(self, assets: Mapping[str, Asset], top_k: int = DEFAULT_TOP_RELATIONSHIPS) -> None:
+        """
+        Start aggregates for ``assets`` with an empty relationship map.
+
+        Parameters:
+            assets (Mapping[str, Asset]): Stored assets keyed by ID.
+            top_k (int): Number of strongest relationships to keep selected.
+        """
+        self.top_k = top_k
+        self.edge_count = 0
+        self.source_count = 0
+        self.strength_sum = 0.0
+        self.type_counts: dict[str, int] = {}
+        self.degree_histogram: dict[int, int] = {}
+        self.reference_counts: dict[str, int] = {}
+        self.external_ids: set[str] = set()
+        self.asset_class_counts: dict[str, int] = {}
+        # Map position of every source key, so ties can be ordered without walking the map.
+        self._source_order: dict[str, int] = {}
+        self._next_source_order = 0
+        # Prefix of the stable descending-strength order; None until first selected.
+        self._top: list[_TopEntry] | None = []
+        for asset in assets.values():
+            self.add_asset(asset, assets)
+
+    @classmethod
+    def from_relationships(
+        cls,
+        assets: Mapping[str, Asset],
+        relationships: Mapping[str, Sequence[AggregateRelationship]],
+        top_k: int = DEFAULT_TOP_RELATIONSHIPS,
+    ) -> RelationshipAggregates:
+        """
+        Build aggregates for an existing relationship map in one pass.
+
+        Parameters:
+            assets (Mapping[str, Asset]): Stored assets keyed by ID.
+            relationships (Mapping[str, Sequence[tuple[str, str, float]]]): Outgoing relationships keyed by source ID.
+            top_k (int): Number of strongest relationships to keep selected.
+
+        Returns:
+            RelationshipAggregates: Aggregates equal to replaying every edge in map order.
+        """
+        aggregates = cls(assets, top_k)
+        type_counts = aggregates.type_counts
+        degree_histogram = aggregates.degree_histogram
+        reference_counts = aggregates.reference_counts
+        strength_sum = 0.0
+        for source_id, rels in relationships.items():
+            degree = len(rels)
+            degree_histogram[degree] = degree_histogram.get(degree, 0) + 1
+            reference_counts[source_id] = reference_counts.get(source_id, 0) + 1
+            for target_id, rel_type, strength in rels:
+                type_counts[rel_type] = type_counts.get(rel_type, 0) + 1
+                reference_counts[target_id] = reference_counts.get(target_id, 0) + 1
+                strength_sum += float(strength)
+            aggregates.edge_count += degree
+        aggregates.source_count = len(relationships)
+        aggregates.strength_sum = strength_sum
+        aggregates._source_order = {source_id: order for order, source_id in enumerate(relationships)}
+        aggregates._next_source_order = len(relationships)
+        aggregates.external_ids = {node_id for node_id in reference_counts if node_id not in assets}
+        aggregates._top = None
+        return aggregates
+
+    @property
+    def max_degree(self) -> int:
+        """Return the largest outgoing degree among sources (0 when there are none)."""
+        return max(self.degree_histogram, default=0)
+
+    def participating_count(self, assets: Mapping[str, Asset]) -> int:
+        """Return the number of stored assets plus referenced IDs that are not stored assets."""
+        return len(assets) + len(self.external_ids)
+
+    def top_relationships(
+        self,
+        relationships: Mapping[str, Sequence[AggregateRelationship]],
+        k: int | None = None,
+    ) -> list[AggregateTopRelationship]:
+        """
+        Return up to ``k`` relationships by descending strength (``top_k`` when omitted).
+
+        Ties keep relationship-map order. Up to ``top_k`` entries are served from the
+        maintained buffer, which is refilled with a bounded heap over ``relationships``
+        only when it is unset or removals have left it shorter than ``k``; larger ``k``
+        are selected directly without being cached.
+        """
+        if k is None:
+            k = self.top_k
+        if k > self.top_k:
+            return select_top_relationships(relationships, k)
+        top = self._top
+        if top is None or (len(top) < k and len(top) < self.edge_count):
+            top = self._top = _select_top_entries(relationships, 2 * self.top_k)
+        return [entry[:4] for entry in top[:k]]
+
+    def add_asset(self, asset: Asset, assets: Mapping[str, Asset]) -> None:
+        """Count ``asset`` after it has been stored in ``assets``."""
+        key = asset.asset_class.value
+        self.asset_class_counts[key] = self.asset_class_counts.get(key, 0) + 1
+        self.external_ids.discard(asset.id)
+
+    def remove_asset(self, asset: Asset, assets: Mapping[str, Asset]) -> None:
+        """Uncount ``asset`` after it has been removed from (or replaced in) ``assets``."""
+        key = asset.asset_class.value
+        remaining = self.asset_class_counts[key] - 1
+        if remaining:
+            self.asset_class_counts[key] = remaining
+        else:
+            del self.asset_class_counts[key]
+        if asset.id not in assets and self.reference_counts.get(asset.id):
+            self.external_ids.add(asset.id)
+
+    def add_source(self, source_id: str, assets: Mapping[str, Asset]) -> None:
+        """Record a new, empty outgoing list stored under ``source_id`` at the end of the map."""
+        self.source_count += 1
+        self._source_order[source_id] = self._next_source_order
+        self._next_source_order += 1
+        self._shift_degree(None, 0)
+        self._reference(source_id, 1, assets)
+
+    def remove_source(self, source_id: str, degree: int, assets: Mapping[str, Asset]) -> None:
+        """Record that ``source_id``'s outgoing list (with ``degree`` edges still counted) was dropped."""
+        self.source_count -= 1
+        self._source_order.pop(source_id, None)
+        self._shift_degree(degree, None)
+        self._reference(source_id, -1, assets)
+
+    def add_edge(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str,
+        strength: float,
+        position: int,
+        degree: int,
+        assets: Mapping[str, Asset],
+    ) -> None:
+        """Record one edge inserted at ``position`` into ``source_id``'s list, which held ``degree`` edges."""
+        self.edge_count += 1
+        self.strength_sum += float(strength)
+        self.type_counts[rel_type] = self.type_counts.get(rel_type, 0) + 1
+        self._shift_degree(degree, degree + 1)
+        self._reference(target_id, 1, assets)
+        top = self._top
+        if top is not None:
+            self._shift_positions(top, source_id, position, 1)
+            self._push_top((source_id, target_id, rel_type, float(strength), position))
+
+    def remove_edge(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str,
+        strength: float,
+        position: int,
+        degree: int,
+        assets: Mapping[str, Asset],
+    ) -> None:
+        """Record one edge removed from ``position`` in a source list that held ``degree`` edges."""
+        self.edge_count -= 1
+        self.strength_sum -= float(strength)
+        remaining = self.type_counts[rel_type] - 1
+        if remaining:
+            self.type_counts[rel_type] = remaining
+        else:
+            del self.type_counts[rel_type]
+        self._shift_degree(degree, degree - 1)
+        self._reference(target_id, -1, assets)
+        top = self._top
+        if top is not None:
+            try:
+                top.remove((source_id, target_id, rel_type, float(strength), position))
+            except ValueError:
+                pass
+            self._shift_positions(top, source_id, position + 1, -1)
+
+    def replace_source(
+        self,
+        source_id: str,
+        old_rels: Sequence[AggregateRelationship] | None,
+        new_rels: Sequence[AggregateRelationship] | None,
+        assets: Mapping[str, Asset],
+    ) -> None:
+        """Record that ``source_id``'s list changed from ``old_rels`` to ``new_rels`` (``None`` when absent)."""
+        if old_rels is None:
+            self.add_source(source_id, assets)
+            old_rels = ()
+        degree = len(old_rels)
+        for target_id, rel_type, strength in old_rels:
+            self.remove_edge(source_id, target_id, rel_type, strength, 0, degree, assets)
+            degree -= 1
+        for target_id, rel_type, strength in new_rels or ():
+            self.add_edge(source_id, target_id, rel_type, strength, degree, degree, assets)
+            degree += 1
+        if new_rels is None:
+            self.remove_source(source_id, 0, assets)
+
+    def _shift_degree(self, old_degree: int | None, new_degree: int | None) -> None:
+        """Move one source between degree-histogram buckets."""
+        histogram = self.degree_histogram
+        if old_degree is not None:
+            remaining = histogram[old_degree] - 1
+            if remaining:
+                histogram[old_degree] = remaining
+            else:
+                del histogram[old_degree]
+        if new_degree is not None:
+            histogram[new_degree] = histogram.get(new_degree, 0) + 1
+
+    def _reference(self, node_id: str, delta: int, assets: Mapping[str, Asset]) -> None:
+        """Adjust how many source keys and edge targets refer to ``node_id``."""
+        count = self.reference_counts.get(node_id, 0) + delta
+        if count:
+            self.reference_counts[node_id] = count
+            if node_id not in assets:
+                self.external_ids.add(node_id)
+        else:
+            self.reference_counts.pop(node_id, None)
+            self.external_ids.discard(node_id)
+
+    @staticmethod
+    def _shift_positions(top: list[_TopEntry], source_id: str, start: int, delta: int) -> None:
+        """Move the buffered positions of ``source_id``'s edges at or after ``start`` by ``delta``."""
+        for index, entry in enumerate(top):
+            if entry[0] == source_id and entry[4] >= start:
+                top[index] = (*entry[:4], entry[4] + delta)
+
+    def _push_top(self, edge: _TopEntry) -> None:
+        """Insert a just-added ``edge`` into the buffer if it falls inside the kept prefix."""
+        top = self._top
+        if top is None:
+            return
+        low, high = 0, len(top)
+        while low < high:
+            middle = (low + high) // 2
+            if self._precedes(edge, top[middle]):
+                high = middle
+            else:
+                low = middle + 1
+        # Past the end of a buffer that does not hold every edge, unseen edges may precede it.
+        if low == len(top) and len(top) < self.edge_count - 1:
+            return
+        top.insert(low, edge)
+        if len(top) > 2 * self.top_k:
+            top.pop()
+
+    def _precedes(self, edge: _TopEntry, other: _TopEntry) -> bool:
+        """Return whether ``edge`` sorts before ``other``: stronger first, then map order."""
+        if edge[3] != other[3]:
+            return edge[3] > other[3]
+        if edge[0] != other[0]:
+            return self._source_order[edge[0]] < self._source_order[other[0]]
+        return edge[4] < other[4]
+
+
+def select_top_relationships(
+    relationships: Mapping[str, Iterable[AggregateRelationship]],
+    k: int,
+) -> list[AggregateTopRelationship]:
+    """
+    Select up to ``k`` relationships by descending strength with a bounded heap.
+
+    Equivalent to a stable descending sort over map order truncated to ``k`` items,
+    but runs in O(E log k) time and O(k) extra memory.
+
+    Parameters:
+        relationships (Mapping[str, Iterable[tuple[str, str, float]]]): Outgoing relationships keyed by source ID.
+        k (int): Maximum number of relationships to return.
+
+    Returns:
+        list[tuple[str, str, str, float]]: ``(source_id, target_id, rel_type, strength)`` tuples.
+    """
+    if k <= 0:
+        return []
+    edges = (
+        (source_id, target_id, rel_type, float(strength))
+        for source_id, rels in relationships.items()
+        for target_id, rel_type, strength in rels
+    )
+    return heapq.nlargest(k, edges, key=lambda relationship: relationship[3])
+
+
+def _select_top_entries(relationships: Mapping[str, Iterable[AggregateRelationship]], k: int) -> list[_TopEntry]:
+    """Select like `select_top_relationships`, keeping each edge's position in its source list."""
+    if k <= 0:
+        return []
+    edges = (
+        (source_id, target_id, rel_type, float(strength), position)
+        for source_id, rels in relationships.items()
+        for position, (target_id, rel_type, strength) in enumerate(rels)
+    )
+    return heapq.nlargest(k, edges, key=lambda entry: entry[3])
@@ -1,8 +1,48 @@
 """Core financial domain models and enums used across the project."""
 
 import re
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import overload
+
+_CURRENCY_CODE_PATTERN = re.compile(r"^[A-Z]{3}$")
+_ISO_DATE_PREFIX_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_TRUSTED_CONSTRUCTION: ContextVar[bool] = ContextVar("trusted_model_construction", default=False)
+
+
+@overload
+def _intern(value: str) -> str:
+    """Intern a string."""
+
+
+@overload
+def _intern(value: str | None) -> str | None:
+    """Intern a string and pass ``None`` through."""
+
+
+def _intern(value: str | None) -> str | None:
+    """Return the interned copy of a string so repeated labels share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@contextmanager
+def trusted_construction() -> Iterator[None]:
+    """
+    Skip `__post_init__` validation for assets and events built inside the block.
+
+    Only for bulk loads of rows from our own persistence, which were validated when
+    written. Asset labels are still interned. The flag is a context variable, so other
+    threads and tasks keep validating.
+    """
+    token = _TRUSTED_CONSTRUCTION.set(True)
+    try:
+        yield
+    finally:
+        _TRUSTED_CONSTRUCTION.reset(token)
 
 
 # Asset Class Definitions
@@ -30,7 +70,7 @@ class RegulatoryActivity(Enum):
     COMPLIANCE_UPDATE = "Compliance Update"
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """Base asset class."""
 
@@ -50,8 +90,12 @@ class Asset:
         Ensures `id`, `symbol`, and `name` are non-empty strings; `price` and, if provided,
         `market_cap` are numbers greater than or equal to zero; normalizes `currency` to uppercase
         and validates it matches a three-letter uppercase currency code. Raises `ValueError` when
-        validations fail.
+        validations fail. `sector` and `currency` are interned so every asset sharing a label
+        shares one string object. Inside `trusted_construction()` only the interning runs.
         """
+        if _TRUSTED_CONSTRUCTION.get():
+            self._intern_labels()
+            return
         self._validate_non_empty_string(
             self.id,
             "Asset id must be a non-empty string",
@@ -76,6 +120,12 @@ class Asset:
         if isinstance(self.currency, str):
             self.currency = self.currency.upper()
         self._validate_currency_code(self.currency)
+        self._intern_labels()
+
+    def _intern_labels(self) -> None:
+        """Intern `sector` and `currency`."""
+        self.sector = _intern(self.sector)
+        self.currency = _intern(self.currency)
 
     @staticmethod
     def _validate_non_empty_string(value: object, error_message: str) -> None:
@@ -126,11 +176,11 @@ class Asset:
         Raises:
             ValueError: If `currency` is not a string of exactly three uppercase letters.
         """
-        if not isinstance(currency, str) or not re.match(r"^[A-Z]{3}$", currency):
+        if not isinstance(currency, str) or not _CURRENCY_CODE_PATTERN.match(currency):
             raise ValueError("Currency must be a valid 3-letter ISO code")
 
 
-@dataclass
+@dataclass(slots=True)
 class Equity(Asset):
     """Equity asset."""
 
@@ -140,7 +190,7 @@ class Equity(Asset):
     book_value: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Bond(Asset):
     """Fixed income asset."""
 
@@ -150,8 +200,14 @@ class Bond(Asset):
     credit_rating: str | None = None
     issuer_id: str | None = None  # Link to company if corporate
 
+    def _intern_labels(self) -> None:
+        """Intern the base asset labels and `credit_rating`."""
+        # Slotted dataclasses are rebuilt by the decorator, so zero-argument super() is unavailable.
+        Asset._intern_labels(self)
+        self.credit_rating = _intern(self.credit_rating)
 
-@dataclass
+
+@dataclass(slots=True)
 class Commodity(Asset):
     """Commodity asset."""
 
@@ -160,7 +216,7 @@ class Commodity(Asset):
     volatility: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Currency(Asset):
     """Currency asset."""
 
@@ -187,10 +243,13 @@ class RegulatoryEvent:
 
         Ensures `id`, `asset_id`, and `description` are non-empty strings, `impact_score` is a
         number between -1 and 1, and `date` starts with an ISO-like `YYYY-MM-DD` prefix.
+        Skipped inside `trusted_construction()`.
 
         Raises:
             ValueError: If any validation check fails.
         """
+        if _TRUSTED_CONSTRUCTION.get():
+            return
         self._validate_non_empty_string(
             self.id,
             "Event id must be a non-empty string",
@@ -246,5 +305,5 @@ class RegulatoryEvent:
         Raises:
             ValueError: If `value` is not a string or does not start with the `YYYY-MM-DD` pattern.
         """
-        if not isinstance(value, str) or not re.match(r"^\d{4}-\d{2}-\d{2}", value):
+        if not isinstance(value, str) or not _ISO_DATE_PREFIX_PATTERN.match(value):
             raise ValueError("Date must be in ISO 8601 format (YYYY-MM-DD...)")
@@ -16,6 +16,7 @@ from typing import cast
 import plotly.graph_objects as go  # type: ignore[import-untyped]
 
 from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_layout import circular_layout
 
 logger = logging.getLogger(__name__)
 
@@ -46,16 +47,8 @@ def _create_circular_layout(
     if not asset_ids:
         return {}
 
-    n = len(asset_ids)
-    positions = {}
-
-    for i, asset_id in enumerate(asset_ids):
-        angle = 2 * math.pi * i / n
-        x = math.cos(angle)
-        y = math.sin(angle)
-        positions[asset_id] = (x, y)
-
-    return positions
+    coordinates = circular_layout(len(asset_ids))[:, :2].tolist()
+    return {asset_id: (x, y) for asset_id, (x, y) in zip(asset_ids, coordinates, strict=True)}
 
 
 def _create_grid_layout(
@@ -254,7 +247,7 @@ def _group_relationships_by_type(
     relationship_groups: dict[str, list[dict[str, object]]] = {}
 
     for source_id in asset_ids:
-        for target_id, rel_type, strength in graph.relationships.get(source_id, []):
+        for target_id, rel_type, strength in graph.outgoing_relationships(source_id):
             if target_id not in positions or target_id not in asset_id_set:
                 continue
             if _is_relationship_filtered(
@@ -366,7 +359,7 @@ def _spring_or_fallback_positions(
         _,
         _,
     ) = graph.get_3d_visualization_data_enhanced()
-    positions_3d = {asset_ids_ordered[i]: tuple(positions_3d_array[i]) for i in range(len(asset_ids_ordered))}
+    positions_3d = dict(zip(asset_ids_ordered, map(tuple, positions_3d_array.tolist()), strict=True))
     circular_fallback = _create_circular_layout(asset_ids)
     for asset_id in asset_ids:
         if asset_id not in positions_3d:
@@ -430,7 +423,7 @@ def _build_node_visual_components(
         asset = graph.assets[asset_id]
         asset_class = _asset_class_label(asset)
         colors.append(color_map.get(asset_class.lower(), "#7f7f7f"))
-        num_connections = len(graph.relationships.get(asset_id, []))
+        num_connections = graph.out_degree(asset_id)
         node_sizes.append(20 + min(num_connections * 5, 30))
         hover_texts.append(f"{asset_id}<br>Class: {asset_class}")
     return node_x, node_y, colors, node_sizes, hover_texts
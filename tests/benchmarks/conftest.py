@@ -1,6 +1,6 @@
 """Fixtures for CodSpeed benchmark tests."""
 
-from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.asset_graph import AssetRelationshipGraph, GraphBackend
 from src.models.financial_models import (
     AssetClass,
     Bond,
@@ -128,3 +128,58 @@ def build_diverse_graph(asset_count: int, event_count: int = 0) -> AssetRelation
         )
 
     return graph
+
+
+def build_sectored_graph(
+    asset_count: int,
+    sector_size: int = 50,
+    backend: GraphBackend = "dict",
+) -> AssetRelationshipGraph:
+    """Build a large graph whose assets are spread over many fixed-size sectors.
+
+    Every fourth asset is a corporate bond issued by the preceding equity, so
+    both same-sector blocks and issuer lookups are exercised. Sector sizes stay
+    bounded as ``asset_count`` grows, which mirrors a realistic instrument
+    universe and keeps the edge count linear in the asset count.
+
+    Parameters
+    ----------
+    asset_count:
+        Total number of assets to create.
+    sector_size:
+        Number of assets sharing each sector label.
+    backend:
+        Relationship storage backend passed to ``AssetRelationshipGraph``.
+
+    Returns
+    -------
+    AssetRelationshipGraph
+        A populated graph with relationships **not yet built**.
+    """
+    graph = AssetRelationshipGraph(backend=backend)
+    for i in range(asset_count):
+        sector = f"Sector {i // sector_size:05d}"
+        if i % 4 == 1:
+            graph.add_asset(
+                Bond(
+                    id=f"BD_{i}",
+                    symbol=f"BD{i}",
+                    name=f"Bond {i}",
+                    asset_class=AssetClass.FIXED_INCOME,
+                    sector=sector,
+                    price=99.0,
+                    issuer_id=f"EQ_{i - 1}",
+                )
+            )
+        else:
+            graph.add_asset(
+                Equity(
+                    id=f"EQ_{i}",
+                    symbol=f"EQ{i}",
+                    name=f"Equity {i}",
+                    asset_class=AssetClass.EQUITY,
+                    sector=sector,
+                    price=100.0 + i,
+                )
+            )
+    return graph
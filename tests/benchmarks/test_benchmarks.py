@@ -5,9 +5,17 @@ in ``pyproject.toml``) and are only executed by the CodSpeed CI workflow with
 ``pytest tests/benchmarks/ --codspeed``.
 """
 
+import itertools
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import MISSING, field, fields, make_dataclass, replace
+from typing import Any
+
 import pytest
 
 from src.data.sample_data import create_sample_database
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.path_engine import PathEngine
 from src.models.financial_models import (
     AssetClass,
     Bond,
@@ -16,9 +24,10 @@ from src.models.financial_models import (
     Equity,
     RegulatoryActivity,
     RegulatoryEvent,
+    trusted_construction,
 )
 
-from .conftest import build_diverse_graph
+from .conftest import build_diverse_graph, build_sectored_graph
 
 # ---------------------------------------------------------------------------
 # Model validation benchmarks
@@ -102,6 +111,73 @@ def test_bench_regulatory_event_validation(benchmark):
     benchmark(_create_events)
 
 
+# Field-for-field copy of Bond without __slots__ or interning, i.e. the pre-slots layout.
+_UnslottedBond = make_dataclass(
+    "_UnslottedBond",
+    [(f.name, f.type) if f.default is MISSING else (f.name, f.type, field(default=f.default)) for f in fields(Bond)],
+)
+
+
+def _bond_row_kwargs(index: int) -> dict[str, Any]:
+    """Return bond kwargs whose repeated labels are fresh strings, as rows decoded from storage are."""
+    return {
+        "id": f"BD_{index}",
+        "symbol": f"BD{index}",
+        "name": f"Bond {index}",
+        "asset_class": AssetClass.FIXED_INCOME,
+        "sector": "".join(["Fixed ", "Income"]),
+        "price": 99.0,
+        "currency": "".join(["US", "D"]),
+        "credit_rating": "".join(["A", "A"]),
+        "issuer_id": f"EQ_{index}",
+    }
+
+
+def _bytes_per_asset(factory: Callable[..., Any], count: int) -> float:
+    """Return traced bytes held per asset after building ``count`` assets with ``factory``."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        assets = [factory(**_bond_row_kwargs(index)) for index in range(count)]
+        held = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    assert len(assets) == count
+    return held / count
+
+
+def test_asset_memory_per_asset_100k(record_property):
+    """Report bytes per asset for 100,000 bonds before (unslotted, uninterned) and after slots + interning."""
+    before = _bytes_per_asset(_UnslottedBond, 100_000)
+    after = _bytes_per_asset(Bond, 100_000)
+    record_property("bytes_per_asset_before", round(before, 1))
+    record_property("bytes_per_asset_after", round(after, 1))
+
+    assert after < before
+
+
+@pytest.mark.benchmark
+def test_bench_bond_construction_validated_10k(benchmark):
+    """Benchmark validated construction of 10,000 bonds from persisted-row kwargs."""
+    rows = [_bond_row_kwargs(index) for index in range(10_000)]
+
+    bonds = benchmark(lambda: [Bond(**row) for row in rows])
+    assert len(bonds) == 10_000
+
+
+@pytest.mark.benchmark
+def test_bench_bond_construction_trusted_10k(benchmark):
+    """Benchmark the trusted bulk path (validation skipped, labels interned) for 10,000 bonds."""
+    rows = [_bond_row_kwargs(index) for index in range(10_000)]
+
+    def _build_trusted():
+        with trusted_construction():
+            return [Bond(**row) for row in rows]
+
+    bonds = benchmark(_build_trusted)
+    assert len(bonds) == 10_000
+
+
 # ---------------------------------------------------------------------------
 # Graph construction benchmarks
 # ---------------------------------------------------------------------------
@@ -150,6 +226,65 @@ def test_bench_build_relationships_large(benchmark):
     assert len(result.assets) == 200
 
 
+@pytest.mark.benchmark
+def test_bench_build_relationships_pairwise_2k(benchmark):
+    """Benchmark the O(n²) pairwise build on 2,000 assets as a baseline for the blocked build."""
+    graph = build_sectored_graph(asset_count=2_000)
+
+    benchmark(lambda: graph.build_relationships(blocked=False))
+    assert sum(len(rels) for rels in graph.relationships.values()) > 0
+
+
+@pytest.mark.benchmark
+def test_bench_build_relationships_blocked_2k(benchmark):
+    """Benchmark the sector/issuer-blocked build on the same 2,000-asset graph as the pairwise baseline."""
+    graph = build_sectored_graph(asset_count=2_000)
+
+    benchmark(graph.build_relationships)
+    assert sum(len(rels) for rels in graph.relationships.values()) > 0
+
+
+@pytest.mark.benchmark
+def test_bench_build_relationships_blocked_10k(benchmark):
+    """Benchmark the blocked build on 10,000 assets (the pairwise build takes ~250x longer here)."""
+    graph = build_sectored_graph(asset_count=10_000)
+
+    benchmark(graph.build_relationships)
+    assert len(graph.relationships) == 10_000
+
+
+@pytest.mark.benchmark
+def test_bench_build_relationships_blocked_50k(benchmark):
+    """Benchmark the blocked build on 50,000 assets, a scale the pairwise build cannot reach in CI."""
+    graph = build_sectored_graph(asset_count=50_000)
+
+    benchmark(graph.build_relationships)
+    assert len(graph.relationships) == 50_000
+
+
+@pytest.mark.benchmark
+def test_bench_build_relationships_parallel_50k(benchmark):
+    """Benchmark the blocked build on 50,000 assets with sector blocks spread over four worker processes."""
+    graph = build_sectored_graph(asset_count=50_000)
+
+    benchmark(lambda: graph.build_relationships(parallel=True, workers=4))
+    assert len(graph.relationships) == 50_000
+
+
+@pytest.mark.benchmark
+def test_bench_upsert_asset_sector_move_50k(benchmark):
+    """Benchmark moving one asset between sectors on a built 50,000-asset graph."""
+    graph = build_sectored_graph(asset_count=50_000)
+    graph.build_relationships()
+    asset = graph.assets["EQ_25000"]
+    moves = itertools.cycle(
+        [replace(asset, sector="Sector 00000"), replace(asset, sector=asset.sector)],
+    )
+
+    benchmark(lambda: graph.upsert_asset(next(moves)))
+    assert len(graph.relationships) == 50_000
+
+
 # ---------------------------------------------------------------------------
 # Metrics calculation benchmarks
 # ---------------------------------------------------------------------------
@@ -181,6 +316,97 @@ def test_bench_calculate_metrics_large(benchmark):
     assert metrics["total_assets"] > 0
 
 
+@pytest.mark.benchmark
+def test_bench_calculate_metrics_dict_backend_10k(benchmark):
+    """Benchmark calculate_metrics over the dict-of-lists store on 10,000 sectored assets."""
+    graph = build_sectored_graph(asset_count=10_000)
+    graph.build_relationships()
+
+    metrics = benchmark(graph.calculate_metrics)
+    assert metrics["total_relationships"] > 0
+
+
+@pytest.mark.benchmark
+def test_bench_calculate_metrics_after_upsert_10k(benchmark):
+    """Benchmark calculate_metrics served from running aggregates after an incremental upsert."""
+    graph = build_sectored_graph(asset_count=10_000)
+    graph.build_relationships()
+    graph.calculate_metrics()
+    asset = graph.assets["EQ_5000"]
+    moves = itertools.cycle(
+        [replace(asset, sector="Sector 00000"), replace(asset, sector=asset.sector)],
+    )
+
+    def _upsert_and_measure():
+        graph.upsert_asset(next(moves))
+        return graph.calculate_metrics()
+
+    metrics = benchmark(_upsert_and_measure)
+    assert metrics["total_relationships"] > 0
+
+
+@pytest.mark.benchmark
+def test_bench_calculate_metrics_csr_backend_10k(benchmark):
+    """Benchmark calculate_metrics served from the CSR arrays on 10,000 sectored assets."""
+    graph = build_sectored_graph(asset_count=10_000, backend="csr")
+    graph.build_relationships()
+
+    metrics = benchmark(graph.calculate_metrics)
+    assert metrics["total_relationships"] > 0
+
+
+@pytest.mark.benchmark
+def test_bench_calculate_metrics_dict_cold_1m_edges(benchmark):
+    """Benchmark a from-scratch dict-backend metrics pass over roughly one million edges."""
+    graph = build_sectored_graph(asset_count=10_200, sector_size=100)
+    graph.build_relationships()
+
+    def _cold_metrics():
+        # Reassigning the map discards running aggregates, forcing a full pass.
+        graph.relationships = graph.relationships
+        return graph.calculate_metrics()
+
+    metrics = benchmark(_cold_metrics)
+    assert metrics["total_relationships"] >= 1_000_000
+
+
+@pytest.mark.benchmark
+def test_bench_calculate_metrics_numpy_engine_1m_edges(benchmark):
+    """Benchmark the NumPy metrics engine (csr backend) over roughly one million edges."""
+    graph = build_sectored_graph(asset_count=10_200, sector_size=100, backend="csr")
+    graph.build_relationships()
+
+    metrics = benchmark(graph.calculate_metrics)
+    assert metrics["total_relationships"] >= 1_000_000
+
+
+# ---------------------------------------------------------------------------
+# Path query benchmarks
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.benchmark
+def test_bench_path_engine_build_10k(benchmark):
+    """Benchmark building the integer-indexed path adjacency over 10,000 sectored assets."""
+    graph = build_sectored_graph(asset_count=10_000)
+    graph.build_relationships()
+
+    engine = benchmark(PathEngine.from_graph, graph)
+    assert len(engine.asset_ids) == 10_000
+
+
+@pytest.mark.benchmark
+def test_bench_exposure_paths_10k(benchmark):
+    """Benchmark a capped exposure-path search from one asset of a 10,000-asset graph."""
+    graph = build_sectored_graph(asset_count=10_000)
+    graph.build_relationships()
+    engine = PathEngine.from_graph(graph)
+    source_id = next(iter(graph.assets))
+
+    result = benchmark(engine.exposure_paths, source_id, max_paths=100, max_expansions=10_000)
+    assert len(result.paths) == 49
+
+
 # ---------------------------------------------------------------------------
 # Sample database benchmark
 # ---------------------------------------------------------------------------
@@ -233,3 +459,20 @@ def test_bench_add_relationships_bulk(benchmark):
 
     result = benchmark(_add_rels)
     assert len(result.relationships) > 0
+
+
+@pytest.mark.benchmark
+def test_bench_add_relationships_dense_source(benchmark):
+    """Benchmark inserting 20,000 distinct edges, plus one duplicate pass, from a single dense source."""
+    target_ids = [f"T_{i}" for i in range(20_000)]
+
+    def _add_dense():
+        graph = AssetRelationshipGraph()
+        for target_id in target_ids:
+            graph.add_relationship("HUB", target_id, "same_sector", 0.7)
+        for target_id in target_ids:
+            graph.add_relationship("HUB", target_id, "same_sector", 0.1)
+        return graph
+
+    result = benchmark(_add_dense)
+    assert len(result.relationships["HUB"]) == 20_000
@@ -36,7 +36,12 @@ os.environ["ADMIN_DISABLED"] = "false"
 from api.auth import seed_credentials_from_settings, user_repository  # noqa: E402
 from api.database import initialize_schema  # noqa: E402
 from src.config.settings import load_settings  # noqa: E402
-from src.data.database import configure_sqlite_engine, create_engine_from_url, init_db  # noqa: E402
+from src.data.database import (  # noqa: E402
+    configure_sqlite_engine,
+    create_engine_from_url,
+    dispose_shared_engines,
+    init_db,
+)
 from src.logic.asset_graph import AssetRelationshipGraph  # noqa: E402
 from src.models.financial_models import (  # noqa: E402
     AssetClass,
@@ -211,6 +216,13 @@ def _reset_graph():
     yield
 
 
+@pytest.fixture(autouse=True)
+def _dispose_shared_engines():
+    """Drop shared engines after each test so patched engine factories never leak into the next one."""
+    yield
+    dispose_shared_engines()
+
+
 def enable_sqlite_foreign_keys(engine: Engine) -> None:
     """Ensure SQLite engines enforce FKs and GRAC CHECK helpers in tests."""
     if engine.url.get_backend_name() != "sqlite":
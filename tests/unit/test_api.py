@@ -33,7 +33,7 @@ TEST_ORIGIN_FTP_LOCALHOST = "ftp://localhost:3000"  # Invalid protocol test case
 
 def asset_items(page: dict[str, Any]) -> list[dict[str, Any]]:
     """Return asset items from a paginated assets response."""
-    assert set(page) == {"items", "total", "page", "per_page", "hasMore"}
+    assert set(page) == {"items", "total", "page", "per_page", "hasMore", "next_cursor"}
     assert isinstance(page["items"], list)
     assert isinstance(page["total"], int)
     assert isinstance(page["page"], int)
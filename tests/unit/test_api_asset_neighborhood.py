@@ -0,0 +1,75 @@
+"""Tests for the k-hop asset neighborhood route."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _chain_graph() -> AssetRelationshipGraph:
+    """Create the chain A -> B -> C -> D plus an unrelated asset E."""
+    graph = AssetRelationshipGraph()
+    for asset_id in ("A", "B", "C", "D", "E"):
+        graph.add_asset(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Equity",
+                asset_class=AssetClass.EQUITY,
+                sector="Unknown",
+                price=100.0,
+            )
+        )
+    for source_id, target_id in (("A", "B"), ("B", "C"), ("C", "D")):
+        graph.add_relationship(source_id, target_id, "observed", 0.5, bidirectional=False)
+    return graph
+
+
+@pytest.fixture()
+def client() -> Iterator[TestClient]:
+    """Provide a TestClient with a clean graph state reset after each test."""
+    api_main.reset_graph()
+    with TestClient(api_main.app) as test_client:
+        yield test_client
+    api_main.reset_graph()
+
+
+def test_neighborhood_returns_the_bounded_subgraph_in_visualization_shape(client: TestClient) -> None:
+    """Depth limits the hop count and only edges inside the subgraph are returned."""
+    api_main.set_graph(_chain_graph())
+
+    response = client.get("/api/assets/B/neighborhood", params={"depth": 1})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [node["id"] for node in payload["nodes"]] == ["B", "C", "A"]
+    assert [(edge["source"], edge["target"]) for edge in payload["edges"]] == [("B", "C"), ("A", "B")]
+    assert all(edge["edge_id"].startswith("legacy:") for edge in payload["edges"])
+    assert payload["network_density"] == pytest.approx(2 / 6)
+    assert set(payload["nodes"][0]) == {"id", "symbol", "name", "asset_class", "x", "y", "z", "color", "size"}
+
+
+def test_neighborhood_honours_depth_and_node_cap(client: TestClient) -> None:
+    """Deeper searches reach further; max_nodes truncates in breadth-first order."""
+    api_main.set_graph(_chain_graph())
+
+    deep = client.get("/api/assets/A/neighborhood", params={"depth": 3}).json()
+    capped = client.get("/api/assets/A/neighborhood", params={"depth": 3, "max_nodes": 2}).json()
+
+    assert [node["id"] for node in deep["nodes"]] == ["A", "B", "C", "D"]
+    assert [node["id"] for node in capped["nodes"]] == ["A", "B"]
+    assert [(edge["source"], edge["target"]) for edge in capped["edges"]] == [("A", "B")]
+
+
+def test_neighborhood_of_unknown_asset_is_not_found(client: TestClient) -> None:
+    """Missing assets return 404 and out-of-range bounds are rejected."""
+    api_main.set_graph(_chain_graph())
+
+    assert client.get("/api/assets/MISSING/neighborhood").status_code == 404
+    assert client.get("/api/assets/A/neighborhood", params={"depth": 0}).status_code == 422
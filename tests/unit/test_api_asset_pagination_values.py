@@ -1,6 +1,7 @@
 """Behavioural tests for asset pagination values."""
 
 from collections.abc import Iterator
+from dataclasses import replace
 
 import pytest
 from fastapi.testclient import TestClient
@@ -46,3 +47,61 @@ def test_per_page_upper_boundary_is_accepted(client: TestClient) -> None:
     assert payload["per_page"] == 1000
     assert payload["total"] == 3
     assert payload["hasMore"] is False
+
+
+def test_next_cursor_walks_every_asset_without_page_numbers(client: TestClient) -> None:
+    """Following next_cursor yields every asset once, in id order, and ends with no cursor."""
+    api_main.set_graph(build_asset_pagination_graph(5))
+
+    seen: list[str] = []
+    params: dict[str, object] = {"per_page": 2}
+    while True:
+        payload = client.get("/api/assets", params=params).json()
+        seen.extend(item["id"] for item in payload["items"])
+        assert payload["total"] == 5
+        if not payload["hasMore"]:
+            assert payload["next_cursor"] is None
+            break
+        params = {"per_page": 2, "cursor": payload["next_cursor"]}
+
+    assert seen == [f"ASSET_{index:02d}" for index in range(5)]
+
+
+def test_cursor_resumes_after_its_asset_when_the_graph_changes(client: TestClient) -> None:
+    """A cursor names an asset rather than an offset, so earlier inserts do not shift the next page."""
+    graph = build_asset_pagination_graph(4)
+    api_main.set_graph(graph)
+    cursor = client.get("/api/assets", params={"per_page": 2}).json()["next_cursor"]
+
+    graph.add_asset(replace(graph.assets["ASSET_00"], id="ASSET_00A", symbol="ASSET_00A"))
+    payload = client.get("/api/assets", params={"per_page": 2, "cursor": cursor}).json()
+
+    assert [item["id"] for item in payload["items"]] == ["ASSET_02", "ASSET_03"]
+    assert payload["total"] == 5
+
+
+def test_filters_use_the_same_sorted_index(client: TestClient) -> None:
+    """Asset class and sector filters return id-ordered matches and exact totals."""
+    graph = build_asset_pagination_graph(4)
+    graph.add_asset(replace(graph.assets["ASSET_01"], id="ASSET_01B", sector="Energy"))
+    api_main.set_graph(graph)
+
+    energy = client.get("/api/assets", params={"sector": "Energy"}).json()
+    tech_equity = client.get(
+        "/api/assets",
+        params={"asset_class": "Equity", "sector": "Technology", "page": 2, "per_page": 3},
+    )
+
+    assert [item["id"] for item in energy["items"]] == ["ASSET_01B"]
+    assert tech_equity.json()["total"] == 4
+    assert [item["id"] for item in tech_equity.json()["items"]] == ["ASSET_03"]
+    assert client.get("/api/assets", params={"asset_class": "Commodity"}).json()["total"] == 0
+
+
+def test_malformed_cursor_is_rejected(client: TestClient) -> None:
+    """A cursor that does not decode to an asset id returns 400."""
+    api_main.set_graph(build_asset_pagination_graph(1))
+
+    response = client.get("/api/assets", params={"cursor": "%%%"})
+
+    assert response.status_code == 400
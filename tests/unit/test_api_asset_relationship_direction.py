@@ -0,0 +1,77 @@
+"""Tests for the direction parameter of the per-asset relationships route."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from api.routers import relationships as relationships_router
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _graph() -> AssetRelationshipGraph:
+    """Create a graph where B has one outgoing and two incoming relationships."""
+    graph = AssetRelationshipGraph()
+    for asset_id in ("A", "B", "C"):
+        graph.add_asset(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Equity",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=100.0,
+            )
+        )
+    graph.add_relationship("C", "B", "observed", 0.25, bidirectional=False)
+    graph.add_relationship("A", "B", "observed", 0.5, bidirectional=False)
+    graph.add_relationship("B", "A", "competitor", 0.75, bidirectional=False)
+    return graph
+
+
+@pytest.fixture()
+def client() -> Iterator[TestClient]:
+    """Provide a TestClient with a clean graph state reset after each test."""
+    api_main.reset_graph()
+    with TestClient(api_main.app) as test_client:
+        yield test_client
+    api_main.reset_graph()
+
+
+def _pairs(response_json: list[dict[str, object]]) -> list[tuple[object, object]]:
+    """Return ``(source_id, target_id)`` pairs from a relationship list."""
+    return [(item["source_id"], item["target_id"]) for item in response_json]
+
+
+def test_direction_selects_outgoing_incoming_or_both(client: TestClient) -> None:
+    """Outgoing stays the default; incoming edges keep their true source and target."""
+    api_main.set_graph(_graph())
+
+    default = client.get("/api/assets/B/relationships").json()
+    incoming = client.get("/api/assets/B/relationships", params={"direction": "in"}).json()
+    both = client.get("/api/assets/B/relationships", params={"direction": "both"}).json()
+
+    assert _pairs(default) == [("B", "A")]
+    assert _pairs(incoming) == [("A", "B"), ("C", "B")]
+    assert both == default + incoming
+    assert client.get("/api/assets/B/relationships", params={"direction": "sideways"}).status_code == 422
+
+
+def test_incoming_edges_carry_governance_metadata(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Governance metadata is looked up by the incoming edge's own source, target and type."""
+    api_main.set_graph(_graph())
+    metadata = {"assertion_id": "assertion-1", "governance_status": "governed", "revision_id": "revision-1"}
+    monkeypatch.setattr(
+        relationships_router,
+        "load_governed_relationship_index",
+        lambda _graph: {("A", "B", "observed"): metadata},
+    )
+
+    incoming = client.get("/api/assets/B/relationships", params={"direction": "in"}).json()
+
+    assert incoming[0]["assertion_id"] == "assertion-1"
+    assert "assertion_id" not in incoming[1]
@@ -88,3 +88,21 @@ def test_model_density_flows_through_graph_metrics_response(client: TestClient)
 
     assert payload["network_density"] == pytest.approx(expected_density)
     assert "relationship_density" not in payload
+
+
+def test_graph_metrics_returns_top_relationships_only_when_requested(client: TestClient) -> None:
+    """`top_k` adds the strongest relationships to the metrics payload in strength order."""
+    graph = _graph_with_assets(3)
+    graph.add_relationship("ASSET_00", "ASSET_01", "observed", 0.4, bidirectional=False)
+    graph.add_relationship("ASSET_01", "ASSET_02", "observed", 0.9, bidirectional=False)
+    graph.add_relationship("ASSET_02", "ASSET_00", "observed", 0.4, bidirectional=False)
+    api_main.set_graph(graph)
+
+    assert "top_relationships" not in client.get("/api/graph/metrics").json()
+    payload = client.get("/api/graph/metrics", params={"top_k": 2}).json()
+
+    assert payload["top_relationships"] == [
+        {"source_id": "ASSET_01", "target_id": "ASSET_02", "relationship_type": "observed", "strength": 0.9},
+        {"source_id": "ASSET_00", "target_id": "ASSET_01", "relationship_type": "observed", "strength": 0.4},
+    ]
+    assert client.get("/api/graph/metrics", params={"top_k": 0}).status_code == 422
@@ -276,9 +276,9 @@ def test_cache_primed_read_is_refreshed_after_admin_publication(
             """Return the publication timestamp for this test double."""
             return datetime.now(tz=timezone.utc)
 
-        def finalize_projection_publication(self, *_args: object, **_kwargs: object) -> None:
+        def finalize_projection_publication(self, *_args: object, **_kwargs: object) -> SimpleNamespace:
             """Simulate successful projection publication."""
-            return None
+            return SimpleNamespace(publication_id="publication-v2")
 
         def published_projection_binding_for_rebuild_job(self, _job_id: str) -> tuple[str, str] | None:
             """Return publication binding for test rebuild job."""
@@ -301,6 +301,14 @@ def test_cache_primed_read_is_refreshed_after_admin_publication(
             SimpleNamespace(asset_count=1, relationship_count=1),
         ),
     )
+    calls: list[str] = []
+    publish = graph_admin.synchronize_runtime_graph
+    monkeypatch.setattr(graph_admin, "warm_governed_snapshot", lambda job_id: calls.append(f"warm:{job_id}"))
+    monkeypatch.setattr(
+        graph_admin,
+        "synchronize_runtime_graph",
+        lambda *args, **kwargs: calls.append("publish") or publish(*args, **kwargs),
+    )
 
     try:
         graph_admin._finalize_rebuild_success(
@@ -313,6 +321,7 @@ def test_cache_primed_read_is_refreshed_after_admin_publication(
             lock_lost=threading.Event(),
             cancel_event=threading.Event(),
         )
+        assert calls == ["warm:job-test", "publish"]
 
         second = client.get("/api/relationships")
         assert second.status_code == 200
@@ -335,8 +344,10 @@ def test_cache_primed_read_is_refreshed_after_admin_publication(
     [
         _GovernanceRouteCase(relationships_router, "/api/relationships"),
         _GovernanceRouteCase(visualization_router, "/api/visualization"),
+        _GovernanceRouteCase(relationships_router, "/api/relationships/export"),
+        _GovernanceRouteCase(relationships_router, "/api/relationships/page"),
     ],
-    ids=["relationships", "visualization"],
+    ids=["relationships", "visualization", "relationships-export", "relationships-page"],
 )
 def test_governance_failure_reaches_route_error_handler(
     client: TestClient,
@@ -349,19 +360,14 @@ def test_governance_failure_reaches_route_error_handler(
         """Simulate a governance persistence or contract outage."""
         raise RuntimeError("governance load failed")
 
-    attribute_name = (
-        "load_governed_relationship_snapshot"
-        if case.route_module is visualization_router
-        else "load_governed_relationship_index"
-    )
-    monkeypatch.setattr(case.route_module, attribute_name, fail_governance_load)
+    monkeypatch.setattr(case.route_module, "load_governed_relationship_snapshot", fail_governance_load)
 
     response = client.get(case.path)
     _assert_error_response(response, 500, "An internal error occurred. Please try again later.")
 
 
 @pytest.mark.unit
-@pytest.mark.parametrize("path", ["/api/relationships", "/api/visualization"])
+@pytest.mark.parametrize("path", ["/api/relationships", "/api/visualization", "/api/relationships/export"])
 def test_invalid_governance_url_returns_service_unavailable(
     client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
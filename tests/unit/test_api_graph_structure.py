@@ -0,0 +1,70 @@
+"""Tests for the opt-in components and communities on `/api/graph/metrics`."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _graph() -> AssetRelationshipGraph:
+    """Create a linked pair and one isolated asset."""
+    graph = AssetRelationshipGraph()
+    for asset_id in ("A", "B", "C"):
+        graph.add_asset(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Equity",
+                asset_class=AssetClass.EQUITY,
+                sector=f"Sector {asset_id}",
+                price=100.0,
+            )
+        )
+    graph.add_relationship("B", "A", "observed", 0.5, bidirectional=False)
+    return graph
+
+
+@pytest.fixture()
+def client() -> Iterator[TestClient]:
+    """Provide a TestClient with a clean graph state reset after each test."""
+    api_main.reset_graph()
+    with TestClient(api_main.app) as test_client:
+        yield test_client
+    api_main.reset_graph()
+
+
+def test_metrics_omit_structure_unless_requested(client: TestClient) -> None:
+    """The default metrics payload keeps its shape."""
+    api_main.set_graph(_graph())
+
+    payload = client.get("/api/graph/metrics").json()
+
+    assert "components" not in payload
+    assert "communities" not in payload
+
+
+def test_metrics_return_components_and_communities_on_request(client: TestClient) -> None:
+    """Clusters are numbered largest first and follow graph mutations."""
+    graph = _graph()
+    api_main.set_graph(graph)
+
+    payload = client.get("/api/graph/metrics", params={"components": True, "communities": True}).json()
+
+    expected = [
+        {"id": 0, "size": 2, "asset_ids": ["A", "B"]},
+        {"id": 1, "size": 1, "asset_ids": ["C"]},
+    ]
+    assert payload["components"] == expected
+    assert payload["communities"] == expected
+
+    graph.add_relationship("C", "B", "observed", 0.5, bidirectional=False)
+    components = client.get("/api/graph/metrics", params={"components": True}).json()
+
+    assert components["components"] == [{"id": 0, "size": 3, "asset_ids": ["A", "B", "C"]}]
+    assert "communities" not in components
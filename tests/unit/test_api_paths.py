@@ -0,0 +1,80 @@
+"""Tests for the weighted path query routes."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Bond, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _graph() -> AssetRelationshipGraph:
+    """Create an issuer with one bond and one sector peer."""
+    graph = AssetRelationshipGraph(same_sector_strength=0.7, corporate_bond_strength=0.9)
+    for asset_id in ("ISSUER", "PEER"):
+        graph.add_asset(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Equity",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=100.0,
+            )
+        )
+    graph.add_asset(
+        Bond(
+            id="BOND",
+            symbol="BOND",
+            name="Issuer Bond",
+            asset_class=AssetClass.FIXED_INCOME,
+            sector="Fixed Income",
+            price=99.0,
+            issuer_id="ISSUER",
+        )
+    )
+    graph.build_relationships()
+    return graph
+
+
+@pytest.fixture()
+def client() -> Iterator[TestClient]:
+    """Provide a TestClient with a clean graph state reset after each test."""
+    api_main.reset_graph()
+    with TestClient(api_main.app) as test_client:
+        yield test_client
+    api_main.reset_graph()
+
+
+def test_shortest_path_route_returns_the_strongest_chain(client: TestClient) -> None:
+    """The bond reaches the issuer's peer through its issuer."""
+    api_main.set_graph(_graph())
+
+    payload = client.get("/api/paths/shortest", params={"source_id": "BOND", "target_id": "PEER"}).json()
+
+    assert payload["truncated"] is False
+    assert payload["paths"][0]["asset_ids"] == ["BOND", "ISSUER", "PEER"]
+    assert payload["paths"][0]["exposure"] == pytest.approx(0.9 * 0.7)
+
+
+def test_exposure_paths_follow_links_against_their_direction(client: TestClient) -> None:
+    """Stress on an issuer reaches the bond that links to it when walking undirected."""
+    api_main.set_graph(_graph())
+
+    undirected = client.get("/api/assets/ISSUER/exposure-paths").json()
+    directed = client.get("/api/assets/ISSUER/exposure-paths", params={"undirected": False}).json()
+
+    assert [path["asset_ids"][-1] for path in undirected["paths"]] == ["BOND", "PEER"]
+    assert [path["asset_ids"][-1] for path in directed["paths"]] == ["PEER"]
+
+
+def test_path_routes_reject_unknown_assets(client: TestClient) -> None:
+    """Unknown assets return 404."""
+    api_main.set_graph(_graph())
+
+    assert client.get("/api/paths/shortest", params={"source_id": "BOND", "target_id": "NOPE"}).status_code == 404
+    assert client.get("/api/assets/NOPE/exposure-paths").status_code == 404
@@ -0,0 +1,78 @@
+"""Tests for the streaming NDJSON relationship export."""
+
+import json
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from api.routers import relationships as relationships_router
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _graph(backend: str = "dict") -> AssetRelationshipGraph:
+    """Create a four-asset graph with three directed relationships."""
+    graph = AssetRelationshipGraph(backend=backend)
+    for asset_id in ("A", "B", "C", "D"):
+        graph.add_asset(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Equity",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=100.0,
+            )
+        )
+    graph.add_relationship("A", "B", "observed", 0.5, bidirectional=False)
+    graph.add_relationship("A", "C", "observed", 0.25, bidirectional=False)
+    graph.add_relationship("D", "A", "observed", 0.75, bidirectional=False)
+    return graph
+
+
+@pytest.fixture()
+def client() -> Iterator[TestClient]:
+    """Provide a TestClient with a clean graph state reset after each test."""
+    api_main.reset_graph()
+    with TestClient(api_main.app) as test_client:
+        yield test_client
+    api_main.reset_graph()
+
+
+@pytest.mark.parametrize("backend", ["dict", "csr"])
+def test_export_streams_the_relationship_list_as_ndjson(client: TestClient, backend: str) -> None:
+    """Each NDJSON line equals the matching `/api/relationships` item, in the same order."""
+    api_main.set_graph(_graph(backend))
+
+    response = client.get("/api/relationships/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.endswith("\n")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == client.get("/api/relationships").json()
+    assert [line["target_id"] for line in lines] == ["B", "C", "A"]
+
+
+def test_export_of_an_empty_graph_is_an_empty_body(client: TestClient) -> None:
+    """A graph without relationships streams no lines."""
+    api_main.set_graph(AssetRelationshipGraph())
+
+    response = client.get("/api/relationships/export")
+
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+def test_export_chunks_hold_only_complete_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lines are batched per chunk and the final partial batch is flushed."""
+    monkeypatch.setattr(relationships_router, "_EXPORT_LINES_PER_CHUNK", 2)
+
+    chunks = list(relationships_router._iter_relationship_ndjson(_graph(), {}))
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
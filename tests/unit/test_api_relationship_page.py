@@ -0,0 +1,161 @@
+"""Tests for cursor-paginated relationship reads."""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from api.services.edge_page_index import sorted_edge_index
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Bond, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _graph() -> AssetRelationshipGraph:
+    """Create a small equity and bond graph with mixed relationship types and strengths."""
+    graph = AssetRelationshipGraph()
+    for asset_id in ("E1", "E2", "E3"):
+        graph.add_asset(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Equity",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=100.0,
+            )
+        )
+    graph.add_asset(
+        Bond(
+            id="B1",
+            symbol="B1",
+            name="B1 Bond",
+            asset_class=AssetClass.FIXED_INCOME,
+            sector="Technology",
+            price=99.0,
+            issuer_id="E1",
+        )
+    )
+    graph.add_relationship("E3", "E1", "same_sector", 0.7, bidirectional=False)
+    graph.add_relationship("E1", "E2", "same_sector", 0.7, bidirectional=False)
+    graph.add_relationship("E1", "E3", "observed", 0.2, bidirectional=False)
+    graph.add_relationship("B1", "E1", "corporate_link", 0.9, bidirectional=False)
+    graph.add_relationship("E2", "E1", "observed", 0.6, bidirectional=False)
+    return graph
+
+
+@pytest.fixture()
+def client() -> Iterator[TestClient]:
+    """Provide a TestClient with a clean graph state reset after each test."""
+    api_main.reset_graph()
+    with TestClient(api_main.app) as test_client:
+        yield test_client
+    api_main.reset_graph()
+
+
+def _collect(client: TestClient, **params: Any) -> list[tuple[str, str, str]]:
+    """Follow cursors to the last page and return the relationship keys in order."""
+    keys: list[tuple[str, str, str]] = []
+    cursor = None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        body = client.get("/api/relationships/page", params=query).json()
+        keys.extend((item["source_id"], item["target_id"], item["relationship_type"]) for item in body["items"])
+        if not body["hasMore"]:
+            assert body.get("next_cursor") is None
+            return keys
+        cursor = body["next_cursor"]
+
+
+def test_pages_walk_every_relationship_in_key_order(client: TestClient) -> None:
+    """Following cursors yields each relationship once, ordered by source, target and type."""
+    api_main.set_graph(_graph())
+
+    first = client.get("/api/relationships/page", params={"limit": 2}).json()
+    keys = _collect(client, limit=2)
+
+    assert first["limit"] == 2
+    assert first["hasMore"] is True
+    assert len(first["items"]) == 2
+    assert keys == [
+        ("B1", "E1", "corporate_link"),
+        ("E1", "E2", "same_sector"),
+        ("E1", "E3", "observed"),
+        ("E2", "E1", "observed"),
+        ("E3", "E1", "same_sector"),
+    ]
+
+
+def test_filters_combine_with_pagination(client: TestClient) -> None:
+    """Type, source asset class and strength filters narrow every page."""
+    api_main.set_graph(_graph())
+
+    assert _collect(client, limit=1, relationship_type="observed") == [
+        ("E1", "E3", "observed"),
+        ("E2", "E1", "observed"),
+    ]
+    assert _collect(client, limit=1, source_asset_class="Fixed Income") == [("B1", "E1", "corporate_link")]
+    assert _collect(client, limit=1, source_asset_class="Equity", relationship_type="observed", min_strength=0.5) == [
+        ("E2", "E1", "observed")
+    ]
+    assert _collect(client, relationship_type="missing") == []
+
+
+def test_cursor_stays_valid_after_the_graph_changes(client: TestClient) -> None:
+    """A cursor resumes after its edge even when edges were added or removed meanwhile."""
+    graph = _graph()
+    api_main.set_graph(graph)
+    cursor = client.get("/api/relationships/page", params={"limit": 2}).json()["next_cursor"]
+
+    graph.add_relationship("A0", "E1", "observed", 0.5, bidirectional=False)
+    graph.add_relationship("E1", "E4", "observed", 0.5, bidirectional=False)
+    items = client.get("/api/relationships/page", params={"cursor": cursor}).json()["items"]
+
+    assert [(item["source_id"], item["target_id"]) for item in items] == [
+        ("E1", "E3"),
+        ("E1", "E4"),
+        ("E2", "E1"),
+        ("E3", "E1"),
+    ]
+
+
+def test_malformed_cursor_is_rejected(client: TestClient) -> None:
+    """Cursors that do not decode to an edge key return 400."""
+    api_main.set_graph(_graph())
+
+    response = client.get("/api/relationships/page", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid relationship cursor"
+
+
+def test_edge_index_is_reused_until_the_graph_version_changes() -> None:
+    """The sorted index is built once per graph version."""
+    graph = _graph()
+
+    index = sorted_edge_index(graph)
+    assert sorted_edge_index(graph) is index
+
+    graph.add_relationship("E2", "E3", "observed", 0.4, bidirectional=False)
+    assert sorted_edge_index(graph) is not index
+    assert len(sorted_edge_index(graph).edges) == len(index.edges) + 1
+
+
+def test_min_strength_pages_skip_weak_edges_without_scanning_them() -> None:
+    """A selective strength threshold pages through sparse strong edges in key order."""
+    graph = AssetRelationshipGraph()
+    for index in range(1000):
+        graph.add_relationship(f"S{index:04d}", "T", "observed", 0.9 if index % 250 == 7 else 0.1)
+    index = sorted_edge_index(graph)
+
+    first, has_more = index.page(limit=2, min_strength=0.5)
+    second, has_more_after = index.page(limit=2, after=first[-1][:3], min_strength=0.5)
+
+    assert [edge[0] for edge in first] == ["S0007", "S0257"]
+    assert has_more is True
+    assert [edge[0] for edge in second] == ["S0507", "S0757"]
+    assert has_more_after is False
+    assert index.page(limit=5, relationship_type="observed", min_strength=0.95) == ([], False)
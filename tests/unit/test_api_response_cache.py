@@ -0,0 +1,186 @@
+"""Tests for the pre-serialized graph response cache."""
+
+import gc
+import weakref
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from api.routers import relationships as relationships_router
+from api.routers import visualization as visualization_router
+from api.services.relationship_index import invalidate_governed_relationship_index_cache
+from api.services.response_cache import GraphResponseCache, graph_response_cache, graph_response_key
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _graph() -> AssetRelationshipGraph:
+    """Create a three-asset graph with one relationship."""
+    graph = AssetRelationshipGraph()
+    for asset_id in ("A", "B", "C"):
+        graph.add_asset(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Equity",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=100.0,
+            )
+        )
+    graph.add_relationship("A", "B", "observed", 0.5, bidirectional=False)
+    return graph
+
+
+@pytest.fixture()
+def client() -> Iterator[TestClient]:
+    """Provide a TestClient with a clean graph state reset after each test."""
+    api_main.reset_graph()
+    with TestClient(api_main.app) as test_client:
+        yield test_client
+    api_main.reset_graph()
+
+
+def test_cache_renders_once_per_key_and_evicts_least_recently_used() -> None:
+    """Hits skip rendering and the oldest key is evicted past the bound."""
+    cache = GraphResponseCache(max_entries=2)
+    renders: list[str] = []
+
+    def render(label: str) -> bytes:
+        renders.append(label)
+        return label.encode()
+
+    assert cache.get_or_render(("endpoint", "a"), lambda: render("a")).body == b"a"
+    assert cache.get_or_render(("endpoint", "a"), lambda: render("a")).body == b"a"
+    cache.get_or_render(("endpoint", "b"), lambda: render("b"))
+    cache.get_or_render(("endpoint", "a"), lambda: render("a"))
+    cache.get_or_render(("endpoint", "c"), lambda: render("c"))
+    cache.get_or_render(("endpoint", "b"), lambda: render("b"))
+
+    assert renders == ["a", "b", "c", "b"]
+    assert len(cache) == 2
+
+
+def test_each_endpoint_has_its_own_bound() -> None:
+    """Cycling one endpoint's parameters does not evict another endpoint's body."""
+    cache = GraphResponseCache(max_entries=2)
+    renders: list[str] = []
+
+    def render(label: str) -> bytes:
+        renders.append(label)
+        return label.encode()
+
+    cache.get_or_render(("relationships",), lambda: render("relationships"))
+    for top_k in range(1, 6):
+        cache.get_or_render(("metrics", top_k), lambda: render("metrics"))
+    cache.get_or_render(("relationships",), lambda: render("relationships"))
+
+    assert renders.count("relationships") == 1
+    assert len(cache) == 3
+
+
+def test_cached_bodies_do_not_keep_replaced_graphs_alive() -> None:
+    """Keys refer to the graph weakly, so a replaced graph is released while its body stays cached."""
+    cache = GraphResponseCache()
+    graph = _graph()
+    cache.get_or_render(graph_response_key("relationships", graph, graph.version), lambda: b"[]")
+    released = weakref.ref(graph)
+
+    del graph
+    gc.collect()
+
+    assert released() is None
+    assert len(cache) == 1
+
+
+def test_body_rendered_across_a_clear_is_not_stored() -> None:
+    """An invalidation during a render is not undone by storing the stale body."""
+    cache = GraphResponseCache()
+
+    def render_then_invalidate() -> bytes:
+        cache.clear()
+        return b"stale"
+
+    assert cache.get_or_render(("key",), render_then_invalidate).body == b"stale"
+    assert len(cache) == 0
+
+
+def test_repeat_reads_are_served_from_cache_until_the_graph_changes(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Relationships and visualization render once per graph version and after each invalidation."""
+    renders: list[str] = []
+    render_relationships = relationships_router._render_all_relationships
+    render_visualization = visualization_router._render_visualization_data
+
+    def counting_relationships(*args: object) -> bytes:
+        renders.append("relationships")
+        return render_relationships(*args)
+
+    def counting_visualization(*args: object) -> bytes:
+        renders.append("visualization")
+        return render_visualization(*args)
+
+    monkeypatch.setattr(relationships_router, "_render_all_relationships", counting_relationships)
+    monkeypatch.setattr(visualization_router, "_render_visualization_data", counting_visualization)
+    graph = _graph()
+    api_main.set_graph(graph)
+
+    first = client.get("/api/relationships")
+    assert client.get("/api/relationships").content == first.content
+    assert first.json() == [{"source_id": "A", "target_id": "B", "relationship_type": "observed", "strength": 0.5}]
+    assert client.get("/api/visualization").json() == client.get("/api/visualization").json()
+    assert renders == ["relationships", "visualization"]
+
+    graph.add_relationship("B", "C", "observed", 0.7, bidirectional=False)
+    assert len(client.get("/api/relationships").json()) == 2
+
+    invalidate_governed_relationship_index_cache()
+    assert len(graph_response_cache) == 0
+    client.get("/api/relationships")
+
+    api_main.set_graph(_graph())
+    assert len(graph_response_cache) == 0
+    assert len(client.get("/api/relationships").json()) == 1
+    assert renders == ["relationships", "visualization", "relationships", "relationships", "relationships"]
+
+
+@pytest.mark.parametrize("path", ["/api/relationships", "/api/visualization", "/api/graph/metrics?top_k=5"])
+def test_matching_if_none_match_returns_not_modified_until_the_graph_changes(client: TestClient, path: str) -> None:
+    """Graph read endpoints answer a current ETag with 304 and issue a new tag after a mutation."""
+    graph = _graph()
+    api_main.set_graph(graph)
+
+    first = client.get(path)
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert etag.startswith('"') and etag.endswith('"')
+
+    not_modified = client.get(path, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+    assert client.get(path, headers={"If-None-Match": f'"stale", W/{etag}'}).status_code == 304
+    assert client.get(path, headers={"If-None-Match": "*"}).status_code == 304
+
+    graph.add_relationship("B", "C", "observed", 0.7, bidirectional=False)
+    changed = client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json() != first.json()
+
+
+def test_etag_is_stable_across_equal_graph_replacements(client: TestClient) -> None:
+    """Replacing the graph with an identical one keeps the tag, so idle clients stay on 304."""
+    api_main.set_graph(_graph())
+    etag = client.get("/api/relationships").headers["ETag"]
+
+    api_main.set_graph(_graph())
+
+    assert client.get("/api/relationships", headers={"If-None-Match": etag}).status_code == 304
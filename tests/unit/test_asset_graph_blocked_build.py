@@ -0,0 +1,187 @@
+"""Equivalence tests for the blocked and pairwise relationship builds."""
+
+import random
+import threading
+from typing import Any
+
+import pytest
+
+from src.logic import asset_graph
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.reconciliation_engine import RebuildCancelledError
+from src.models.financial_models import AssetClass, Bond, Equity, RegulatoryActivity, RegulatoryEvent
+
+pytestmark = pytest.mark.unit
+
+
+def _equity(asset_id: str, sector: str) -> Equity:
+    """Build a minimal equity in the given sector."""
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Equity",
+        asset_class=AssetClass.EQUITY,
+        sector=sector,
+        price=100.0,
+    )
+
+
+def _bond(asset_id: str, sector: str, issuer_id: str | None) -> Bond:
+    """Build a minimal bond in the given sector linked to ``issuer_id``."""
+    return Bond(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Bond",
+        asset_class=AssetClass.FIXED_INCOME,
+        sector=sector,
+        price=99.0,
+        issuer_id=issuer_id,
+    )
+
+
+def _ordered_map(graph: AssetRelationshipGraph) -> list[tuple[str, list[Any]]]:
+    """Return the relationship map with key and list order preserved."""
+    return [(source_id, list(rels)) for source_id, rels in graph.relationships.items()]
+
+
+def _build_both(graph: AssetRelationshipGraph) -> tuple[list[Any], list[Any]]:
+    """Build the same graph pairwise and blocked and return both ordered maps."""
+    graph.build_relationships(blocked=False)
+    pairwise = _ordered_map(graph)
+    graph.build_relationships(blocked=True)
+    return pairwise, _ordered_map(graph)
+
+
+def test_blocked_build_is_the_default_and_links_sector_peers_and_issuers() -> None:
+    """The default build emits same-sector peers and bond-to-issuer links."""
+    graph = AssetRelationshipGraph(same_sector_strength=0.7, corporate_bond_strength=0.9)
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.add_asset(_bond("AAPL_B", "Fixed Income", "AAPL"))
+
+    graph.build_relationships()
+
+    assert graph.relationships == {
+        "AAPL": [("MSFT", "same_sector", 0.7)],
+        "MSFT": [("AAPL", "same_sector", 0.7)],
+        "AAPL_B": [("AAPL", "corporate_link", 0.9)],
+    }
+
+
+def test_blocked_build_places_issuer_link_after_same_sector_edge() -> None:
+    """An issuer inside the bond's own sector keeps the pairwise edge order."""
+    graph = AssetRelationshipGraph()
+    graph.add_asset(_equity("A", "Tech"))
+    graph.add_asset(_bond("B", "Tech", "C"))
+    graph.add_asset(_equity("C", "Tech"))
+    graph.add_asset(_equity("D", "Other"))
+
+    pairwise, blocked = _build_both(graph)
+
+    assert blocked == pairwise
+    assert [rel_type for _target, rel_type, _strength in graph.relationships["B"]] == [
+        "same_sector",
+        "same_sector",
+        "corporate_link",
+    ]
+
+
+def test_blocked_build_matches_pairwise_for_mutual_and_unresolvable_issuers() -> None:
+    """Mutual issuers, self-issuers, missing issuers and Unknown sectors follow pairwise semantics."""
+    graph = AssetRelationshipGraph()
+    graph.add_asset(_bond("X", "Unknown", "Y"))
+    graph.add_asset(_bond("Y", "Unknown", "X"))
+    graph.add_asset(_bond("SELF", "Unknown", "SELF"))
+    graph.add_asset(_bond("ORPHAN", "Unknown", "MISSING"))
+    graph.add_asset(_equity("U1", "Unknown"))
+    graph.add_asset(_equity("U2", "Unknown"))
+
+    pairwise, blocked = _build_both(graph)
+
+    assert blocked == pairwise
+    assert graph.relationships == {"X": [("Y", "corporate_link", graph.corporate_bond_strength)]}
+
+
+def _random_graph(seed: int) -> AssetRelationshipGraph:
+    """Build a randomized mix of sectors, bonds and events."""
+    rng = random.Random(seed)
+    asset_ids = [f"A{index}" for index in range(rng.randint(0, 40))]
+    rng.shuffle(asset_ids)
+    graph = AssetRelationshipGraph()
+    for asset_id in asset_ids:
+        sector = rng.choice(["Technology", "Finance", "Energy", "Unknown"])
+        if rng.random() < 0.5:
+            graph.add_asset(_bond(asset_id, sector, rng.choice([*asset_ids, None, "MISSING", asset_id])))
+        else:
+            graph.add_asset(_equity(asset_id, sector))
+    for event_index in range(rng.randint(0, 4) if asset_ids else 0):
+        graph.add_regulatory_event(
+            RegulatoryEvent(
+                id=f"EVT_{event_index}",
+                asset_id=rng.choice(asset_ids),
+                event_type=RegulatoryActivity.SEC_FILING,
+                date="2024-01-01",
+                description="Randomized event",
+                impact_score=-0.4,
+                related_assets=rng.sample(asset_ids, min(3, len(asset_ids))),
+            )
+        )
+
+    return graph
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_blocked_build_matches_pairwise_on_random_graphs(seed: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Randomized mixes of sectors, bonds and events build identical ordered maps."""
+    monkeypatch.setattr(asset_graph, "_BUILD_BLOCK_SIZE", 3)
+    graph = _random_graph(seed)
+
+    pairwise, blocked = _build_both(graph)
+
+    assert blocked == pairwise
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_parallel_build_matches_pairwise_on_random_graphs(seed: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Blocks built in worker processes merge into the same ordered map as the pairwise build."""
+    monkeypatch.setattr(asset_graph, "_BUILD_BLOCK_SIZE", 3)
+    graph = _random_graph(seed)
+    graph.build_relationships(blocked=False)
+    pairwise = _ordered_map(graph)
+
+    graph.build_relationships(parallel=True, workers=4)
+
+    assert _ordered_map(graph) == pairwise
+
+
+def test_parallel_build_reports_each_block_and_honours_cancellation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Progress is reported per merged block; a set cancel event keeps the previous map."""
+    monkeypatch.setattr(asset_graph, "_BUILD_BLOCK_SIZE", 2)
+    graph = AssetRelationshipGraph()
+    for index in range(5):
+        graph.add_asset(_equity(f"T{index}", "Tech"))
+    graph.add_asset(_bond("B", "Unknown", "T0"))
+    progress: list[dict[str, Any]] = []
+
+    graph.build_relationships(parallel=True, workers=2, on_progress=progress.append)
+
+    assert [(p["completed_blocks"], p["total_blocks"]) for p in progress] == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert [p["merged_source_count"] for p in progress] == [2, 4, 5, 6]
+
+    built = _ordered_map(graph)
+    cancel_event = threading.Event()
+
+    def cancel_after_first_block(state: dict[str, Any]) -> None:
+        cancel_event.set()
+
+    with pytest.raises(RebuildCancelledError):
+        graph.build_relationships(
+            parallel=True,
+            workers=2,
+            cancel_event=cancel_event,
+            on_progress=cancel_after_first_block,
+        )
+
+    assert _ordered_map(graph) == built
+    with pytest.raises(ValueError, match="blocked=True"):
+        graph.build_relationships(blocked=False, parallel=True)
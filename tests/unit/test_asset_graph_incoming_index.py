@@ -0,0 +1,151 @@
+"""Tests for the reverse (incoming) adjacency index of AssetRelationshipGraph."""
+
+import random
+
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph, Relationship
+from src.models.financial_models import AssetClass, Bond, Equity, RegulatoryActivity, RegulatoryEvent
+
+pytestmark = pytest.mark.unit
+
+
+def _equity(asset_id: str, sector: str) -> Equity:
+    """Build a minimal equity in the given sector."""
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Equity",
+        asset_class=AssetClass.EQUITY,
+        sector=sector,
+        price=100.0,
+    )
+
+
+def _bond(asset_id: str, sector: str, issuer_id: str | None) -> Bond:
+    """Build a minimal bond in the given sector linked to ``issuer_id``."""
+    return Bond(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Bond",
+        asset_class=AssetClass.FIXED_INCOME,
+        sector=sector,
+        price=99.0,
+        issuer_id=issuer_id,
+    )
+
+
+def _scanned_incoming(graph: AssetRelationshipGraph, target_id: str) -> list[Relationship]:
+    """Return the incoming relationships of ``target_id`` by scanning the whole map."""
+    return sorted(
+        (source_id, rel_type, strength)
+        for source_id, rels in graph.relationships.items()
+        for rel_target_id, rel_type, strength in rels
+        if rel_target_id == target_id
+    )
+
+
+def test_incoming_relationships_answer_who_points_at_an_issuer() -> None:
+    """Bond issuer links and same-sector edges appear on the target, ordered by source."""
+    graph = AssetRelationshipGraph(same_sector_strength=0.7, corporate_bond_strength=0.9)
+    graph.add_asset(_equity("ISSUER", "Technology"))
+    graph.add_asset(_bond("BOND_B", "Fixed Income", "ISSUER"))
+    graph.add_asset(_bond("BOND_A", "Fixed Income", "ISSUER"))
+    graph.add_asset(_equity("PEER", "Technology"))
+    graph.build_relationships()
+
+    assert graph.incoming_relationships("ISSUER") == [
+        ("BOND_A", "corporate_link", 0.9),
+        ("BOND_B", "corporate_link", 0.9),
+        ("PEER", "same_sector", 0.7),
+    ]
+    assert graph.incoming_relationships("MISSING") == []
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_mutations_keep_the_index_equal_to_a_full_scan(seed: int) -> None:
+    """Upserts, removals, event impacts and ad-hoc edges keep the maintained index exact."""
+    rng = random.Random(seed)
+    pool = [f"A{index}" for index in range(12)]
+    graph = AssetRelationshipGraph()
+
+    def random_asset(asset_id: str) -> Equity | Bond:
+        sector = rng.choice(["Technology", "Energy", "Unknown"])
+        if rng.random() < 0.5:
+            return _bond(asset_id, sector, rng.choice([*pool, None]))
+        return _equity(asset_id, sector)
+
+    for asset_id in rng.sample(pool, 6):
+        graph.add_asset(random_asset(asset_id))
+    graph.add_regulatory_event(
+        RegulatoryEvent(
+            id="EVT",
+            asset_id=pool[0],
+            event_type=RegulatoryActivity.EARNINGS_REPORT,
+            date="2024-01-01",
+            description="Earnings",
+            impact_score=0.4,
+            related_assets=pool[1:4],
+        )
+    )
+    graph.build_relationships()
+    graph.incoming_relationships(pool[0])
+
+    for _ in range(25):
+        asset_id = rng.choice(pool)
+        roll = rng.random()
+        if roll < 0.2 and asset_id in graph.assets:
+            graph.remove_asset(asset_id)
+        elif roll < 0.6:
+            graph.upsert_asset(random_asset(asset_id))
+        else:
+            graph.add_relationship(
+                asset_id,
+                rng.choice([*pool, "EXTERNAL"]),
+                rng.choice(["correlation", "competitor"]),
+                rng.choice([0.2, 0.7]),
+                bidirectional=rng.random() < 0.5,
+            )
+        for target_id in [*pool, "EXTERNAL"]:
+            assert graph.incoming_relationships(target_id) == _scanned_incoming(graph, target_id)
+
+
+def test_direct_map_edits_rebuild_the_index() -> None:
+    """Replacing or appending to the public map outside graph methods is picked up."""
+    graph = AssetRelationshipGraph()
+    graph.add_relationship("A", "B", "observed", 0.5, bidirectional=False)
+    assert graph.incoming_relationships("B") == [("A", "observed", 0.5)]
+
+    graph.relationships["C"] = [("B", "observed", 0.25)]
+    assert graph.incoming_relationships("B") == [("A", "observed", 0.5), ("C", "observed", 0.25)]
+
+    graph.relationships = {"D": [("B", "observed", 1.0)]}
+    assert graph.incoming_relationships("B") == [("D", "observed", 1.0)]
+
+
+def test_csr_backend_builds_the_index_without_the_dict_view() -> None:
+    """On the csr backend the index is built from the packed arrays."""
+    graph = AssetRelationshipGraph(backend="csr")
+    graph.add_asset(_equity("A", "Technology"))
+    graph.add_asset(_equity("B", "Technology"))
+    graph.build_relationships()
+
+    assert graph.incoming_relationships("A") == [("B", "same_sector", graph.same_sector_strength)]
+    assert graph._relationships is None
+
+
+def test_neighborhood_walks_both_directions_breadth_first() -> None:
+    """The BFS follows outgoing and incoming edges, honours depth and stops at the node cap."""
+    graph = AssetRelationshipGraph()
+    for asset_id in ("ROOT", "OUT", "IN", "FAR"):
+        graph.add_asset(_equity(asset_id, "Unknown"))
+    graph.add_relationship("ROOT", "OUT", "observed", 0.5, bidirectional=False)
+    graph.add_relationship("IN", "ROOT", "observed", 0.5, bidirectional=False)
+    graph.add_relationship("OUT", "FAR", "observed", 0.5, bidirectional=False)
+    graph.add_relationship("ROOT", "EXTERNAL", "observed", 0.5, bidirectional=False)
+
+    assert graph.neighborhood("ROOT", depth=1, max_nodes=10) == ["ROOT", "OUT", "IN"]
+    assert graph.neighborhood("ROOT", depth=2, max_nodes=10) == ["ROOT", "OUT", "IN", "FAR"]
+    assert graph.neighborhood("ROOT", depth=2, max_nodes=2) == ["ROOT", "OUT"]
+    with pytest.raises(KeyError):
+        graph.neighborhood("EXTERNAL", depth=1, max_nodes=10)
@@ -0,0 +1,196 @@
+"""Equivalence tests for incremental asset upserts and removals against a full rebuild."""
+
+import random
+from typing import Any
+
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Bond, Equity, RegulatoryActivity, RegulatoryEvent
+
+pytestmark = pytest.mark.unit
+
+_SECTORS = ["Technology", "Finance", "Energy", "Unknown"]
+
+
+def _equity(asset_id: str, sector: str, price: float = 100.0) -> Equity:
+    """Build a minimal equity in the given sector."""
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Equity",
+        asset_class=AssetClass.EQUITY,
+        sector=sector,
+        price=price,
+    )
+
+
+def _bond(asset_id: str, sector: str, issuer_id: str | None) -> Bond:
+    """Build a minimal bond in the given sector linked to ``issuer_id``."""
+    return Bond(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Bond",
+        asset_class=AssetClass.FIXED_INCOME,
+        sector=sector,
+        price=99.0,
+        issuer_id=issuer_id,
+    )
+
+
+def _rebuilt(graph: AssetRelationshipGraph) -> dict[str, list[Any]]:
+    """Return the map a full rebuild produces over ``graph``'s current assets and events."""
+    fresh = AssetRelationshipGraph(
+        same_sector_strength=graph.same_sector_strength,
+        corporate_bond_strength=graph.corporate_bond_strength,
+    )
+    for asset in graph.assets.values():
+        fresh.add_asset(asset)
+    for event in graph.regulatory_events:
+        fresh.add_regulatory_event(event)
+    fresh.build_relationships()
+    return fresh.relationships
+
+
+def test_price_update_keeps_relationships_and_position() -> None:
+    """Replacing an asset without changing sector or issuer leaves the map untouched."""
+    graph = AssetRelationshipGraph()
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.add_asset(_bond("AAPL_B", "Fixed Income", "AAPL"))
+    graph.build_relationships()
+    before = {source_id: list(rels) for source_id, rels in graph.relationships.items()}
+
+    graph.upsert_asset(_equity("AAPL", "Technology", price=180.0))
+
+    assert graph.relationships == before
+    assert list(graph.assets) == ["AAPL", "MSFT", "AAPL_B"]
+    assert graph.assets["AAPL"].price == 180.0
+
+
+def test_sector_move_retracts_and_adds_same_sector_edges() -> None:
+    """Moving an asset between sectors swaps its peer edges in both directions."""
+    graph = AssetRelationshipGraph(same_sector_strength=0.7)
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.add_asset(_equity("XOM", "Energy"))
+    graph.build_relationships()
+
+    graph.upsert_asset(_equity("MSFT", "Energy"))
+
+    assert graph.relationships == {
+        "MSFT": [("XOM", "same_sector", 0.7)],
+        "XOM": [("MSFT", "same_sector", 0.7)],
+    }
+
+
+def test_sector_move_before_first_build_does_not_raise() -> None:
+    """An upsert before any build skips peers without edges and a later build matches a rebuild."""
+    graph = AssetRelationshipGraph()
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.add_asset(_equity("XOM", "Energy"))
+
+    graph.upsert_asset(_equity("MSFT", "Energy"))
+    graph.build_relationships()
+
+    assert graph.assets["MSFT"].sector == "Energy"
+    assert graph.relationships == _rebuilt(graph)
+
+
+def test_remove_asset_retracts_edges_built_with_another_strength() -> None:
+    """Peer edges are matched on target and type, so changing the strength after a build is safe."""
+    graph = AssetRelationshipGraph(same_sector_strength=0.7)
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.build_relationships()
+    graph.same_sector_strength = 0.5
+
+    graph.remove_asset("MSFT")
+
+    assert graph.relationships == {}
+
+
+def test_remove_asset_retracts_issuer_links_and_event_impacts() -> None:
+    """Removing an issuer drops peer edges, bond links and event edges that target it."""
+    graph = AssetRelationshipGraph()
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.add_asset(_bond("AAPL_B", "Fixed Income", "AAPL"))
+    graph.add_regulatory_event(
+        RegulatoryEvent(
+            id="EVT_1",
+            asset_id="MSFT",
+            event_type=RegulatoryActivity.SEC_FILING,
+            date="2024-01-01",
+            description="Filing",
+            impact_score=0.3,
+            related_assets=["AAPL", "AAPL_B"],
+        )
+    )
+    graph.build_relationships()
+
+    removed = graph.remove_asset("AAPL")
+
+    assert removed.id == "AAPL"
+    assert graph.relationships == {"MSFT": [("AAPL_B", "event_impact", 0.3)]}
+    assert graph.relationships == _rebuilt(graph)
+
+
+def test_remove_unknown_asset_raises_key_error() -> None:
+    """Removing an ID that is not stored raises KeyError."""
+    graph = AssetRelationshipGraph()
+
+    with pytest.raises(KeyError, match="MISSING"):
+        graph.remove_asset("MISSING")
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_mutations_match_full_rebuild(seed: int) -> None:
+    """Random upserts and removals keep the map equal to a rebuild after every step."""
+    rng = random.Random(seed)
+    pool = [f"A{index}" for index in range(30)]
+    graph = AssetRelationshipGraph()
+
+    def random_asset(asset_id: str) -> Equity | Bond:
+        sector = rng.choice(_SECTORS)
+        if rng.random() < 0.5:
+            return _bond(asset_id, sector, rng.choice([*pool, None, asset_id]))
+        return _equity(asset_id, sector, price=rng.uniform(1.0, 500.0))
+
+    for asset_id in rng.sample(pool, 15):
+        graph.add_asset(random_asset(asset_id))
+    for event_index in range(4):
+        graph.add_regulatory_event(
+            RegulatoryEvent(
+                id=f"EVT_{event_index}",
+                asset_id=rng.choice(pool),
+                event_type=RegulatoryActivity.SEC_FILING,
+                date="2024-01-01",
+                description="Randomized event",
+                impact_score=-0.4,
+                related_assets=rng.sample(pool, 4),
+            )
+        )
+    graph.build_relationships()
+
+    for _ in range(40):
+        asset_id = rng.choice(pool)
+        if asset_id in graph.assets and rng.random() < 0.3:
+            graph.remove_asset(asset_id)
+        else:
+            graph.upsert_asset(random_asset(asset_id))
+        assert graph.relationships == _rebuilt(graph)
+
+
+def test_csr_backend_supports_incremental_mutation() -> None:
+    """Mutations on the CSR backend are reflected in metrics computed from the arrays."""
+    graph = AssetRelationshipGraph(backend="csr")
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.build_relationships()
+
+    graph.upsert_asset(_equity("NVDA", "Technology"))
+
+    assert graph.calculate_metrics()["total_relationships"] == 6
+    assert graph.relationships == _rebuilt(graph)
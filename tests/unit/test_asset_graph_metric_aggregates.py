@@ -0,0 +1,287 @@
+"""Tests for the running metric aggregates and version counter of AssetRelationshipGraph."""
+
+import math
+import random
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.logic import relationship_aggregates
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Bond, Equity, RegulatoryActivity, RegulatoryEvent
+
+pytestmark = pytest.mark.unit
+
+
+def _equity(asset_id: str, sector: str) -> Equity:
+    """Build a minimal equity in the given sector."""
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Equity",
+        asset_class=AssetClass.EQUITY,
+        sector=sector,
+        price=100.0,
+    )
+
+
+def _bond(asset_id: str, sector: str, issuer_id: str | None) -> Bond:
+    """Build a minimal bond in the given sector linked to ``issuer_id``."""
+    return Bond(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Bond",
+        asset_class=AssetClass.FIXED_INCOME,
+        sector=sector,
+        price=99.0,
+        issuer_id=issuer_id,
+    )
+
+
+def _fresh_metrics(graph: AssetRelationshipGraph) -> dict[str, Any]:
+    """Return metrics computed from scratch over a copy of ``graph``'s current state."""
+    fresh = AssetRelationshipGraph()
+    fresh.assets = dict(graph.assets)
+    fresh.regulatory_events = list(graph.regulatory_events)
+    fresh.relationships = {source_id: list(rels) for source_id, rels in graph.relationships.items()}
+    return fresh.calculate_metrics()
+
+
+def _assert_metrics_match(actual: dict[str, Any], expected: dict[str, Any]) -> None:
+    """Compare metrics exactly, allowing float summation-order noise in strength-derived values."""
+    for key in ("average_relationship_strength", "quality_score"):
+        assert math.isclose(actual.pop(key), expected.pop(key), abs_tol=1e-12)
+    assert actual == expected
+
+
+def test_metrics_follow_relationship_and_asset_mutations() -> None:
+    """Adding edges and assets after a first metrics call is reflected without a rebuild."""
+    graph = AssetRelationshipGraph(same_sector_strength=0.7)
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.build_relationships()
+    assert graph.calculate_metrics()["total_relationships"] == 2
+
+    graph.add_relationship("AAPL", "EXT", "correlation", 0.95)
+    graph.add_asset(_bond("AAPL_B", "Fixed Income", "AAPL"))
+    metrics = graph.calculate_metrics()
+
+    assert metrics["total_relationships"] == 3
+    assert metrics["total_assets"] == 4
+    assert metrics["relationship_distribution"] == {"same_sector": 2, "correlation": 1}
+    assert metrics["asset_class_distribution"] == {AssetClass.EQUITY.value: 2, AssetClass.FIXED_INCOME.value: 1}
+    assert metrics["max_degree"] == 2
+    assert metrics["top_relationships"][0] == ("AAPL", "EXT", "correlation", 0.95)
+
+
+def test_direct_edits_to_public_containers_are_detected() -> None:
+    """Edits that bypass graph methods bump the version and refresh metrics."""
+    graph = AssetRelationshipGraph()
+    graph.add_relationship("A", "B", "correlation", 0.5)
+    graph.calculate_metrics()
+    version = graph.version
+
+    graph.relationships["A"].append(("C", "competitor", 0.9))
+
+    assert graph.version > version
+    metrics = graph.calculate_metrics()
+    assert metrics["total_relationships"] == 2
+    assert metrics["top_relationships"][0] == ("A", "C", "competitor", 0.9)
+
+
+def test_version_is_stable_across_reads_and_bumped_by_mutations() -> None:
+    """Reads never bump the version; every mutating graph method does."""
+    graph = AssetRelationshipGraph()
+    graph.add_asset(_equity("AAPL", "Technology"))
+    version = graph.version
+    graph.calculate_metrics()
+    assert graph.version == version
+
+    graph.add_relationship("AAPL", "MSFT", "correlation", 0.4)
+    assert graph.version > version
+    version = graph.version
+    graph.add_regulatory_event(
+        RegulatoryEvent(
+            id="EVT_1",
+            asset_id="AAPL",
+            event_type=RegulatoryActivity.SEC_FILING,
+            date="2024-01-01",
+            description="Filing",
+            impact_score=0.2,
+            related_assets=[],
+        )
+    )
+    assert graph.version > version
+    version = graph.version
+    graph.build_relationships()
+    assert graph.version > version
+
+
+def test_repeated_metrics_reuse_the_top_relationship_selection() -> None:
+    """Added edges are pushed into the kept selection instead of triggering a rescan."""
+    graph = AssetRelationshipGraph()
+    for index in range(20):
+        graph.add_relationship(f"S{index}", "T", "correlation", 0.5 + index / 100)
+
+    with patch.object(
+        relationship_aggregates,
+        "_select_top_entries",
+        wraps=relationship_aggregates._select_top_entries,
+    ) as select:
+        graph.calculate_metrics()
+        graph.calculate_metrics()
+        graph.add_relationship("S0", "U", "correlation", 0.01)
+        graph.calculate_metrics()
+        graph.add_relationship("S0", "V", "correlation", 0.99)
+        assert graph.calculate_metrics()["top_relationships"][0] == ("S0", "V", "correlation", 0.99)
+        assert select.call_count == 1
+
+
+def test_removed_top_relationships_are_refilled_only_when_the_reserve_runs_out() -> None:
+    """The selection keeps a reserve of ``top_k`` entries, so removals rescan once per ``top_k`` losses."""
+    relationships = {f"S{index}": [("T", "correlation", index / 100)] for index in range(30)}
+    aggregates = relationship_aggregates.RelationshipAggregates.from_relationships({}, relationships, top_k=3)
+
+    with patch.object(
+        relationship_aggregates,
+        "_select_top_entries",
+        wraps=relationship_aggregates._select_top_entries,
+    ) as select:
+        assert [edge[0] for edge in aggregates.top_relationships(relationships)] == ["S29", "S28", "S27"]
+        for index in (29, 28, 27):
+            rels = relationships.pop(f"S{index}")
+            aggregates.replace_source(f"S{index}", rels, None, {})
+        assert [edge[0] for edge in aggregates.top_relationships(relationships)] == ["S26", "S25", "S24"]
+        assert select.call_count == 1
+
+        rels = relationships.pop("S26")
+        aggregates.replace_source("S26", rels, None, {})
+        assert [edge[0] for edge in aggregates.top_relationships(relationships)] == ["S25", "S24", "S23"]
+        assert select.call_count == 2
+
+
+def test_equal_strength_edges_enter_the_selection_in_map_order() -> None:
+    """An edge tied with the kept selection is placed by source order, then by list position."""
+    graph = AssetRelationshipGraph()
+    for index in range(12):
+        graph.add_relationship(f"S{index}", f"T{index}", "correlation", 0.5)
+    graph.calculate_metrics(top_k=3)
+
+    graph.relationships["S0"].insert(0, ("T_first", "competitor", 0.5))
+    graph.add_relationship("S1", "T_late", "competitor", 0.5)
+    graph.add_relationship("S0", "T_last", "competitor", 0.5)
+
+    assert graph.calculate_metrics(top_k=4)["top_relationships"] == [
+        ("S0", "T_first", "competitor", 0.5),
+        ("S0", "T0", "correlation", 0.5),
+        ("S0", "T_last", "competitor", 0.5),
+        ("S1", "T1", "correlation", 0.5),
+    ]
+
+
+def test_ties_inserted_mid_list_keep_list_order_in_the_selection() -> None:
+    """Peer edges inserted before existing ties by a sector move are ordered by their new positions."""
+    graph = AssetRelationshipGraph(same_sector_strength=0.5)
+    for asset in (_equity("A", "Technology"), _equity("B", "Energy"), _equity("C", "Technology")):
+        graph.add_asset(asset)
+    graph.add_asset(_equity("D", "Technology"))
+    graph.build_relationships()
+    graph.calculate_metrics()
+
+    graph.upsert_asset(_equity("B", "Technology"))
+    expected = sorted(graph.iter_relationships(), key=lambda relationship: relationship[3], reverse=True)
+    assert graph.calculate_metrics(top_k=4)["top_relationships"] == expected[:4]
+
+    graph.remove_asset("C")
+    expected = sorted(graph.iter_relationships(), key=lambda relationship: relationship[3], reverse=True)
+    assert graph.calculate_metrics(top_k=4)["top_relationships"] == expected[:4]
+
+
+def test_assets_replaced_in_place_are_detected() -> None:
+    """Writing straight to ``graph.assets`` bumps the version and refreshes metrics and sector indexes."""
+    graph = AssetRelationshipGraph(same_sector_strength=0.7)
+    graph.add_asset(_equity("A", "Technology"))
+    graph.add_asset(_equity("B", "Technology"))
+    graph.build_relationships()
+    graph.calculate_metrics()
+    version = graph.version
+
+    graph.assets["B"] = _bond("B", "Technology", None)
+
+    assert graph.version > version
+    _assert_metrics_match(graph.calculate_metrics(), _fresh_metrics(graph))
+
+    graph.assets["B"] = _equity("B", "Energy")
+    graph.build_relationships()
+    graph.upsert_asset(_equity("B", "Technology"))
+    assert graph.relationships == {"A": [("B", "same_sector", 0.7)], "B": [("A", "same_sector", 0.7)]}
+
+
+def test_same_length_edits_to_public_lists_are_detected() -> None:
+    """Replacing an entry in place changes the version even though no container changed size."""
+    graph = AssetRelationshipGraph()
+    graph.add_relationship("A", "B", "correlation", 0.5)
+    graph.calculate_metrics()
+    version = graph.version
+
+    graph.relationships["A"][0] = ("B", "correlation", 0.8)
+
+    assert graph.version > version
+    assert graph.calculate_metrics()["top_relationships"] == [("A", "B", "correlation", 0.8)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_mutations_keep_metrics_equal_to_a_fresh_computation(seed: int) -> None:
+    """Upserts, removals and ad-hoc edges keep every metric equal to a from-scratch calculation."""
+    rng = random.Random(seed)
+    pool = [f"A{index}" for index in range(16)]
+    graph = AssetRelationshipGraph()
+
+    def random_asset(asset_id: str) -> Equity | Bond:
+        sector = rng.choice(["Technology", "Energy", "Unknown"])
+        if rng.random() < 0.5:
+            return _bond(asset_id, sector, rng.choice([*pool, None]))
+        return _equity(asset_id, sector)
+
+    for asset_id in rng.sample(pool, 8):
+        graph.add_asset(random_asset(asset_id))
+    graph.build_relationships()
+    _assert_metrics_match(graph.calculate_metrics(), _fresh_metrics(graph))
+
+    for _ in range(30):
+        asset_id = rng.choice(pool)
+        roll = rng.random()
+        if roll < 0.2 and asset_id in graph.assets:
+            graph.remove_asset(asset_id)
+        elif roll < 0.6:
+            graph.upsert_asset(random_asset(asset_id))
+        else:
+            graph.add_relationship(
+                asset_id,
+                rng.choice([*pool, "EXTERNAL"]),
+                rng.choice(["correlation", "competitor"]),
+                rng.choice([0.2, 0.7, 0.9, 1.0]),
+                bidirectional=rng.random() < 0.5,
+            )
+        _assert_metrics_match(graph.calculate_metrics(), _fresh_metrics(graph))
+
+
+@pytest.mark.parametrize("backend", ["dict", "csr"])
+@pytest.mark.parametrize("top_k", [0, 1, 3, 10, 50])
+def test_top_k_selection_matches_a_stable_full_sort(backend: str, top_k: int) -> None:
+    """Bounded selection returns the prefix of a stable descending sort for any k and backend."""
+    rng = random.Random(top_k)
+    graph = AssetRelationshipGraph(backend=backend)  # type: ignore[arg-type]
+    for index in range(40):
+        graph.add_relationship(f"S{index % 7}", f"T{index}", "correlation", rng.choice([0.2, 0.5, 0.5, 0.9]))
+    expected = sorted(graph.iter_relationships(), key=lambda relationship: relationship[3], reverse=True)
+
+    assert graph.calculate_metrics(top_k=top_k)["top_relationships"] == expected[:top_k]
+    assert graph.calculate_metrics()["top_relationships"] == expected[:10]
+
+
+def test_negative_top_k_is_rejected() -> None:
+    """A negative top_k is a caller error."""
+    with pytest.raises(ValueError, match="top_k"):
+        AssetRelationshipGraph().calculate_metrics(top_k=-1)
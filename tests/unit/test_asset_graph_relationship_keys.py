@@ -0,0 +1,68 @@
+"""Tests for the per-source duplicate-detection key index in AssetRelationshipGraph."""
+
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+
+pytestmark = pytest.mark.unit
+
+
+def test_first_insert_wins_for_duplicate_target_and_type() -> None:
+    """A second edge with the same target and type is ignored even with a different strength."""
+    graph = AssetRelationshipGraph()
+
+    graph.add_relationship("A", "B", "correlation", 0.4)
+    graph.add_relationship("A", "B", "correlation", 0.9)
+    graph.add_relationship("A", "B", "competitor", 0.2)
+
+    assert graph.relationships == {"A": [("B", "correlation", 0.4), ("B", "competitor", 0.2)]}
+
+
+def test_bidirectional_duplicates_are_detected_per_source() -> None:
+    """Reverse edges are de-duplicated against the target's own outgoing list."""
+    graph = AssetRelationshipGraph()
+
+    graph.add_relationship("A", "B", "same_sector", 0.7, bidirectional=True)
+    graph.add_relationship("B", "A", "same_sector", 0.1)
+
+    assert graph.relationships == {
+        "A": [("B", "same_sector", 0.7)],
+        "B": [("A", "same_sector", 0.7)],
+    }
+
+
+def test_direct_appends_to_public_lists_are_respected() -> None:
+    """Entries appended straight onto the public lists still block later duplicates."""
+    graph = AssetRelationshipGraph()
+    graph.add_relationship("A", "B", "correlation", 0.5)
+
+    graph.relationships["A"].append(("C", "competitor", 0.3))
+    graph.add_relationship("A", "C", "competitor", 0.8)
+
+    assert graph.relationships["A"] == [("B", "correlation", 0.5), ("C", "competitor", 0.3)]
+
+
+def test_reassigned_relationship_map_resets_the_key_index() -> None:
+    """Replacing the map or one source list drops keys that belonged to the old contents."""
+    graph = AssetRelationshipGraph()
+    graph.add_relationship("A", "B", "correlation", 0.5)
+
+    graph.relationships = {"A": [("C", "competitor", 0.3)]}
+    graph.add_relationship("A", "B", "correlation", 0.6)
+    graph.relationships["A"] = [("D", "competitor", 0.1)]
+    graph.add_relationship("A", "C", "competitor", 0.2)
+    graph.add_relationship("A", "D", "competitor", 0.9)
+
+    assert graph.relationships == {"A": [("D", "competitor", 0.1), ("C", "competitor", 0.2)]}
+
+
+def test_truncated_public_list_is_reindexed() -> None:
+    """Removing entries from a public list lets the removed key be inserted again."""
+    graph = AssetRelationshipGraph()
+    graph.add_relationship("A", "B", "correlation", 0.5)
+    graph.add_relationship("A", "C", "correlation", 0.5)
+
+    graph.relationships["A"].pop()
+    graph.add_relationship("A", "C", "correlation", 0.7)
+
+    assert graph.relationships["A"] == [("B", "correlation", 0.5), ("C", "correlation", 0.7)]
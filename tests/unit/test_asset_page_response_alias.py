@@ -14,4 +14,4 @@ def test_asset_page_response_uses_public_has_more_alias() -> None:
     payload = response.model_dump(by_alias=True)
 
     assert payload["hasMore"] is True
-    assert set(payload) == {"items", "total", "page", "per_page", "hasMore"}
+    assert set(payload) == {"items", "total", "page", "per_page", "hasMore", "next_cursor"}
@@ -0,0 +1,133 @@
+"""Tests for the CSR adjacency snapshot and the ``csr`` graph backend."""
+
+import numpy as np
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.compact_adjacency import CompactAdjacency
+from src.models.financial_models import AssetClass, Bond, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _equity(asset_id: str, sector: str) -> Equity:
+    """Build a minimal equity in the given sector."""
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Equity",
+        asset_class=AssetClass.EQUITY,
+        sector=sector,
+        price=100.0,
+    )
+
+
+def _bond(asset_id: str, sector: str, issuer_id: str) -> Bond:
+    """Build a minimal bond in the given sector linked to ``issuer_id``."""
+    return Bond(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Bond",
+        asset_class=AssetClass.FIXED_INCOME,
+        sector=sector,
+        price=99.0,
+        issuer_id=issuer_id,
+    )
+
+
+def _populate(graph: AssetRelationshipGraph) -> AssetRelationshipGraph:
+    """Add a small mixed-sector asset set and build relationships."""
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("MSFT", "Technology"))
+    graph.add_asset(_equity("NVDA", "Technology"))
+    graph.add_asset(_bond("AAPL_B", "Fixed Income", "AAPL"))
+    graph.add_asset(_equity("XOM", "Energy"))
+    graph.build_relationships()
+    return graph
+
+
+def test_round_trip_preserves_order_strengths_and_empty_rows() -> None:
+    """Packing and unpacking returns the same ordered map, including empty source rows."""
+    relationships = {
+        "A": [("B", "correlation", 0.7), ("C", "same_sector", 0.1)],
+        "EMPTY": [],
+        "B": [("A", "correlation", -0.35)],
+    }
+
+    adjacency = CompactAdjacency.from_relationships(relationships)
+
+    assert adjacency.to_relationships() == relationships
+    assert list(adjacency.to_relationships()) == ["A", "EMPTY", "B"]
+    assert adjacency.node_ids == ("A", "EMPTY", "B", "C")
+    assert adjacency.out_degrees().tolist() == [2, 0, 1]
+    assert adjacency.strengths.dtype == np.float32
+    assert adjacency.outgoing("C") == []
+    assert list(adjacency.iter_edges(chunk_size=1)) == [
+        ("A", "B", "correlation", 0.7),
+        ("A", "C", "same_sector", 0.1),
+        ("B", "A", "correlation", -0.35),
+    ]
+
+
+def test_top_edges_keep_storage_order_for_ties() -> None:
+    """Equal strengths keep the order a stable descending sort of the dict view yields."""
+    adjacency = CompactAdjacency.from_relationships(
+        {"A": [("B", "x", 0.5), ("C", "x", 0.9)], "B": [("A", "x", 0.5)]},
+    )
+
+    assert adjacency.top_edges(2) == [("A", "C", "x", 0.9), ("A", "B", "x", 0.5)]
+    assert adjacency.top_edges(0) == []
+
+
+def test_csr_backend_metrics_match_dict_backend() -> None:
+    """Every metric computed from the CSR arrays equals the dict-backend result."""
+    dict_graph = _populate(AssetRelationshipGraph())
+    csr_graph = _populate(AssetRelationshipGraph(backend="csr"))
+
+    assert csr_graph.calculate_metrics() == dict_graph.calculate_metrics()
+    assert csr_graph.out_degrees() == dict_graph.out_degrees()
+    assert list(csr_graph.iter_relationships()) == list(dict_graph.iter_relationships())
+    assert csr_graph.relationships == dict_graph.relationships
+
+
+def test_csr_backend_releases_dict_view_until_accessed() -> None:
+    """After a build the dict view is dropped and rebuilt lazily from the CSR arrays."""
+    graph = _populate(AssetRelationshipGraph(backend="csr"))
+
+    assert graph._relationships is None
+    assert graph.out_degree("AAPL") == 2
+    assert graph.outgoing_relationships("AAPL_B") == [("AAPL", "corporate_link", graph.corporate_bond_strength)]
+    assert graph._relationships is None
+    assert graph.relationships["AAPL"][0][0] == "MSFT"
+
+
+def test_csr_backend_sees_relationships_added_after_compaction() -> None:
+    """Adding an edge after compaction invalidates the CSR snapshot."""
+    graph = _populate(AssetRelationshipGraph(backend="csr"))
+    before = graph.calculate_metrics()["total_relationships"]
+
+    graph.add_relationship("XOM", "AAPL", "correlation", 0.25)
+
+    assert graph.calculate_metrics()["total_relationships"] == before + 1
+    assert graph.out_degree("XOM") == 1
+    assert graph.compact().outgoing("XOM") == [("AAPL", "correlation", 0.25)]
+
+
+def test_csr_backend_repacks_after_edits_to_the_materialized_view() -> None:
+    """In-place edits to the dict view are not hidden behind the stale CSR snapshot."""
+    graph = _populate(AssetRelationshipGraph(backend="csr"))
+    before = graph.calculate_metrics()["total_relationships"]
+
+    graph.relationships["AAPL"].append(("XOM", "correlation", 0.25))
+    graph.relationships["AAPL"][0] = ("MSFT", "same_sector", 0.5)
+
+    assert graph.calculate_metrics()["total_relationships"] == before + 1
+    assert graph.out_degree("AAPL") == 3
+    assert graph.compact().outgoing("AAPL")[0] == ("MSFT", "same_sector", 0.5)
+    assert ("AAPL", "XOM", "correlation", 0.25) in list(graph.iter_relationships())
+
+
+def test_unknown_backend_is_rejected() -> None:
+    """Only the dict and csr backends are accepted."""
+    with pytest.raises(ValueError, match="backend"):
+        AssetRelationshipGraph(backend="sparse")  # type: ignore[arg-type]
@@ -88,3 +88,25 @@ class TestDistributedSync:
                                 job_id="new-job-id",
                                 expected_last_synced_job_id="old-job-id",
                             )
+
+    def test_sync_warms_governed_snapshot_before_publishing_graph(self, mock_settings, mock_graph_state):
+        """The new job's governed snapshot is built before readers can see its graph."""
+        calls: list[str] = []
+        with patch("api.graph_lifecycle._query_latest_successful_rebuild_job_id", return_value="new-job-id"):
+            with patch("src.data.database.get_shared_session_factory") as mock_shared_factory:
+                with patch(
+                    "src.data.repository.AssetGraphRepository.load_graph",
+                    return_value=AssetRelationshipGraph(),
+                ):
+                    with patch(
+                        "api.services.relationship_index.warm_governed_snapshot_for_rebuild_job",
+                        side_effect=lambda job_id: calls.append(f"warm:{job_id}") or True,
+                    ):
+                        with patch(
+                            "api.graph_lifecycle.synchronize_runtime_graph",
+                            side_effect=lambda *_args, **_kwargs: calls.append("publish") or False,
+                        ):
+                            sync_with_latest_rebuild()
+
+        mock_shared_factory.assert_called_once()
+        assert calls == ["warm:new-job-id", "publish"]
@@ -17,9 +17,22 @@ Python optimization flags that would remove assert statements.
 # standard and recommended way to make assertions. Pytest rewrites these statements
 # to provide detailed error messages, and test files are not run with Python's -O flag.
 
+import pickle
+import sys
+import threading
+from dataclasses import dataclass
+
 import pytest
 
-from src.models.financial_models import Asset, AssetClass, Bond, Equity, RegulatoryActivity, RegulatoryEvent
+from src.models.financial_models import (
+    Asset,
+    AssetClass,
+    Bond,
+    Equity,
+    RegulatoryActivity,
+    RegulatoryEvent,
+    trusted_construction,
+)
 
 
 @pytest.mark.unit
@@ -260,6 +273,145 @@ class TestRegulatoryEvent:
         assert event.impact_score == pytest.approx(1.0)
 
 
+@pytest.mark.unit
+class TestSlottedAssets:
+    """Test cases for slotted asset storage and string interning."""
+
+    @staticmethod
+    def test_assets_have_no_instance_dict_and_round_trip_through_pickle():
+        """Slotted assets reject ad-hoc attributes but still pickle and compare by value."""
+        bond = Bond(
+            id="BOND_001",
+            symbol="B1",
+            name="Bond One",
+            asset_class=AssetClass.FIXED_INCOME,
+            sector="Fixed Income",
+            price=99.0,
+            credit_rating="AA",
+        )
+
+        assert not hasattr(bond, "__dict__")
+        with pytest.raises(AttributeError):
+            bond.unexpected = True  # type: ignore[attr-defined]
+        assert pickle.loads(pickle.dumps(bond)) == bond
+
+    @staticmethod
+    def test_sector_currency_and_credit_rating_are_interned():
+        """Equal labels built at runtime resolve to one shared string object."""
+        first = Bond(
+            id="BOND_001",
+            symbol="B1",
+            name="Bond One",
+            asset_class=AssetClass.FIXED_INCOME,
+            sector="".join(["Fixed ", "Income"]),
+            price=99.0,
+            currency="".join(["us", "d"]),
+            credit_rating="".join(["A", "A"]),
+        )
+        second = Bond(
+            id="BOND_002",
+            symbol="B2",
+            name="Bond Two",
+            asset_class=AssetClass.FIXED_INCOME,
+            sector="".join(["Fixed", " Income"]),
+            price=98.0,
+            currency="".join(["U", "SD"]),
+            credit_rating="".join(["AA"]),
+        )
+
+        assert first.sector is second.sector
+        assert first.currency is second.currency == "USD"
+        assert first.credit_rating is second.credit_rating
+
+    @staticmethod
+    def test_unslotted_subclasses_keep_validation():
+        """Plain dataclass subclasses of slotted assets still validate and accept new fields."""
+
+        @dataclass
+        class TaggedEquity(Equity):
+            tag: str = ""
+
+        equity = TaggedEquity(
+            id="EQ_001",
+            symbol="EQ",
+            name="Tagged",
+            asset_class=AssetClass.EQUITY,
+            sector="Technology",
+            price=10.0,
+            tag="core",
+        )
+
+        assert equity.tag == "core"
+        with pytest.raises(ValueError, match="Currency"):
+            TaggedEquity(
+                id="EQ_002",
+                symbol="EQ",
+                name="Tagged",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=10.0,
+                currency="US",
+            )
+
+
+@pytest.mark.unit
+class TestTrustedConstruction:
+    """Test cases for the trusted bulk-construction path."""
+
+    @staticmethod
+    def test_trusted_block_skips_validation_but_still_interns():
+        """Inside the block invalid values are not rejected and labels are still interned."""
+        with trusted_construction():
+            asset = Asset(
+                id="",
+                symbol="X",
+                name="Unchecked",
+                asset_class=AssetClass.EQUITY,
+                sector="".join(["Tech", "nology"]),
+                price=-1.0,
+                currency="usd",
+            )
+            event = RegulatoryEvent(
+                id="EVT_1",
+                asset_id="X",
+                event_type=RegulatoryActivity.SEC_FILING,
+                date="not-a-date",
+                description="Unchecked",
+                impact_score=5.0,
+            )
+
+        assert asset.price == -1.0
+        assert asset.sector is sys.intern("Technology")
+        assert event.date == "not-a-date"
+        with pytest.raises(ValueError, match="Impact score"):
+            RegulatoryEvent(
+                id="EVT_2",
+                asset_id="X",
+                event_type=RegulatoryActivity.SEC_FILING,
+                date="2024-01-01",
+                description="Checked again",
+                impact_score=5.0,
+            )
+
+    @staticmethod
+    def test_trusted_block_does_not_leak_to_other_threads():
+        """Assets built on another thread while a block is open are still validated."""
+        errors: list[Exception] = []
+
+        def build_invalid() -> None:
+            try:
+                Asset(id="", symbol="X", name="X", asset_class=AssetClass.EQUITY, sector="Tech", price=1.0)
+            except ValueError as exc:
+                errors.append(exc)
+
+        with trusted_construction():
+            worker = threading.Thread(target=build_invalid)
+            worker.start()
+            worker.join()
+
+        assert len(errors) == 1
+
+
 @pytest.mark.unit
 class TestRegulatoryActivityNewValues:
     """Test cases for newly added RegulatoryActivity enum members."""
@@ -0,0 +1,156 @@
+"""Tests for the byte-bounded governed relationship snapshot store."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import pytest
+from prometheus_client import REGISTRY
+
+from api.services import relationship_index
+from api.services.relationship_index import (
+    GovernedRelationshipIndex,
+    ProjectionEdgeBinding,
+    PublishedRelationshipSnapshot,
+)
+from api.services.snapshot_store import GovernedSnapshotStore, estimate_snapshot_bytes, governed_snapshot_store
+
+pytestmark = pytest.mark.unit
+
+
+def _snapshot(edge_count: int) -> PublishedRelationshipSnapshot:
+    """Build a snapshot with ``edge_count`` governed edges."""
+    index: dict[tuple[str, str, str], dict[str, object]] = {}
+    bindings: dict[tuple[str, str, str], ProjectionEdgeBinding] = {}
+    for position in range(edge_count):
+        key = (f"SRC{position}", f"DST{position}", "corporate_link")
+        metadata = {
+            "assertion_id": f"assertion-{position}",
+            "governance_status": "governed",
+            "revision_id": "revision-1",
+            "scope_refs": ["financial.bond.issuer_reference@1"],
+        }
+        index[key] = metadata
+        bindings[key] = ProjectionEdgeBinding(
+            projection_edge_id=f"edge-{position}",
+            orientation="canonical",
+            metadata=cast(relationship_index.GovernanceMetadata, metadata),
+        )
+    return PublishedRelationshipSnapshot(
+        publication=None,
+        governance_index=cast(GovernedRelationshipIndex, index),
+        projection_bindings=bindings,
+    )
+
+
+def _sample(name: str, labels: dict[str, str] | None = None) -> float:
+    """Read the current value of one metric sample."""
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def test_store_loads_once_per_publication_and_evicts_by_bytes() -> None:
+    """Snapshots are reused until the byte budget forces out the least recently used one."""
+    snapshot_bytes = estimate_snapshot_bytes(_snapshot(50))
+    store = GovernedSnapshotStore(max_bytes=2 * snapshot_bytes)
+    loads: list[str] = []
+
+    def load(publication_id: str) -> PublishedRelationshipSnapshot:
+        loads.append(publication_id)
+        return _snapshot(50)
+
+    hits_before = _sample("governed_snapshot_cache_requests_total", {"result": "hit"})
+    evictions_before = _sample("governed_snapshot_cache_evictions_total")
+
+    first = store.get_or_load("rev-a", "pub-a", lambda: load("pub-a"))
+    assert store.get_or_load("rev-a", "pub-a", lambda: load("pub-a")) is first
+    store.get_or_load("rev-b", "pub-b", lambda: load("pub-b"))
+    store.get_or_load("rev-a", "pub-a", lambda: load("pub-a"))
+    store.get_or_load("rev-c", "pub-c", lambda: load("pub-c"))
+    store.get_or_load("rev-b", "pub-b", lambda: load("pub-b"))
+
+    assert loads == ["pub-a", "pub-b", "pub-c", "pub-b"]
+    assert len(store) == 2
+    assert store.size_bytes <= 2 * snapshot_bytes
+    assert _sample("governed_snapshot_cache_requests_total", {"result": "hit"}) - hits_before == 2
+    assert _sample("governed_snapshot_cache_evictions_total") - evictions_before == 2
+
+
+def test_oversized_snapshot_is_kept_alone() -> None:
+    """A snapshot larger than the budget replaces the others instead of being rebuilt every read."""
+    store = GovernedSnapshotStore(max_bytes=1)
+    loads = 0
+
+    def load() -> PublishedRelationshipSnapshot:
+        nonlocal loads
+        loads += 1
+        return _snapshot(5)
+
+    store.get_or_load("rev-a", "pub-a", load)
+    store.get_or_load("rev-a", "pub-a", load)
+
+    assert loads == 1
+    assert len(store) == 1
+
+
+def test_full_reset_drops_every_stored_snapshot() -> None:
+    """A reconfiguration reset cannot serve snapshots stored under reused publication ids."""
+    governed_snapshot_store.clear()
+    loads: list[str] = []
+
+    def load(publication_id: str) -> PublishedRelationshipSnapshot:
+        loads.append(publication_id)
+        return _snapshot(1)
+
+    try:
+        governed_snapshot_store.get_or_load("rev-a", "pub-a", lambda: load("pub-a"))
+        governed_snapshot_store.get_or_load("rev-b", "pub-b", lambda: load("pub-b"))
+
+        relationship_index.invalidate_governed_relationship_index_cache()
+        assert len(governed_snapshot_store) == 0
+
+        governed_snapshot_store.get_or_load("rev-a", "pub-a", lambda: load("pub-a"))
+        assert loads == ["pub-a", "pub-b", "pub-a"]
+    finally:
+        governed_snapshot_store.clear()
+
+
+def test_publication_write_keeps_other_publications_and_bindings() -> None:
+    """Writing one publication drops only its snapshot and keeps known job bindings."""
+    governed_snapshot_store.clear()
+    relationship_index.invalidate_governed_relationship_index_cache()
+    loads: list[str] = []
+
+    def load(publication_id: str) -> PublishedRelationshipSnapshot:
+        loads.append(publication_id)
+        return _snapshot(1)
+
+    try:
+        with relationship_index._publication_bindings_lock:
+            relationship_index._publication_bindings["job-a"] = ("rev-a", "pub-a")
+        governed_snapshot_store.get_or_load("rev-a", "pub-a", lambda: load("pub-a"))
+        governed_snapshot_store.get_or_load("rev-b", "pub-b", lambda: load("pub-b"))
+        generation = relationship_index.governed_relationship_cache_generation()
+
+        relationship_index.invalidate_governed_publication_snapshot("pub-b")
+        governed_snapshot_store.get_or_load("rev-a", "pub-a", lambda: load("pub-a"))
+        governed_snapshot_store.get_or_load("rev-b", "pub-b", lambda: load("pub-b"))
+
+        assert loads == ["pub-a", "pub-b", "pub-b"]
+        assert relationship_index._publication_bindings["job-a"] == ("rev-a", "pub-a")
+        assert relationship_index.governed_relationship_cache_generation() > generation
+    finally:
+        relationship_index.invalidate_governed_relationship_index_cache()
+        governed_snapshot_store.clear()
+
+
+def test_snapshot_loaded_across_an_invalidation_is_not_stored() -> None:
+    """An invalidation during a load is not undone by storing the stale snapshot."""
+    store = GovernedSnapshotStore()
+
+    def load_then_invalidate() -> PublishedRelationshipSnapshot:
+        store.invalidate_publication("pub-a")
+        return _snapshot(1)
+
+    store.get_or_load("rev-a", "pub-a", load_then_invalidate)
+
+    assert len(store) == 0
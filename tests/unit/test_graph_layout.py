@@ -0,0 +1,68 @@
+"""Tests for the shared vectorized layouts and their per-version graph cache."""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_layout import circular_layout, fibonacci_sphere_layout
+from src.models.financial_models import AssetClass, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _equity(asset_id: str) -> Equity:
+    """Create a minimal equity."""
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Equity",
+        asset_class=AssetClass.EQUITY,
+        sector="Technology",
+        price=100.0,
+    )
+
+
+def test_fibonacci_sphere_layout_matches_the_scalar_formula() -> None:
+    """Vectorized positions equal the per-node Fibonacci-sphere formula."""
+    node_count = 7
+    golden_ratio = (1 + math.sqrt(5)) / 2
+    expected = []
+    for idx in range(node_count):
+        theta = math.acos(1 - 2 * (idx + 0.5) / node_count)
+        phi = 2 * math.pi * idx / golden_ratio
+        expected.append((math.sin(theta) * math.cos(phi), math.sin(theta) * math.sin(phi), math.cos(theta)))
+
+    assert np.allclose(fibonacci_sphere_layout(node_count), expected)
+    assert fibonacci_sphere_layout(1).tolist() == [[0.0, 0.0, 0.0]]
+
+
+def test_layouts_are_shared_and_read_only() -> None:
+    """Repeat calls return the same array, which callers cannot modify."""
+    positions = circular_layout(4)
+
+    assert circular_layout(4) is positions
+    assert np.allclose(positions[:, :2], [(1, 0), (0, 1), (-1, 0), (0, -1)], atol=1e-12)
+    with pytest.raises(ValueError):
+        positions[0, 0] = 2.0
+
+
+def test_graph_reuses_its_layout_until_the_version_changes() -> None:
+    """The 3D layout is computed once per graph version."""
+    graph = AssetRelationshipGraph()
+    graph.add_asset(_equity("A"))
+    graph.add_asset(_equity("B"))
+
+    first_positions, first_ids, _, _ = graph.get_3d_visualization_data_enhanced()
+    first_ids.append("mutated")
+    second_positions, second_ids, _, _ = graph.get_3d_visualization_data_enhanced()
+
+    assert second_positions is first_positions
+    assert second_ids == ["A", "B"]
+
+    graph.add_asset(_equity("C"))
+    third_positions, third_ids, _, _ = graph.get_3d_visualization_data_enhanced()
+
+    assert third_ids == ["A", "B", "C"]
+    assert third_positions.shape == (3, 3)
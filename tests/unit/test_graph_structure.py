@@ -0,0 +1,70 @@
+"""Tests for connected components and label-propagation communities."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from src.logic.graph_structure import graph_structure
+
+pytestmark = pytest.mark.unit
+
+_EDGES = [
+    ("A1", "A2", "same_sector", 0.9),
+    ("A2", "A3", "same_sector", 0.9),
+    ("A3", "A1", "same_sector", 0.9),
+    ("B1", "B2", "same_sector", 0.9),
+    ("B2", "B3", "same_sector", 0.9),
+    ("B3", "B1", "same_sector", 0.9),
+    ("A3", "B1", "observed", 0.1),
+    ("C1", "C2", "observed", 0.0),
+]
+
+
+class _EdgeListGraph:
+    """Minimal stand-in exposing the `assets` and `iter_relationships` protocol the pass reads."""
+
+    def __init__(self, asset_ids: list[str], edges: list[tuple[str, str, str, float]]) -> None:
+        self.assets = dict.fromkeys(asset_ids)
+        self.edges = edges
+
+    def iter_relationships(self) -> Iterator[tuple[str, str, str, float]]:
+        """Yield the configured edges."""
+        yield from self.edges
+
+
+def _graph() -> _EdgeListGraph:
+    """Two triangles joined by a weak bridge, one zero-strength pair and one isolated asset."""
+    return _EdgeListGraph(["A1", "A2", "A3", "B1", "B2", "B3", "LONE"], _EDGES)
+
+
+def test_components_ignore_direction_and_include_isolated_assets() -> None:
+    """Every edge joins its endpoints, and assets without edges form singletons."""
+    structure = graph_structure(_graph())  # type: ignore[arg-type]
+
+    assert structure.components == [
+        ("A1", "A2", "A3", "B1", "B2", "B3"),
+        ("C1", "C2"),
+        ("LONE",),
+    ]
+    assert structure.communities is None
+
+
+def test_label_propagation_splits_a_component_at_its_weak_bridge() -> None:
+    """Strongly linked triangles form separate communities inside one component."""
+    structure = graph_structure(_graph(), communities=True)  # type: ignore[arg-type]
+
+    assert structure.communities == [
+        ("A1", "A2", "A3"),
+        ("B1", "B2", "B3"),
+        ("C1",),
+        ("C2",),
+        ("LONE",),
+    ]
+
+
+def test_empty_graph_has_no_clusters() -> None:
+    """An empty graph decomposes into no components or communities."""
+    structure = graph_structure(_EdgeListGraph([], []), communities=True)  # type: ignore[arg-type]
+
+    assert structure.components == []
+    assert structure.communities == []
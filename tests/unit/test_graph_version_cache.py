@@ -0,0 +1,52 @@
+"""Tests for per-graph caches of version-derived values."""
+
+import gc
+import weakref
+
+import pytest
+
+from api.services.graph_version_cache import GraphVersionCache
+from src.logic.asset_graph import AssetRelationshipGraph
+
+pytestmark = pytest.mark.unit
+
+
+def _edge_count(graph: AssetRelationshipGraph) -> int:
+    """Count the relationships of ``graph``; stands in for an expensive derived index."""
+    return sum(1 for _ in graph.iter_relationships())
+
+
+def test_value_is_reused_until_the_graph_version_changes() -> None:
+    """A value is built once per version and variant."""
+    cache: GraphVersionCache[int] = GraphVersionCache()
+    graph = AssetRelationshipGraph()
+    graph.add_relationship("A", "B", "correlation", 0.5)
+    builds: list[bool] = []
+
+    def build(built: AssetRelationshipGraph, variant: bool) -> int:
+        builds.append(variant)
+        return _edge_count(built)
+
+    assert cache.get_or_build(graph, lambda built: build(built, True), variant=True) == 1
+    assert cache.get_or_build(graph, lambda built: build(built, True), variant=True) == 1
+    assert cache.get_or_build(graph, lambda built: build(built, False), variant=False) == 1
+    assert builds == [True, False]
+
+    graph.add_relationship("B", "C", "correlation", 0.5)
+    assert cache.get_or_build(graph, lambda built: build(built, True), variant=True) == 2
+    assert builds == [True, False, True]
+
+
+def test_replaced_graphs_are_released_with_their_values() -> None:
+    """The cache does not keep a graph alive once the runtime drops it."""
+    cache: GraphVersionCache[int] = GraphVersionCache()
+    graph = AssetRelationshipGraph()
+    graph.add_relationship("A", "B", "correlation", 0.5)
+    cache.get_or_build(graph, _edge_count)
+    released = weakref.ref(graph)
+
+    del graph
+    gc.collect()
+
+    assert released() is None
+    assert len(cache) == 0
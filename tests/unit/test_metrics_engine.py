@@ -0,0 +1,79 @@
+"""Tests for the NumPy metrics engine over CSR relationship storage."""
+
+import pytest
+
+from src.logic import metrics_engine
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.compact_adjacency import CompactAdjacency
+from src.models.financial_models import AssetClass, Bond, Equity
+
+pytestmark = pytest.mark.unit
+
+
+def _equity(asset_id: str, sector: str) -> Equity:
+    """Build a minimal equity in the given sector."""
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Equity",
+        asset_class=AssetClass.EQUITY,
+        sector=sector,
+        price=100.0,
+    )
+
+
+def _bond(asset_id: str, issuer_id: str) -> Bond:
+    """Build a minimal bond linked to ``issuer_id``."""
+    return Bond(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Bond",
+        asset_class=AssetClass.FIXED_INCOME,
+        sector="Fixed Income",
+        price=99.0,
+        issuer_id=issuer_id,
+    )
+
+
+def test_degree_summary_and_distributions() -> None:
+    """Degrees, type counts and value counts follow interned order."""
+    adjacency = CompactAdjacency.from_relationships(
+        {
+            "A": [("B", "correlation", 0.5), ("C", "same_sector", 0.7)],
+            "EMPTY": [],
+            "B": [("C", "correlation", 0.1)],
+        }
+    )
+
+    assert metrics_engine.degree_summary(adjacency) == (1.0, 2)
+    assert metrics_engine.relationship_type_distribution(adjacency) == {"correlation": 2, "same_sector": 1}
+    assert metrics_engine.value_distribution(["b", "a", "b", "c"]) == {"b": 2, "a": 1, "c": 1}
+    assert metrics_engine.value_distribution([]) == {}
+    assert metrics_engine.degree_summary(CompactAdjacency.from_relationships({})) == (0.0, 0)
+
+
+def test_participating_count_matches_the_union_set() -> None:
+    """Referenced IDs that are not stored assets are counted once alongside the assets."""
+    graph = AssetRelationshipGraph()
+    graph.add_asset(_equity("AAPL", "Technology"))
+    graph.add_asset(_equity("IDLE", "Energy"))
+    graph.add_relationship("AAPL", "EXTERNAL", "correlation", 0.3, bidirectional=True)
+    graph.add_relationship("GHOST", "AAPL", "correlation", 0.2)
+
+    adjacency = graph.compact()
+
+    assert metrics_engine.participating_count(adjacency, graph.assets) == len(graph.collect_participating_asset_ids())
+    assert metrics_engine.participating_count(CompactAdjacency.from_relationships({}), graph.assets) == 2
+
+
+def test_csr_calculate_metrics_uses_the_engine_and_matches_dict_backend() -> None:
+    """The csr backend's metrics come from the engine and equal the dict backend's."""
+    graphs = [AssetRelationshipGraph(backend="dict"), AssetRelationshipGraph(backend="csr")]
+    for graph in graphs:
+        graph.add_asset(_equity("AAPL", "Technology"))
+        graph.add_asset(_equity("MSFT", "Technology"))
+        graph.add_asset(_bond("AAPL_B", "AAPL"))
+        graph.build_relationships()
+        graph.add_relationship("MSFT", "EXTERNAL", "correlation", 0.4)
+
+    assert graphs[1].calculate_metrics() == graphs[0].calculate_metrics()
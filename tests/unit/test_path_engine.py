@@ -0,0 +1,82 @@
+"""Tests for weighted shortest-path and exposure-path searches."""
+
+import math
+from collections.abc import Iterator
+
+import pytest
+
+from src.logic.path_engine import PathEngine
+
+pytestmark = pytest.mark.unit
+
+_EDGES = [
+    ("BOND", "ISSUER", "corporate_link", 0.9),
+    ("ISSUER", "PEER", "same_sector", 0.7),
+    ("PEER", "ISSUER", "same_sector", 0.7),
+    ("PEER", "FAR", "observed", 0.5),
+    ("ISSUER", "FAR", "observed", 0.1),
+    ("ISSUER", "DEAD", "observed", 0.0),
+]
+
+
+class _EdgeListGraph:
+    """Minimal stand-in exposing the `iter_relationships` protocol the engine reads."""
+
+    def __init__(self, edges: list[tuple[str, str, str, float]]) -> None:
+        self.edges = edges
+
+    def iter_relationships(self) -> Iterator[tuple[str, str, str, float]]:
+        """Yield the configured edges."""
+        yield from self.edges
+
+
+def _engine(*, undirected: bool = True) -> PathEngine:
+    """Build an engine over the shared edge list."""
+    return PathEngine.from_graph(_EdgeListGraph(_EDGES), undirected=undirected)  # type: ignore[arg-type]
+
+
+def test_shortest_path_maximizes_the_product_of_strengths() -> None:
+    """A longer path with stronger hops beats a direct weak edge."""
+    result = _engine().shortest_path("BOND", "FAR", max_expansions=100)
+
+    (path,) = result.paths
+    assert path.asset_ids == ("BOND", "ISSUER", "PEER", "FAR")
+    assert path.relationship_types == ("corporate_link", "same_sector", "observed")
+    assert path.exposure == pytest.approx(0.9 * 0.7 * 0.5)
+    assert path.cost == pytest.approx(-math.log(0.9 * 0.7 * 0.5))
+    assert result.truncated is False
+
+
+def test_direction_and_zero_strength_edges_limit_reachability() -> None:
+    """Directed engines do not walk edges backwards, and zero-strength edges carry no exposure."""
+    assert _engine(undirected=False).shortest_path("ISSUER", "BOND", max_expansions=100).paths == []
+    assert _engine().shortest_path("ISSUER", "BOND", max_expansions=100).paths[0].asset_ids == ("ISSUER", "BOND")
+    assert _engine().shortest_path("ISSUER", "DEAD", max_expansions=100).paths == []
+
+
+def test_exposure_paths_are_ordered_by_decreasing_exposure() -> None:
+    """Each reached node gets its best path, most exposed first, limited to max_paths."""
+    result = _engine().exposure_paths("ISSUER", max_paths=3, max_expansions=100)
+
+    assert [path.asset_ids[-1] for path in result.paths] == ["BOND", "PEER", "FAR"]
+    exposures = [path.exposure for path in result.paths]
+    assert exposures == sorted(exposures, reverse=True)
+    first_only = _engine().exposure_paths("ISSUER", max_paths=1, max_expansions=100)
+    assert [path.asset_ids[-1] for path in first_only.paths] == ["BOND"]
+
+
+def test_expansion_cap_and_time_budget_truncate_searches() -> None:
+    """Searches stop on the expansion cap or an exhausted budget and report truncation."""
+    capped = _engine().shortest_path("BOND", "FAR", max_expansions=1)
+    out_of_time = _engine().exposure_paths("ISSUER", max_paths=10, max_expansions=100, time_budget_s=-1.0)
+
+    assert capped.paths == []
+    assert capped.truncated is True
+    assert out_of_time.truncated is True
+    assert out_of_time.expanded == 0
+
+
+def test_unknown_nodes_return_no_paths() -> None:
+    """Nodes without relationships are not in the engine and yield empty results."""
+    assert _engine().shortest_path("MISSING", "FAR", max_expansions=10).paths == []
+    assert _engine().exposure_paths("MISSING", max_paths=10, max_expansions=10).paths == []
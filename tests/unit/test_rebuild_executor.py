@@ -92,11 +92,39 @@ def test_rebuild_executor_checkpoints(executor, sample_asset):
 
     executor.run_rebuild(assets=assets, regulatory_events=[], on_checkpoint=on_checkpoint)
 
-    # 51 assets should trigger a checkpoint at 50, and another at the end
-    assert len(checkpoints) == 2
-    assert checkpoints[0]["processed_count"] == 50
-    assert checkpoints[0]["last_asset_id"] == "EQ_49"
-    assert checkpoints[1]["processed_count"] == 51
+    # 51 assets should trigger a checkpoint at 50, and another at the end of the asset loop
+    asset_checkpoints = [state for state in checkpoints if "completed_blocks" not in state]
+    assert len(asset_checkpoints) == 2
+    assert asset_checkpoints[0]["processed_count"] == 50
+    assert asset_checkpoints[0]["last_asset_id"] == "EQ_49"
+    assert asset_checkpoints[1]["processed_count"] == 51
+
+
+def test_rebuild_executor_keeps_relationship_progress_out_of_checkpoints(executor, monkeypatch):
+    """Relationship-block progress is reported separately, so the last checkpoint stays resumable."""
+    from src.logic import asset_graph
+
+    monkeypatch.setattr(asset_graph, "_BUILD_BLOCK_SIZE", 2)
+    assets = [
+        Equity(
+            id=f"EQ_{i}",
+            symbol=f"TEQ{i}",
+            name="Test Equity",
+            asset_class=AssetClass.EQUITY,
+            sector="Technology",
+            price=100.0,
+        )
+        for i in range(5)
+    ]
+    checkpoints: list[dict[str, Any]] = []
+    progress: list[dict[str, Any]] = []
+    monkeypatch.setattr(executor, "_log_relationship_progress", progress.append)
+
+    executor.run_rebuild(assets=assets, regulatory_events=[], on_checkpoint=checkpoints.append)
+
+    assert checkpoints == [{"processed_ids": [asset.id for asset in assets], "processed_count": 5}]
+    assert [(state["completed_blocks"], state["total_blocks"]) for state in progress] == [(1, 3), (2, 3), (3, 3)]
+    assert progress[-1]["merged_source_count"] == 5
 
 
 def test_rebuild_executor_resume_from_checkpoint(executor):
@@ -9,6 +9,7 @@ import pytest
 from fastapi import HTTPException, status
 
 from api.services import relationship_index
+from api.services.snapshot_store import governed_snapshot_store
 from src.logic.asset_graph import AssetRelationshipGraph
 
 
@@ -16,10 +17,12 @@ from src.logic.asset_graph import AssetRelationshipGraph
 def _reset_relationship_index_caches() -> Generator[None, None, None]:
     """Keep cache and weak graph bindings isolated between tests."""
     relationship_index.invalidate_governed_relationship_index_cache()
+    governed_snapshot_store.clear()
     with relationship_index._runtime_graph_bindings_lock:  # pylint: disable=protected-access
         relationship_index._runtime_graph_bindings.clear()  # pylint: disable=protected-access
     yield
     relationship_index.invalidate_governed_relationship_index_cache()
+    governed_snapshot_store.clear()
     with relationship_index._runtime_graph_bindings_lock:  # pylint: disable=protected-access
         relationship_index._runtime_graph_bindings.clear()  # pylint: disable=protected-access
 
@@ -71,10 +74,10 @@ def test_unbound_managed_startup_graph_omits_optional_governance(
     assert relationship_index.load_governed_relationship_index(graph) == {}
 
 
-def test_managed_graph_checks_shared_version_on_every_read_but_caches_revision(
+def test_managed_graph_resolves_its_job_binding_once_and_caches_revision(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Shared publication freshness is checked without rebuilding a stable index."""
+    """Steady-state reads reuse the job's immutable binding and the stable index."""
     graph = AssetRelationshipGraph()
     version_checks = 0
     revision_loads = 0
@@ -94,7 +97,7 @@ def test_managed_graph_checks_shared_version_on_every_read_but_caches_revision(
     )
 
     def job_binding(_job_id: str) -> tuple[str, str]:
-        """Count the shared publication-version checks."""
+        """Count the persisted publication-binding lookups."""
         nonlocal version_checks
         version_checks += 1
         return "revision-1", "publication-1"
@@ -122,14 +125,14 @@ def test_managed_graph_checks_shared_version_on_every_read_but_caches_revision(
 
     assert relationship_index.load_governed_relationship_index(graph) == expected
     assert relationship_index.load_governed_relationship_index(graph) == expected
-    assert version_checks == 2
+    assert version_checks == 1
     assert revision_loads == 1
 
 
 def test_stale_in_flight_graph_remains_bound_to_its_original_job(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """An old graph object fails closed after the lifecycle advances to a new job."""
+    """An old graph object fails closed once a publication write no longer resolves its job."""
     graph = AssetRelationshipGraph()
     bindings = iter(((True, "job-old"), (True, "job-old")))
     publications = iter((("revision-old", "pub-old"), None))
@@ -181,6 +184,7 @@ def test_stale_in_flight_graph_remains_bound_to_its_original_job(
     first = relationship_index.load_governed_relationship_index(graph)
     assert first[("BOND", "ISSUER", "corporate_link")]["revision_id"] == "revision-old"
 
+    relationship_index.invalidate_governed_relationship_index_cache()
     with pytest.raises(HTTPException, match="synchronization is pending"):
         relationship_index.load_governed_relationship_index(graph)
 
@@ -327,3 +331,33 @@ def test_unmanaged_graph_retains_isolated_loader_path(monkeypatch: pytest.Monkey
     assert relationship_index.load_governed_relationship_index(graph) == {}
     assert relationship_index.load_governed_relationship_index(graph) == {}
     assert calls == 1
+
+
+def test_primed_binding_serves_reads_without_persistence_lookups(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A binding primed at synchronization time is reused until the next publication write."""
+    lookups: list[str] = []
+
+    def job_binding(job_id: str) -> tuple[str, str] | None:
+        """Record each persisted lookup; only job-1 is published."""
+        lookups.append(job_id)
+        return ("revision-1", "publication-1") if job_id == "job-1" else None
+
+    monkeypatch.setattr(
+        relationship_index,
+        "_published_projection_binding_for_rebuild_job_from_persistence",
+        job_binding,
+    )
+
+    binding_for_job = (
+        relationship_index._published_projection_binding_for_rebuild_job  # pylint: disable=protected-access
+    )
+
+    relationship_index.prime_publication_binding_for_rebuild_job("job-1")
+    relationship_index.prime_publication_binding_for_rebuild_job("job-pending")
+    assert binding_for_job("job-1") == ("revision-1", "publication-1")
+    assert binding_for_job("job-pending") is None
+    assert lookups == ["job-1", "job-pending", "job-pending"]
+
+    relationship_index.invalidate_governed_relationship_index_cache()
+    binding_for_job("job-1")
+    assert lookups[-1] == "job-1"
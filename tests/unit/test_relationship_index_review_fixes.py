@@ -19,7 +19,7 @@ from src.data.relationship_projection_persistence import PersistedProjectionRevi
 
 @pytest.mark.unit
 def test_assertion_predicate_lookup_chunks_large_revisions() -> None:
-    """Assertion ownership queries stay below the bounded IN-clause chunk size."""
+    """SQLite assertion ownership queries stay below the bounded IN-clause chunk size."""
     assertion_ids = [f"assertion-{index:04d}" for index in range(801)]
     published = cast(
         PersistedProjectionRevision,
@@ -30,6 +30,7 @@ def test_assertion_predicate_lookup_chunks_large_revisions() -> None:
         ),
     )
     session = Mock(spec=Session)
+    session.get_bind.return_value.dialect.name = "sqlite"
     query_results: list[Mock] = []
     for start in range(0, len(assertion_ids), relationship_index._IN_CLAUSE_CHUNK_SIZE):
         result = Mock()
@@ -46,6 +47,37 @@ def test_assertion_predicate_lookup_chunks_large_revisions() -> None:
     assert session.execute.call_count == 3
 
 
+@pytest.mark.unit
+def test_assertion_predicate_lookup_joins_revision_edges_in_one_query() -> None:
+    """Server databases resolve every edge's predicate with one streamed join query."""
+    assertion_ids = [f"assertion-{index:04d}" for index in range(801)]
+    edge_ids = tuple(f"edge-{index:04d}" for index in range(801))
+    published = cast(
+        PersistedProjectionRevision,
+        SimpleNamespace(
+            revision_id="revision-1",
+            edge_ids=edge_ids,
+            revision=SimpleNamespace(
+                edges=tuple(SimpleNamespace(assertion_id=assertion_id) for assertion_id in assertion_ids)
+            ),
+        ),
+    )
+    session = Mock(spec=Session)
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.return_value.tuples.return_value = iter([(edge_id, "predicate-test") for edge_id in edge_ids[:-1]])
+
+    with pytest.raises(relationship_index.ValidationError, match="assertion-0800"):
+        relationship_index._assertion_predicates_for_edges(session, published)
+
+    session.execute.return_value.tuples.return_value = iter([(edge_id, "predicate-test") for edge_id in edge_ids])
+    assertion_predicates = relationship_index._assertion_predicates_for_edges(session, published)
+
+    assert assertion_predicates == dict.fromkeys(assertion_ids, "predicate-test")
+    assert session.execute.call_count == 2
+    statement = session.execute.call_args.args[0]
+    assert statement.get_execution_options()["yield_per"] == relationship_index._JOIN_YIELD_PER
+
+
 @pytest.mark.unit
 def test_relationship_index_persistence_sqlalchemy_errors_are_bounded(
     monkeypatch: pytest.MonkeyPatch,
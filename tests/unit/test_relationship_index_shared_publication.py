@@ -6,9 +6,9 @@ from datetime import datetime, timezone
 from unittest.mock import Mock
 
 import pytest
-from sqlalchemy.engine import Engine
 
 from api.services import relationship_index as relationship_index_service
+from src.data.database import claim_shared_engine
 from src.data.relationship_projection_persistence import PersistedProjectionRevision
 from src.governance import relationship_assertion_contract as contract_models
 from src.logic.asset_graph import AssetRelationshipGraph
@@ -109,47 +109,48 @@ def test_governance_stays_consistent_with_graph_snapshot_across_publications(
 
 
 @pytest.mark.unit
-def test_persistence_runtime_reuses_engine_and_disposes_on_url_change(
+def test_persistence_runtime_disposes_engines_only_once_no_subsystem_uses_them(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Hot-path version probes reuse pooling while runtime URL changes stay bounded."""
-    engines = [Mock(spec=Engine), Mock(spec=Engine)]
-    factories = [Mock(name="factory-one"), Mock(name="factory-two")]
-    created_urls: list[str] = []
+    """Switching URLs releases the previous shared engine unless another subsystem still claims it."""
+    urls = ("postgresql://graph-one", "postgresql://graph-two", "postgresql://graph-three")
+    factories = {url: Mock(name=url) for url in urls}
+    requested_urls: list[str] = []
+    disposed_urls: list[str] = []
 
-    def create_engine(persistence_url: str) -> Engine:
-        """Return a distinct fake engine for each configured URL."""
-        created_urls.append(persistence_url)
-        return engines[len(created_urls) - 1]
-
-    def create_factory(engine: Engine) -> Mock:
-        """Return the factory associated with the supplied fake engine."""
-        return factories[engines.index(engine)]
+    def shared_session_factory(persistence_url: str) -> Mock:
+        """Return the registered fake factory for each URL."""
+        requested_urls.append(persistence_url)
+        return factories[persistence_url]
 
     relationship_index_service._reset_governance_persistence_runtime()
-    monkeypatch.setattr(relationship_index_service, "create_engine_from_url", create_engine)
-    monkeypatch.setattr(relationship_index_service, "create_session_factory", create_factory)
+    monkeypatch.setattr(relationship_index_service, "get_shared_session_factory", shared_session_factory)
+    monkeypatch.setattr(relationship_index_service, "dispose_shared_engine", disposed_urls.append)
 
     try:
-        first = relationship_index_service._session_factory_for_url("postgresql://graph-one")
-        repeated = relationship_index_service._session_factory_for_url("postgresql://graph-one")
+        first = relationship_index_service._session_factory_for_url(urls[0])
+        repeated = relationship_index_service._session_factory_for_url(urls[0])
 
-        assert first is factories[0]
+        assert first is factories[urls[0]]
         assert repeated is first
-        assert created_urls == ["postgresql://graph-one"]
-        engines[0].dispose.assert_not_called()
+        assert requested_urls == [urls[0]]
+
+        second = relationship_index_service._session_factory_for_url(urls[1])
+
+        assert second is factories[urls[1]]
+        assert requested_urls == [urls[0], urls[1]]
+        assert disposed_urls == [urls[0]]
 
-        second = relationship_index_service._session_factory_for_url("postgresql://graph-two")
+        claim_shared_engine("assertions", urls[1])
+        relationship_index_service._session_factory_for_url(urls[2])
+        assert disposed_urls == [urls[0]]
 
-        assert second is factories[1]
-        assert created_urls == ["postgresql://graph-one", "postgresql://graph-two"]
-        engines[0].dispose.assert_called_once_with()
-        engines[1].dispose.assert_not_called()
+        relationship_index_service._reset_governance_persistence_runtime()
+        assert disposed_urls == [urls[0], urls[2]]
     finally:
+        claim_shared_engine("assertions", None)
         relationship_index_service._reset_governance_persistence_runtime()
 
-    engines[1].dispose.assert_called_once_with()
-
 
 def _predicate(predicate_id: str) -> contract_models.PredicateSpec:
     """Build one governed predicate sharing a runtime edge type with its peer."""
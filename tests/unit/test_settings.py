@@ -376,6 +376,34 @@ class TestLoadSettings:
         settings = load_settings()
         assert settings.rebuild_lock_ttl_seconds == 600
 
+    @patch.dict(
+        os.environ,
+        {"DATABASE_POOL_SIZE": "12", "DATABASE_MAX_OVERFLOW": "0", "DATABASE_POOL_RECYCLE_SECONDS": "-1"},
+        clear=True,
+    )
+    def test_load_settings_database_pool_from_env(self) -> None:
+        """Test that shared engine pool options are loaded from environment."""
+        settings = load_settings()
+        assert settings.database_pool_size == 12
+        assert settings.database_max_overflow == 0
+        assert settings.database_pool_recycle_seconds == -1
+
+    @patch.dict(os.environ, {"DATABASE_POOL_RECYCLE_SECONDS": "0"}, clear=True)
+    def test_load_settings_database_pool_recycle_zero_raises_validation_error(self) -> None:
+        """Test that DATABASE_POOL_RECYCLE_SECONDS=0 raises validation error."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError, match="must be -1 or at least 1"):
+            load_settings()
+
+    @patch.dict(os.environ, {"DATABASE_POOL_SIZE": "0"}, clear=True)
+    def test_load_settings_database_pool_size_zero_raises_validation_error(self) -> None:
+        """Test that DATABASE_POOL_SIZE=0 raises validation error."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            load_settings()
+
     @patch.dict(os.environ, {"REBUILD_LOCK_TTL_SECONDS": "0"}, clear=True)
     def test_load_settings_rebuild_lock_ttl_zero_raises_validation_error(self) -> None:
         """Test that REBUILD_LOCK_TTL_SECONDS=0 raises validation error."""